@@ -5,6 +5,7 @@ Tasks: 기관, 문서유형
 import os
 import sys
 import json
+import time
 import torch
 import numpy as np
 from typing import Dict
@@ -17,6 +18,11 @@ train_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(train_module)
 TwoTaskBertModel = train_module.TwoTaskBertModel
 
+TASKS = ['기관', '문서유형']
+
+# 한 번의 forward 에 넣을 문서 수
+BATCH_SIZE = int(os.environ.get("CLASSIFY_BATCH_SIZE", "16"))
+
 
 class TwoTaskPredictor:
     """학습된 2-Task 모델로 예측"""
@@ -82,61 +88,55 @@ class TwoTaskPredictor:
                 }
             }
         """
-        # 토크나이징
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=512
-        )
+        return self.predict_batch([text], return_probs=return_probs, batch_size=1)[0]
 
-        # GPU로 이동
+    def _forward_batch(self, features: list, return_probs: bool) -> list:
+        """토큰화된 문서 묶음을 패딩해 한 번에 추론 - softmax/top-k 까지 장치에서 계산"""
+        inputs = self.tokenizer.pad(features, padding=True, return_tensors="pt")
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
-        # 예측
         with torch.no_grad():
-            outputs = self.model(**inputs)
-            logits = outputs.logits
-
-        # 결과 파싱
-        result = {}
-
-        for task_name in ['기관', '문서유형']:
-            task_logits = logits[task_name].cpu().numpy()[0]
-
-            # 가장 높은 확률의 레이블
-            pred_id = int(np.argmax(task_logits))
-            pred_label = self.label_mappings[task_name]['id2label'][str(pred_id)]
-
-            result[task_name] = pred_label
-
-            # 확률값 계산
-            if return_probs:
-                probs = torch.softmax(torch.tensor(task_logits), dim=0).numpy()
+            logits = self.model(**inputs).logits
 
-                # 상위 5개 레이블과 확률
-                top_k = min(5, len(probs))
-                top_indices = np.argsort(probs)[-top_k:][::-1]
+            top = {}
+            for task_name in TASKS:
+                probs = torch.softmax(logits[task_name], dim=-1)
+                top_k = min(5 if return_probs else 1, probs.shape[-1])
+                values, indices = probs.topk(top_k, dim=-1)
+                top[task_name] = (values.cpu().tolist(), indices.cpu().tolist())
 
-                if 'probabilities' not in result:
-                    result['probabilities'] = {}
-
-                result['probabilities'][task_name] = {
-                    self.label_mappings[task_name]['id2label'][str(idx)]: float(probs[idx])
-                    for idx in top_indices
-                }
-
-        return result
-
-    def predict_batch(self, texts: list, return_probs: bool = False) -> list:
-        """여러 텍스트에 대한 배치 예측"""
         results = []
-        for text in texts:
-            result = self.predict(text, return_probs=return_probs)
+        for row in range(len(features)):
+            result = {}
+            for task_name in TASKS:
+                values, indices = top[task_name][0][row], top[task_name][1][row]
+                id2label = self.label_mappings[task_name]['id2label']
+                result[task_name] = id2label[str(indices[0])]
+                if return_probs:
+                    # 상위 5개 레이블과 확률
+                    result.setdefault('probabilities', {})[task_name] = {
+                        id2label[str(idx)]: float(prob) for idx, prob in zip(indices, values)
+                    }
             results.append(result)
         return results
 
+    def predict_batch(self, texts: list, return_probs: bool = False, batch_size: int = BATCH_SIZE) -> list:
+        """여러 텍스트에 대한 배치 예측 (한 번에 토큰화, 길이가 비슷한 문서끼리 패딩된 배치로 추론)"""
+        if not texts:
+            return []
+
+        batch_size = max(1, batch_size)
+        encodings = self.tokenizer(list(texts), truncation=True, max_length=512)
+        features = [{key: encodings[key][i] for key in encodings.keys()} for i in range(len(texts))]
+        order = sorted(range(len(texts)), key=lambda i: len(features[i]["input_ids"]))
+
+        results = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            chunk = order[start:start + batch_size]
+            for index, result in zip(chunk, self._forward_batch([features[i] for i in chunk], return_probs)):
+                results[index] = result
+        return results
+
 
 def main():
     """테스트 실행"""
@@ -171,7 +171,14 @@ def main():
     correct_문서유형 = 0
     total = min(50, len(test_data))
 
-    print(f"\n테스트 진행 중... (총 {total}개 샘플)")
+    print(f"\n테스트 진행 중... (총 {total}개 샘플, batch_size={BATCH_SIZE})")
+
+    # 전체 샘플을 배치로 예측하고 처리량 측정
+    start_time = time.perf_counter()
+    predictions = predictor.predict_batch([sample['text'] for sample in test_data[:total]],
+                                          return_probs=True, batch_size=BATCH_SIZE)
+    elapsed = time.perf_counter() - start_time
+    print(f"  처리량: {total / elapsed:.2f} docs/sec ({elapsed:.2f}초, {predictor.device})")
 
     # 오답 기록
     errors = []
@@ -182,7 +189,7 @@ def main():
         true_기관 = sample['기관']
         true_문서유형 = sample['문서유형']
 
-        result = predictor.predict(text, return_probs=True)
+        result = predictions[i]
 
         # 정답 체크
         기관_correct = result['기관'] == true_기관
@@ -207,10 +214,6 @@ def main():
                 'probs': result.get('probabilities', {})
             })
 
-        # 진행상황 표시 (10개마다)
-        if (i + 1) % 10 == 0:
-            print(f"  진행: {i + 1}/{total}...")
-
     # 정확도 출력
     print(f"\n" + "=" * 70)
     print(f"테스트 결과 (총 {total}개 샘플)")
@@ -0,0 +1,21 @@
+-- OCR_RESULTS 테이블에 내용 해시 기반 캐시 컬럼 추가
+
+-- PDF 내용의 SHA-256, OCR 설정 키, 캐시 재사용 시 원본 ocr_id
+ALTER TABLE ocr_results
+ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+ALTER TABLE ocr_results
+ADD COLUMN IF NOT EXISTS ocr_config VARCHAR(200);
+
+ALTER TABLE ocr_results
+ADD COLUMN IF NOT EXISTS cached_from INTEGER;
+
+-- 인덱스 추가 (캐시 조회)
+CREATE INDEX IF NOT EXISTS idx_ocr_results_content_hash ON ocr_results(content_hash, ocr_config);
+
+-- 확인
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'ocr_results'
+  AND column_name IN ('content_hash', 'ocr_config', 'cached_from')
+ORDER BY ordinal_position;
@@ -0,0 +1,29 @@
+-- OCR_RESULTS 페이지 텍스트를 OCR_PAGES 로 일원화
+
+-- 결과의 페이지 수 (page_data 를 저장하지 않으므로 별도 컬럼)
+ALTER TABLE ocr_results
+ADD COLUMN IF NOT EXISTS page_count INTEGER;
+
+-- 기존 결과의 페이지 수 채우기
+UPDATE ocr_results
+SET page_count = json_array_length(page_data::json)
+WHERE page_count IS NULL AND page_data IS NOT NULL AND page_data <> '';
+
+-- 모든 페이지가 ocr_pages 에 있는 기존 결과는 중복 저장된 텍스트 제거
+UPDATE ocr_results r
+SET full_text = NULL, page_data = NULL
+WHERE r.full_text IS NOT NULL
+  AND r.page_count > 0
+  AND r.page_count = (
+      SELECT COUNT(*)
+      FROM ocr_pages p
+      WHERE p.doc_id = r.doc_id
+        AND p.content_hash = r.content_hash
+        AND p.ocr_config = REPLACE(r.ocr_config, ':partial', '')
+  );
+
+-- 확인
+SELECT COUNT(*) AS results,
+       COUNT(full_text) AS with_full_text,
+       SUM(page_count) AS pages
+FROM ocr_results;
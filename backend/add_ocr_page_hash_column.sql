@@ -0,0 +1,14 @@
+-- OCR_PAGES 테이블에 페이지 내용 해시 컬럼 추가 (수정본 PDF 증분 OCR)
+
+-- 페이지 콘텐츠/리소스의 SHA-256 - 같은 경로의 새 버전에서 해시가 같은 페이지는 이전 텍스트 재사용
+ALTER TABLE ocr_pages
+ADD COLUMN IF NOT EXISTS page_hash VARCHAR(64);
+
+-- 인덱스 추가 (이전 버전 페이지 조회)
+CREATE INDEX IF NOT EXISTS idx_ocr_pages_page_hash ON ocr_pages(page_hash, ocr_config);
+
+-- 확인
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'ocr_pages'
+  AND column_name = 'page_hash';
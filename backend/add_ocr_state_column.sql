@@ -0,0 +1,20 @@
+-- PDF_DOCUMENTS 테이블에 OCR 범위 상태 컬럼 추가 (분류용 부분 OCR)
+
+-- PARTIAL: 분류에 필요한 앞쪽 페이지만 OCR 됨 (나머지는 백그라운드/요청 시 처리)
+-- FULL: 전체 페이지 OCR 완료
+ALTER TABLE pdf_documents
+ADD COLUMN IF NOT EXISTS ocr_state VARCHAR(20);
+
+-- OCR 된 페이지 수
+ALTER TABLE pdf_documents
+ADD COLUMN IF NOT EXISTS ocr_pages_done INTEGER;
+
+-- 기존 OCR 완료 문서는 전체 OCR 로 표시
+UPDATE pdf_documents
+SET ocr_state = 'FULL'
+WHERE ocr = TRUE AND ocr_state IS NULL;
+
+-- 확인
+SELECT ocr_state, COUNT(*)
+FROM pdf_documents
+GROUP BY ocr_state;
@@ -28,6 +28,28 @@ app.include_router(router)  # /api/* 경로
 app.include_router(auth_router)  # 인증 관련 경로 (prefix 없음)
 
 
+# ✅ 서버 종료 시 OCR 워커 풀 / 상주 분류 모델 정리
+@app.on_event("shutdown")
+def shutdown_workers():
+    try:
+        from ocr_pool import shutdown_ocr_pool
+        shutdown_ocr_pool()
+    except Exception as e:
+        print(f"⚠️ OCR 워커 풀 종료 실패: {e}")
+
+    try:
+        from classification_service import shutdown_resident_classifier
+        shutdown_resident_classifier()
+    except Exception as e:
+        print(f"⚠️ 분류 모델 언로드 실패: {e}")
+
+    try:
+        from custom_model_registry import shutdown_custom_model_registry
+        shutdown_custom_model_registry()
+    except Exception as e:
+        print(f"⚠️ 커스텀 모델 언로드 실패: {e}")
+
+
 # ✅ 메인 실행
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+문서 분류 배치 추론 벤치마크
+같은 문서 묶음을 batch_size 별로 분류해 처리량(docs/sec)을 비교 (batch_size=1 은 문서마다 forward 하던 기존 방식)
+--backends 로 fp32 / int8 / ONNX 백엔드(export_classifier.py 로 변환한 모델)의 처리량, 문서 1건 지연 시간,
+첫 번째 백엔드 대비 예측 일치율을 함께 비교
+
+입력은 학습 데이터 형식의 JSON ([{"text": ...}, ...]) 또는 텍스트 파일(.txt)이 들어 있는 폴더
+
+사용법:
+    python bench_classification.py multitask_training_data/test.json
+    python bench_classification.py texts/ --docs 128 --batch-sizes 1 8 16 32
+    python bench_classification.py texts/ --backends torch int8 onnx onnx-int8 --threads 4
+"""
+import sys
+import json
+import time
+import statistics
+import argparse
+from pathlib import Path
+
+import torch
+
+from classification_service import ClassificationService, CLASSIFY_BATCH_SIZE, CLASSIFY_BACKENDS, BACKEND_TORCH
+
+
+def load_texts(path: str, max_docs: int) -> list:
+    """JSON 파일 또는 .txt 폴더에서 문서 텍스트 수집"""
+    path = Path(path)
+    if path.is_dir():
+        texts = [p.read_text(encoding="utf-8") for p in sorted(path.glob("*.txt"))]
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            texts = [item["text"] if isinstance(item, dict) else str(item) for item in json.load(f)]
+    return [text for text in texts if text.strip()][:max_docs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 분류 배치 추론 벤치마크")
+    parser.add_argument("path", help="학습 데이터 형식 JSON 파일 또는 .txt 폴더")
+    parser.add_argument("--docs", type=int, default=64, help="분류할 최대 문서 수")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, CLASSIFY_BATCH_SIZE, 32],
+                        help="비교할 batch_size 목록")
+    parser.add_argument("--threads", type=int, default=None, help="CPU 추론 시 torch 연산 스레드 수")
+    parser.add_argument("--model-dir", default=None, help="모델 디렉토리 (기본: twotask_bert_model)")
+    parser.add_argument("--backends", nargs="+", choices=CLASSIFY_BACKENDS, default=[BACKEND_TORCH],
+                        help="비교할 추론 백엔드 (첫 번째가 예측 일치율 기준)")
+    parser.add_argument("--latency-runs", type=int, default=20, help="문서 1건 지연 시간 측정 횟수")
+    args = parser.parse_args()
+
+    texts = load_texts(args.path, args.docs)
+    if not texts:
+        print("❌ 분류할 문서가 없습니다")
+        sys.exit(1)
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    print("=" * 70)
+    print("📊 문서 분류 배치 추론 벤치마크")
+    print("=" * 70)
+    print(f"  문서: {len(texts)}개, 백엔드: {', '.join(args.backends)}, 스레드: {torch.get_num_threads()}")
+    print()
+
+    results, baseline = [], None
+    for backend in args.backends:
+        service = ClassificationService(args.model_dir, backend=backend)
+        service._ensure_loaded()
+        if service.model is None:
+            print(f"❌ 분류 모델을 로드할 수 없습니다 ({backend})")
+            continue
+
+        # 워밍업
+        service.predict_batch(texts[:2], batch_size=2)
+
+        # 문서 1건 지연 시간 (요청 하나를 바로 처리하는 경우)
+        latencies = []
+        for i in range(max(1, args.latency_runs)):
+            start_time = time.perf_counter()
+            service.predict(texts[i % len(texts)])
+            latencies.append((time.perf_counter() - start_time) * 1000)
+        latencies.sort()
+
+        for batch_size in sorted(set(args.batch_sizes)):
+            start_time = time.perf_counter()
+            predictions = service.predict_batch(texts, return_probs=True, batch_size=batch_size)
+            elapsed = time.perf_counter() - start_time
+
+            labels = [(p["기관"], p["문서유형"]) for p in predictions]
+            if baseline is None:
+                baseline = labels
+            results.append({
+                "backend": backend,
+                "device": service.device,
+                "batch_size": batch_size,
+                "seconds": elapsed,
+                "docs_per_sec": len(texts) / elapsed if elapsed > 0 else 0.0,
+                "p50_ms": statistics.median(latencies),
+                "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                # 패딩/백엔드가 달라도 예측이 같아야 함
+                "agreement": sum(a == b for a, b in zip(labels, baseline)) / len(labels),
+            })
+        service.cleanup()
+
+    if not results:
+        sys.exit(1)
+
+    print()
+    print(f"  {'백엔드':>10} {'batch_size':>10} {'시간(초)':>9} {'docs/sec':>9} {'속도 향상':>9} "
+          f"{'1건 p50':>8} {'1건 p95':>8} {'예측 일치':>9}")
+    print("-" * 90)
+    slowest = results[0]["docs_per_sec"] or 1.0
+    for result in results:
+        print(f"  {result['backend']:>10} {result['batch_size']:>10} {result['seconds']:>9.2f} "
+              f"{result['docs_per_sec']:>9.2f} {result['docs_per_sec'] / slowest:>8.1f}x "
+              f"{result['p50_ms']:>6.0f}ms {result['p95_ms']:>6.0f}ms {result['agreement']:>9.2%}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+OCR 엔진 벤치마크
+같은 페이지 이미지를 엔진별로 인식해 처리 속도(페이지/초)와 글자 정확도(1 - CER) 비교
+
+정답 텍스트는 --truth-dir 의 "<PDF 이름>_p<페이지>.txt" 파일을 우선 사용하고,
+없으면 PDF 텍스트 레이어가 정상인 페이지(디지털 PDF)의 텍스트 레이어를 정답으로 사용
+
+사용법:
+    python bench_ocr_engines.py ./uploads --pages 10
+    python bench_ocr_engines.py sample.pdf --engines PaddleOCRVL Tesseract --threads 4
+    python bench_ocr_engines.py scans/ --truth-dir scans/truth
+"""
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+from ocr_service import PDF_DPI, extract_text_layer, is_text_layer_usable, iter_ocr_page_images
+from ocr_engines import OCR_ENGINES, available_engines, create_engine
+from bench_rasterizers import collect_pdfs
+
+
+# 글자 비교에서 제외할 문자 (공백, PaddleOCR-VL 결과의 마크다운 기호)
+_IGNORED_CHARS = re.compile(r"[\s#*|>`]")
+
+
+def normalize_text(text: str) -> str:
+    return _IGNORED_CHARS.sub("", text or "")
+
+
+def edit_distance(reference: str, hypothesis: str) -> int:
+    """글자 단위 편집 거리 (Levenshtein)"""
+    if len(reference) < len(hypothesis):
+        reference, hypothesis = hypothesis, reference
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_char in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_char in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_char != hyp_char),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def character_error_rate(reference: str, hypothesis: str) -> float:
+    """CER = 편집 거리 / 정답 글자 수 (공백/마크다운 기호 제외)"""
+    reference, hypothesis = normalize_text(reference), normalize_text(hypothesis)
+    if not reference:
+        return None
+    return edit_distance(reference, hypothesis) / len(reference)
+
+
+def load_pages(pdfs: list, max_pages: int, dpi: int, truth_dir: str = None) -> list:
+    """벤치마크 대상 페이지 이미지와 정답 텍스트 준비 (모든 엔진이 같은 이미지를 사용)"""
+    pages = []
+    for pdf_path in pdfs:
+        text_layer = extract_text_layer(pdf_path) or []
+        for page_num, image, _ in iter_ocr_page_images(pdf_path, dpi=dpi):
+            if page_num > max_pages:
+                image.close()
+                break
+
+            reference = None
+            truth_file = Path(truth_dir) / f"{Path(pdf_path).stem}_p{page_num}.txt" if truth_dir else None
+            if truth_file is not None and truth_file.exists():
+                reference = truth_file.read_text(encoding="utf-8")
+            elif page_num <= len(text_layer) and is_text_layer_usable(text_layer[page_num - 1]):
+                reference = text_layer[page_num - 1]
+
+            pages.append({"pdf": pdf_path, "page": page_num, "image": image, "reference": reference})
+    return pages
+
+
+def run_engine(name: str, pages: list, cpu_threads: int = None) -> dict:
+    """엔진 하나로 전체 페이지 인식 (페이지당 한 장씩, 첫 페이지로 워밍업)"""
+    engine = create_engine(name, cpu_threads=cpu_threads)
+
+    start_time = time.perf_counter()
+    engine.load()
+    load_time = time.perf_counter() - start_time
+
+    try:
+        engine.recognize([pages[0]["image"]])
+
+        error_rates = []
+        start_time = time.perf_counter()
+        for page in pages:
+            text, _ = engine.recognize([page["image"]])[0]
+            if page["reference"] is not None:
+                cer = character_error_rate(page["reference"], text)
+                if cer is not None:
+                    error_rates.append(cer)
+        elapsed = time.perf_counter() - start_time
+    finally:
+        engine.unload()
+
+    mean_cer = sum(error_rates) / len(error_rates) if error_rates else None
+    return {
+        "engine": name,
+        "load_seconds": load_time,
+        "seconds": elapsed,
+        "pages_per_sec": len(pages) / elapsed if elapsed > 0 else 0.0,
+        "scored_pages": len(error_rates),
+        "cer": mean_cer,
+        "accuracy": max(0.0, 1 - mean_cer) if mean_cer is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 엔진 벤치마크 (처리 속도 / 글자 정확도)")
+    parser.add_argument("paths", nargs="+", help="PDF 파일 또는 PDF가 들어 있는 폴더")
+    parser.add_argument("--pages", type=int, default=10, help="문서당 최대 페이지 수")
+    parser.add_argument("--dpi", type=int, default=PDF_DPI, help="렌더링 DPI")
+    parser.add_argument("--engines", nargs="+", choices=list(OCR_ENGINES), help="비교할 엔진 (기본: 사용 가능한 전체)")
+    parser.add_argument("--threads", type=int, default=None, help="CPU 추론 시 엔진당 연산 스레드 수")
+    parser.add_argument("--truth-dir", default=None, help="정답 텍스트 폴더 (<PDF 이름>_p<페이지>.txt)")
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.paths)
+    if not pdfs:
+        print("❌ PDF 파일을 찾을 수 없습니다")
+        sys.exit(1)
+
+    engines = [name for name in (args.engines or list(OCR_ENGINES)) if name in available_engines()]
+    skipped = [name for name in (args.engines or list(OCR_ENGINES)) if name not in engines]
+    if not engines:
+        print("❌ 사용 가능한 OCR 엔진이 없습니다")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("📊 OCR 엔진 벤치마크")
+    print("=" * 70)
+
+    pages = load_pages(pdfs, args.pages, args.dpi, args.truth_dir)
+    if not pages:
+        print("❌ 렌더링된 페이지가 없습니다")
+        sys.exit(1)
+    scored = sum(1 for page in pages if page["reference"] is not None)
+    print(f"  문서: {len(pdfs)}개, 페이지: {len(pages)}장 ({args.dpi} DPI), 정답 있는 페이지: {scored}장")
+    for name in skipped:
+        print(f"⚠️  {name}: 이 환경에서 사용할 수 없어 건너뜁니다")
+    print()
+
+    results = []
+    try:
+        for name in engines:
+            print(f"  {name} 측정 중...")
+            results.append(run_engine(name, pages, args.threads))
+    finally:
+        for page in pages:
+            page["image"].close()
+
+    print()
+    print(f"  {'엔진':<14} {'로드(초)':>8} {'페이지/초':>9} {'CER':>8} {'정확도':>8} {'채점 페이지':>10}")
+    print("-" * 70)
+    for result in results:
+        cer = f"{result['cer']:8.2%}" if result["cer"] is not None else "     n/a"
+        accuracy = f"{result['accuracy']:8.2%}" if result["accuracy"] is not None else "     n/a"
+        print(f"  {result['engine']:<14} {result['load_seconds']:>8.2f} {result['pages_per_sec']:>9.2f} "
+              f"{cer} {accuracy} {result['scored_pages']:>10}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+OCR 입력 전달 방식 벤치마크
+임시 PNG 파일 방식과 메모리 배열 방식의 페이지당 소요 시간 비교
+
+사용법:
+    python bench_ocr_handoff.py sample.pdf --pages 10
+    python bench_ocr_handoff.py sample.pdf --pages 10 --predict   # 실제 OCR 추론까지 포함
+"""
+import os
+import sys
+import time
+import argparse
+from tempfile import NamedTemporaryFile
+
+import numpy as np
+from PIL import Image
+
+from ocr_service import PDF_DPI, iter_pdf_pages
+from ocr_engines import PADDLEOCR_AVAILABLE, PaddleOCRVLEngine, image_to_array
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+def handoff_via_file(image):
+    """기존 방식: PNG 인코딩 → 디스크 쓰기 → 파이프라인이 다시 읽어 디코딩"""
+    with NamedTemporaryFile(delete=False, suffix=".png") as tmp_img:
+        image.save(tmp_img.name)
+        temp_img_path = tmp_img.name
+    try:
+        if cv2 is not None:
+            return cv2.imread(temp_img_path)
+        with Image.open(temp_img_path) as loaded:
+            return np.asarray(loaded.convert("RGB"))[:, :, ::-1]
+    finally:
+        os.remove(temp_img_path)
+
+
+def time_per_page(func, images) -> float:
+    """이미지 목록에 대한 페이지당 평균 시간(ms)"""
+    start_time = time.perf_counter()
+    for image in images:
+        func(image)
+    return (time.perf_counter() - start_time) / len(images) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 입력 전달 방식 벤치마크")
+    parser.add_argument("pdf_path", help="벤치마크에 사용할 PDF 파일")
+    parser.add_argument("--pages", type=int, default=10, help="사용할 최대 페이지 수")
+    parser.add_argument("--dpi", type=int, default=PDF_DPI, help="렌더링 DPI")
+    parser.add_argument("--predict", action="store_true", help="실제 OCR 추론 시간까지 측정")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 OCR 입력 전달 방식 벤치마크")
+    print("=" * 60)
+
+    images = []
+    for page_num, image in iter_pdf_pages(args.pdf_path, dpi=args.dpi):
+        images.append(image)
+        if page_num >= args.pages:
+            break
+
+    if not images:
+        print("❌ 렌더링된 페이지가 없습니다")
+        sys.exit(1)
+
+    width, height = images[0].size
+    print(f"  파일: {args.pdf_path}")
+    print(f"  페이지: {len(images)}장 ({width}x{height}, {args.dpi} DPI)")
+    print()
+
+    # 1. 입력 준비 비용만 비교
+    file_ms = time_per_page(handoff_via_file, images)
+    array_ms = time_per_page(image_to_array, images)
+
+    print("1️⃣ 입력 준비 (페이지당)")
+    print("-" * 60)
+    print(f"  임시 PNG 파일: {file_ms:8.2f} ms")
+    print(f"  메모리 배열:   {array_ms:8.2f} ms")
+    print(f"  절감:          {file_ms - array_ms:8.2f} ms ({(1 - array_ms / file_ms):.1%})")
+    print()
+
+    # 2. 실제 추론 포함 비교
+    if args.predict:
+        if not PADDLEOCR_AVAILABLE:
+            print("⚠️  PaddleOCR를 사용할 수 없어 추론 벤치마크를 건너뜁니다")
+            return
+
+        ocr = PaddleOCRVLEngine()
+        ocr.load()
+        try:
+            # 첫 추론의 워밍업 비용 제외
+            ocr._predict_images(images[:1])
+
+            predict_file_ms = time_per_page(lambda image: ocr._predict_files([image]), images)
+            predict_array_ms = time_per_page(lambda image: ocr._predict_images([image]), images)
+        finally:
+            ocr.unload()
+
+        print("2️⃣ 추론 포함 (페이지당)")
+        print("-" * 60)
+        print(f"  임시 PNG 파일: {predict_file_ms:8.2f} ms")
+        print(f"  메모리 배열:   {predict_array_ms:8.2f} ms")
+        print(f"  절감:          {predict_file_ms - predict_array_ms:8.2f} ms")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PDF 렌더링 백엔드 벤치마크
+로컬 PDF 묶음을 백엔드별로 렌더링해 초당 페이지 수와 최대 메모리(RSS) 비교
+
+백엔드마다 별도 프로세스에서 실행하므로 메모리 측정이 서로 섞이지 않음
+(poppler 는 pdftoppm 자식 프로세스의 최대 RSS 도 함께 표시)
+
+사용법:
+    python bench_rasterizers.py ./uploads --pages 20
+    python bench_rasterizers.py a.pdf b.pdf --dpi 150 --backends poppler pdfium
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from pathlib import Path
+
+from ocr_service import PDF_DPI
+from rasterizers import RASTERIZERS, available_rasterizers, get_rasterizer
+
+try:
+    import resource
+except ImportError:
+    # Windows 에는 resource 모듈이 없어 메모리는 측정하지 않음
+    resource = None
+
+
+def collect_pdfs(paths: list) -> list:
+    """파일/폴더 목록에서 PDF 파일 경로 수집"""
+    pdfs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            pdfs.extend(sorted(str(p) for p in path.rglob("*.pdf")))
+        elif path.suffix.lower() == ".pdf":
+            pdfs.append(str(path))
+    return pdfs
+
+
+def peak_rss_mb(who) -> float:
+    """최대 RSS(MB) - Linux 는 KB, macOS 는 바이트 단위로 보고"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_worker(backend: str, pdfs: list, dpi: int, max_pages: int) -> dict:
+    """현재 프로세스에서 한 백엔드로 전체 PDF 렌더링 (페이지마다 한 장씩, 실제 OCR 경로와 동일)"""
+    rasterizer = get_rasterizer(backend)
+    pages = 0
+    failed = []
+
+    start_time = time.perf_counter()
+    for pdf_path in pdfs:
+        try:
+            page_count = min(rasterizer.page_count(pdf_path), max_pages)
+            for page_num in range(1, page_count + 1):
+                for image in rasterizer.render(pdf_path, page_num, page_num, dpi):
+                    image.close()
+                pages += 1
+        except Exception as e:
+            failed.append(f"{pdf_path}: {e}")
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "backend": rasterizer.name,
+        "pages": pages,
+        "seconds": elapsed,
+        "pages_per_sec": pages / elapsed if elapsed > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        "peak_child_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+        "failed": failed,
+    }
+
+
+def run_in_subprocess(backend: str, pdfs: list, dpi: int, max_pages: int) -> dict:
+    """백엔드 하나를 새 프로세스에서 실행하고 결과 JSON 수신"""
+    command = [sys.executable, os.path.abspath(__file__), "--worker", backend,
+               "--dpi", str(dpi), "--pages", str(max_pages), *pdfs]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {"backend": backend, "error": completed.stderr.strip().splitlines()[-1:] or ["실패"]}
+    # 마지막 줄이 결과 JSON (그 앞은 백엔드가 출력한 로그)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def format_mb(value) -> str:
+    return f"{value:8.1f}" if value is not None else "     n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 렌더링 백엔드 벤치마크")
+    parser.add_argument("paths", nargs="+", help="PDF 파일 또는 PDF가 들어 있는 폴더")
+    parser.add_argument("--dpi", type=int, default=PDF_DPI, help="렌더링 DPI")
+    parser.add_argument("--pages", type=int, default=50, help="문서당 최대 페이지 수")
+    parser.add_argument("--backends", nargs="+", choices=list(RASTERIZERS), help="비교할 백엔드 (기본: 사용 가능한 전체)")
+    parser.add_argument("--worker", choices=list(RASTERIZERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.paths)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, pdfs, args.dpi, args.pages), ensure_ascii=False))
+        return
+
+    if not pdfs:
+        print("❌ PDF 파일을 찾을 수 없습니다")
+        sys.exit(1)
+
+    backends = args.backends or available_rasterizers()
+    if not backends:
+        print("❌ 사용 가능한 렌더링 백엔드가 없습니다 (pdf2image 또는 pypdfium2 필요)")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("📊 PDF 렌더링 백엔드 벤치마크")
+    print("=" * 70)
+    print(f"  문서: {len(pdfs)}개 (문서당 최대 {args.pages}페이지, {args.dpi} DPI)")
+    print()
+
+    results = []
+    for backend in backends:
+        if not RASTERIZERS[backend].is_available():
+            print(f"⚠️  {backend}: 설치되어 있지 않아 건너뜁니다")
+            continue
+        print(f"  {backend} 측정 중...")
+        results.append(run_in_subprocess(backend, pdfs, args.dpi, args.pages))
+
+    print()
+    print(f"  {'백엔드':<10} {'페이지':>6} {'시간(초)':>9} {'페이지/초':>9} {'RSS(MB)':>8} {'자식 RSS':>8}")
+    print("-" * 70)
+    for result in results:
+        if "error" in result:
+            print(f"  {result['backend']:<10} 실패: {' '.join(result['error'])}")
+            continue
+        print(f"  {result['backend']:<10} {result['pages']:>6} {result['seconds']:>9.2f} "
+              f"{result['pages_per_sec']:>9.2f} {format_mb(result['peak_rss_mb'])} "
+              f"{format_mb(result['peak_child_rss_mb'])}")
+        for failure in result["failed"]:
+            print(f"    ⚠️ {failure}")
+
+    measured = [r for r in results if "error" not in r and r["pages"]]
+    if measured:
+        fastest = max(measured, key=lambda r: r["pages_per_sec"])
+        print()
+        print(f"  ✓ 가장 빠른 백엔드: {fastest['backend']} ({fastest['pages_per_sec']:.2f} 페이지/초)")
+        print(f"    사용하려면 OCR_RASTERIZER={fastest['backend']} 로 설정")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+분류 요청 마이크로 배치
+짧은 시간(window) 안에 들어온 /classify/document 요청을 모아 패딩된 배치 한 번으로 추론하고
+각 요청의 future 에 결과를 돌려줌 - 배치가 추론 중인 동안 들어온 요청은 다음 배치로 모임
+"""
+import os
+import time
+import asyncio
+import threading
+
+from starlette.concurrency import run_in_threadpool
+
+
+# 첫 요청 이후 같은 배치로 묶을 요청을 기다리는 시간(ms)
+CLASSIFY_BATCH_WINDOW_MS = float(os.environ.get("CLASSIFY_BATCH_WINDOW_MS", "15"))
+
+# 한 배치의 최대 요청 수 (차면 window 를 기다리지 않고 바로 추론)
+CLASSIFY_MAX_BATCH = int(os.environ.get("CLASSIFY_MAX_BATCH", "16"))
+
+
+class ClassificationBatcher:
+    """asyncio 마이크로 배처 - 요청은 이벤트 루프에서 모으고 추론은 스레드에서 실행"""
+
+    def __init__(self, classifier, window_ms: float = CLASSIFY_BATCH_WINDOW_MS,
+                 max_batch: int = CLASSIFY_MAX_BATCH):
+        """
+        Args:
+            classifier: predict_batch(texts, return_probs, batch_size, return_embeddings) 를 제공하는 분류기
+            window_ms: 배치를 모으는 시간(ms)
+            max_batch: 배치당 최대 요청 수
+        """
+        self.classifier = classifier
+        self.window = max(0.0, window_ms) / 1000
+        self.max_batch = max(1, max_batch)
+        self._queue = None
+        self._loop = None
+        self._worker = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "max_batch_size": 0,
+            "total_wait_time": 0.0,
+            "total_batch_time": 0.0,
+            "batch_sizes": {},
+        }
+
+    def _ensure_worker(self):
+        """현재 이벤트 루프에 큐/배치 작업 생성 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, text: str, return_probs: bool = False, return_embeddings: bool = False) -> dict:
+        """문서 하나 분류 요청 - 같은 배치의 추론이 끝나면 결과 반환"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, return_probs, return_embeddings, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> list:
+        """첫 요청을 받은 뒤 window 동안 (또는 max_batch 가 찰 때까지) 요청 수집"""
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.window
+        while len(batch) < self.max_batch:
+            # 이미 큐에 쌓인 요청은 기다리지 않고 가져감
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            # 취소된 요청(클라이언트 연결 종료 등)은 제외
+            batch = [item for item in batch if not item[3].done()]
+            if batch:
+                await self._process(batch)
+
+    async def _process(self, batch: list):
+        texts = [item[0] for item in batch]
+        return_probs = any(item[1] for item in batch)
+        return_embeddings = any(item[2] for item in batch)
+        start_time = time.perf_counter()
+
+        try:
+            results = await run_in_threadpool(
+                self.classifier.predict_batch, texts, return_probs, len(texts), return_embeddings
+            )
+        except Exception as e:
+            with self._lock:
+                self._stats["failed_batches"] += 1
+            for _, _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        finished = time.perf_counter()
+        for (_, wants_probs, wants_embedding, future, _), result in zip(batch, results):
+            # 요청하지 않은 항목은 같은 배치의 다른 요청 때문에 계산된 것이므로 제외
+            excluded = {key for key, wanted in (("probabilities", wants_probs), ("embedding", wants_embedding))
+                        if not wanted}
+            if excluded & result.keys():
+                result = {k: v for k, v in result.items() if k not in excluded}
+            if not future.done():
+                future.set_result(result)
+
+        with self._lock:
+            size = len(batch)
+            self._stats["requests"] += size
+            self._stats["batches"] += 1
+            self._stats["max_batch_size"] = max(self._stats["max_batch_size"], size)
+            self._stats["total_wait_time"] += sum(start_time - item[4] for item in batch)
+            self._stats["total_batch_time"] += finished - start_time
+            self._stats["batch_sizes"][size] = self._stats["batch_sizes"].get(size, 0) + 1
+        if size > 1:
+            print(f"📦 분류 요청 {size}건을 배치 하나로 처리 ({(finished - start_time) * 1000:.0f}ms)")
+
+    def status(self) -> dict:
+        """배치 설정과 실제로 묶인 배치 크기 통계"""
+        with self._lock:
+            requests = self._stats["requests"]
+            batches = self._stats["batches"]
+            return {
+                "window_ms": self.window * 1000,
+                "max_batch": self.max_batch,
+                "pending": self._queue.qsize() if self._queue is not None else 0,
+                "requests": requests,
+                "batches": batches,
+                "failed_batches": self._stats["failed_batches"],
+                "avg_batch_size": round(requests / batches, 2) if batches else None,
+                "max_batch_size": self._stats["max_batch_size"],
+                "batch_size_histogram": dict(sorted(self._stats["batch_sizes"].items())),
+                "avg_wait_ms": round(self._stats["total_wait_time"] / requests * 1000, 1) if requests else None,
+                "avg_batch_ms": round(self._stats["total_batch_time"] / batches * 1000, 1) if batches else None,
+            }
+
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_classification_batcher() -> ClassificationBatcher:
+    """프로세스 전역 분류 배처 반환 (상주 분류 모델 사용)"""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            from classification_service import get_resident_classifier
+            _batcher = ClassificationBatcher(get_resident_classifier())
+        return _batcher
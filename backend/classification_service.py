@@ -5,11 +5,16 @@
 import os
 import json
 import gc
+import time
+import threading
 import torch
 import torch.nn as nn
 import numpy as np
+from types import SimpleNamespace
 from typing import Dict
 
+from embedding_store import encoder_fingerprint
+
 try:
     from transformers import AutoTokenizer, AutoConfig, AutoModel
 
@@ -57,24 +62,96 @@ except Exception as e:
     TwoTaskBertModel = None
     print(f"⚠️ BERT model not available: {e}")
 
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ort = None
+    ONNX_AVAILABLE = False
+
+
+# 분류 태스크 (모델 헤드 이름)
+TASKS = ['기관', '문서유형']
+
+# 한 번의 forward 에 넣을 문서 수
+CLASSIFY_BATCH_SIZE = int(os.environ.get("CLASSIFY_BATCH_SIZE", "16"))
+
+# 토크나이저 최대 길이 / 확률을 반환할 상위 레이블 수
+CLASSIFY_MAX_LENGTH = 512
+CLASSIFY_TOP_K = 5
+
+# 추론 백엔드 (int8 / onnx 계열은 export_classifier.py 로 만든 파일을 사용하고 CPU에서 실행)
+#   "torch":     fp32 PyTorch (model.pt)
+#   "int8":      PyTorch 동적 int8 양자화 (model_int8.pt, 없으면 로드 시 model.pt 를 양자화)
+#   "onnx":      ONNX Runtime fp32 (model.onnx)
+#   "onnx-int8": ONNX Runtime 동적 int8 양자화 (model_int8.onnx)
+BACKEND_TORCH = "torch"
+BACKEND_INT8 = "int8"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+CLASSIFY_BACKENDS = (BACKEND_TORCH, BACKEND_INT8, BACKEND_ONNX, BACKEND_ONNX_INT8)
+CLASSIFY_BACKEND = os.environ.get("CLASSIFY_BACKEND", BACKEND_TORCH)
+
+INT8_MODEL_FILE = "model_int8.pt"
+ONNX_MODEL_FILES = {BACKEND_ONNX: "model.onnx", BACKEND_ONNX_INT8: "model_int8.onnx"}
+# ONNX 그래프 출력 이름 (TASKS 순서)
+ONNX_OUTPUT_NAMES = [f"logits_{i}" for i in range(len(TASKS))]
+
+# 상주 분류 모델: 유휴 상태가 이 시간(초) 이상 지속되면 언로드 (0이면 언로드하지 않음)
+CLASSIFIER_IDLE_TIMEOUT = float(os.environ.get("CLASSIFIER_IDLE_TIMEOUT", "600"))
+
+
+def quantize_int8(model):
+    """Linear 레이어를 동적 int8 로 양자화 (CPU 전용)"""
+    return torch.ao.quantization.quantize_dynamic(model.cpu().eval(), {nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxTwoTaskModel:
+    """ONNX Runtime 세션을 TwoTaskBertModel 처럼 호출하는 어댑터 - logits 는 태스크별 torch 텐서"""
+
+    def __init__(self, onnx_path: str):
+        if not ONNX_AVAILABLE:
+            raise RuntimeError("onnxruntime 이 설치되어 있지 않습니다")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # PyTorch 백엔드와 같은 연산 스레드 수 사용
+        options.intra_op_num_threads = torch.get_num_threads()
+        self.session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+    def __call__(self, **inputs):
+        feed = {name: inputs[name].cpu().numpy().astype(np.int64) for name in self.input_names}
+        outputs = self.session.run(ONNX_OUTPUT_NAMES, feed)
+        return SimpleNamespace(logits={task: torch.from_numpy(out) for task, out in zip(TASKS, outputs)})
+
 
 class ClassificationService:
     """문서 분류 서비스 - Lazy loading으로 VRAM 효율적 사용"""
 
-    def __init__(self, model_dir: str = None):
+    def __init__(self, model_dir: str = None, backend: str = None):
         """
         Args:
             model_dir: 학습된 모델이 저장된 디렉토리
+            backend: 추론 백엔드 (기본값 CLASSIFY_BACKEND)
         """
         if model_dir is None:
             model_dir = os.path.join(os.path.dirname(__file__), "twotask_bert_model")
 
+        backend = backend or CLASSIFY_BACKEND
+        if backend not in CLASSIFY_BACKENDS:
+            raise ValueError(f"알 수 없는 분류 백엔드: {backend} (지원: {', '.join(CLASSIFY_BACKENDS)})")
+
         self.model_dir = model_dir
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.backend = backend
+        # 양자화 / ONNX 백엔드는 CPU 추론용
+        self.device = "cuda" if backend == BACKEND_TORCH and torch.cuda.is_available() else "cpu"
         self.model = None
         self.tokenizer = None
         self.label_mappings = None
         self._is_loaded = False
+        # 마지막 배치 예측의 처리량
+        self.last_batch_stats = None
 
     def __enter__(self):
         """Context manager 진입"""
@@ -103,23 +180,31 @@ class ClassificationService:
             print(f"Loading tokenizer from {self.model_dir}...")
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
 
-            # 모델 로드
-            print(f"Loading 2-Task model from {self.model_dir}...")
-            config = AutoConfig.from_pretrained(model_config['model_name'])
-            self.model = TwoTaskBertModel(
-                config=config,
-                model_name=model_config['model_name'],
-                num_labels_dict=model_config['num_labels']
-            )
-
-            # 모델 가중치 로드
-            model_path = os.path.join(self.model_dir, "model.pt")
-            self.model.load_state_dict(torch.load(model_path, map_location=self.device))
-
-            self.model.to(self.device)
-            self.model.eval()
-
-            print(f"✓ 2-Task Model loaded successfully on {self.device}")
+            if self.backend in ONNX_MODEL_FILES:
+                onnx_path = os.path.join(self.model_dir, ONNX_MODEL_FILES[self.backend])
+                print(f"Loading 2-Task ONNX model from {onnx_path}...")
+                self.model = OnnxTwoTaskModel(onnx_path)
+            else:
+                # 모델 로드
+                print(f"Loading 2-Task model from {self.model_dir}...")
+                self.model = self.build_model(model_config)
+
+                # 모델 가중치 로드
+                int8_path = os.path.join(self.model_dir, INT8_MODEL_FILE)
+                if self.backend == BACKEND_INT8 and os.path.exists(int8_path):
+                    self.model = quantize_int8(self.model)
+                    self.model.load_state_dict(torch.load(int8_path, map_location="cpu"))
+                else:
+                    model_path = os.path.join(self.model_dir, "model.pt")
+                    self.model.load_state_dict(torch.load(model_path, map_location=self.device))
+                    if self.backend == BACKEND_INT8:
+                        print(f"⚠️ {INT8_MODEL_FILE} 없음 - fp32 가중치를 로드 시 양자화")
+                        self.model = quantize_int8(self.model)
+
+                self.model.to(self.device)
+                self.model.eval()
+
+            print(f"✓ 2-Task Model loaded successfully on {self.device} ({self.backend})")
             print(f"  Tasks: 기관 ({self.label_mappings['기관']['num_labels']} labels), "
                   f"문서유형 ({self.label_mappings['문서유형']['num_labels']} labels)")
 
@@ -127,6 +212,16 @@ class ClassificationService:
             print(f"❌ Failed to load model: {e}")
             self.model = None
 
+    @staticmethod
+    def build_model(model_config: dict):
+        """학습 설정(config.json)으로 TwoTaskBertModel 생성 - 학습된 가중치는 호출한 쪽에서 로드"""
+        config = AutoConfig.from_pretrained(model_config['model_name'])
+        return TwoTaskBertModel(
+            config=config,
+            model_name=model_config['model_name'],
+            num_labels_dict=model_config['num_labels']
+        )
+
     def _ensure_loaded(self):
         """모델이 로드되지 않았으면 로드"""
         if not self._is_loaded and BERT_AVAILABLE and TwoTaskBertModel:
@@ -180,72 +275,155 @@ class ClassificationService:
                 }
             }
         """
-        # 모델이 로드되지 않았으면 로드
-        self._ensure_loaded()
+        return self.predict_batch([text], return_probs=return_probs, batch_size=1)[0]
+
+    @staticmethod
+    def _unavailable_result() -> Dict:
+        return {
+            "기관": "Unknown",
+            "문서유형": "Unknown",
+            "confidence": {"기관": 0.0, "문서유형": 0.0},
+            "error": "Model not available"
+        }
+
+    @property
+    def encoder_key(self):
+        """저장된 문서 임베딩을 함께 쓸 수 있는 인코더 식별자 (ONNX 백엔드는 임베딩을 내지 않으므로 None)"""
+        if self.backend in ONNX_MODEL_FILES:
+            return None
+        # 인코더(bert.*) 가중치만 해시 - 분류 헤드만 바뀐 모델은 같은 키
+        # int8 은 model.pt 를 동적 양자화한 것이므로 fp32 인코더 가중치 + 백엔드 구분으로 식별
+        return encoder_fingerprint(os.path.join(self.model_dir, "model.pt"), self.backend)
+
+    def _results_from_logits(self, logits: dict, return_probs: bool) -> list:
+        """태스크별 로짓 → 예측 결과 - softmax/top-k 까지 장치에서 계산"""
+        # 태스크별 상위 k개 확률/레이블 ID (1위가 예측값) - CPU로는 결과만 한 번 복사
+        top = {}
+        for task_name in TASKS:
+            probs = torch.softmax(logits[task_name], dim=-1)
+            top_k = min(CLASSIFY_TOP_K if return_probs else 1, probs.shape[-1])
+            values, indices = probs.topk(top_k, dim=-1)
+            top[task_name] = (values.cpu().tolist(), indices.cpu().tolist())
 
-        if not BERT_AVAILABLE or self.model is None:
-            return {
-                "기관": "Unknown",
-                "문서유형": "Unknown",
-                "confidence": {"기관": 0.0, "문서유형": 0.0},
-                "error": "Model not available"
-            }
+        results = []
+        for row in range(len(top[TASKS[0]][0])):
+            result = {"confidence": {}}
+            for task_name in TASKS:
+                values, indices = top[task_name][0][row], top[task_name][1][row]
+                id2label = self.label_mappings[task_name]['id2label']
+                result[task_name] = id2label[str(indices[0])]
+                result["confidence"][task_name] = float(values[0])
+                if return_probs:
+                    result.setdefault('probabilities', {})[task_name] = {
+                        id2label[str(idx)]: float(prob) for idx, prob in zip(indices, values)
+                    }
+            results.append(result)
+        return results
 
-        # 토크나이징
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=512
-        )
+    def _forward_batch(self, features: list, return_probs: bool, return_embeddings: bool = False) -> list:
+        """토큰화된 문서 묶음을 패딩해 한 번에 추론
 
-        # GPU로 이동
+        return_embeddings 이면 결과마다 분류 헤드 입력([CLS] 벡터)을 "embedding" (float32 ndarray) 으로 포함
+        """
+        inputs = self.tokenizer.pad(features, padding=True, return_tensors="pt")
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
-        # 예측
         with torch.no_grad():
-            outputs = self.model(**inputs)
-            logits = outputs.logits
+            if isinstance(self.model, OnnxTwoTaskModel):
+                return self._results_from_logits(self.model(**inputs).logits, return_probs)
+
+            # TwoTaskBertModel.forward 와 같은 계산을 인코더 / 헤드로 나눠 실행
+            pooled_output = self.model.bert(**inputs).last_hidden_state[:, 0, :]
+            logits = {task: classifier(pooled_output) for task, classifier in self.model.classifiers.items()}
+            results = self._results_from_logits(logits, return_probs)
+
+        if return_embeddings:
+            embeddings = pooled_output.float().cpu().numpy()
+            for result, embedding in zip(results, embeddings):
+                result["embedding"] = embedding
+        return results
 
-        # 결과 파싱
-        result = {"confidence": {}}
+    def classify_embeddings(self, embeddings, return_probs: bool = False) -> list:
+        """저장된 문서 임베딩에 분류 헤드만 적용 (인코더 실행 없음)
 
-        for task_name in ['기관', '문서유형']:
-            task_logits = logits[task_name].cpu().numpy()[0]
+        Args:
+            embeddings: (문서 수, hidden) float32 배열 - 같은 encoder_key 로 저장된 임베딩
 
-            # 가장 높은 확률의 레이블
-            pred_id = int(np.argmax(task_logits))
-            pred_label = self.label_mappings[task_name]['id2label'][str(pred_id)]
+        Returns:
+            list[dict]: predict() 와 같은 형식의 결과
+        """
+        self._ensure_loaded()
 
-            result[task_name] = pred_label
+        if not BERT_AVAILABLE or self.model is None or isinstance(self.model, OnnxTwoTaskModel):
+            return [self._unavailable_result() for _ in embeddings]
+        if len(embeddings) == 0:
+            return []
 
-            # 확률값 계산
-            probs = torch.softmax(torch.tensor(task_logits), dim=0).numpy()
-            result["confidence"][task_name] = float(probs[pred_id])
+        start_time = time.perf_counter()
+        pooled_output = torch.from_numpy(np.asarray(embeddings, dtype=np.float32)).to(self.device)
+        with torch.no_grad():
+            logits = {task: classifier(pooled_output) for task, classifier in self.model.classifiers.items()}
+            results = self._results_from_logits(logits, return_probs)
 
-            if return_probs:
-                # 상위 5개 레이블과 확률
-                top_k = min(5, len(probs))
-                top_indices = np.argsort(probs)[-top_k:][::-1]
+        elapsed = time.perf_counter() - start_time
+        if len(results) > 1:
+            print(f"📊 임베딩 분류: {len(results)}건, {elapsed * 1000:.0f}ms ({self.device}, {self.backend})")
+        return results
 
-                if 'probabilities' not in result:
-                    result['probabilities'] = {}
+    def predict_batch(self, texts: list, return_probs: bool = False, batch_size: int = None,
+                      return_embeddings: bool = False) -> list:
+        """여러 텍스트에 대한 배치 예측
 
-                result['probabilities'][task_name] = {
-                    self.label_mappings[task_name]['id2label'][str(idx)]: float(probs[idx])
-                    for idx in top_indices
-                }
+        전체 텍스트를 토크나이저 한 번으로 토큰화하고, 길이가 비슷한 문서끼리 batch_size 개씩 묶어
+        패딩된 배치로 추론 (패딩 낭비 최소화)
 
-        return result
+        Args:
+            texts: 입력 텍스트 목록
+            return_probs: 확률값도 반환할지 여부
+            batch_size: 한 번의 forward 에 넣을 문서 수 (기본값 CLASSIFY_BATCH_SIZE)
+            return_embeddings: 결과에 문서 임베딩("embedding")도 포함할지 여부 (ONNX 백엔드는 미지원)
 
-    def predict_batch(self, texts: list, return_probs: bool = False) -> list:
-        """여러 텍스트에 대한 배치 예측"""
+        Returns:
+            list[dict]: 입력 순서대로 predict() 와 같은 형식의 결과
+        """
+        # 모델이 로드되지 않았으면 로드
         self._ensure_loaded()
-        results = []
-        for text in texts:
-            result = self.predict(text, return_probs=return_probs)
-            results.append(result)
+
+        if not BERT_AVAILABLE or self.model is None:
+            return [self._unavailable_result() for _ in texts]
+        if not texts:
+            return []
+
+        batch_size = max(1, batch_size or CLASSIFY_BATCH_SIZE)
+        start_time = time.perf_counter()
+
+        # 토크나이징 (패딩은 배치마다)
+        encodings = self.tokenizer(list(texts), truncation=True, max_length=CLASSIFY_MAX_LENGTH)
+        features = [
+            {key: encodings[key][i] for key in encodings.keys()}
+            for i in range(len(texts))
+        ]
+        order = sorted(range(len(texts)), key=lambda i: len(features[i]["input_ids"]))
+
+        results = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            chunk = order[start:start + batch_size]
+            chunk_results = self._forward_batch([features[i] for i in chunk], return_probs, return_embeddings)
+            for index, result in zip(chunk, chunk_results):
+                results[index] = result
+
+        elapsed = time.perf_counter() - start_time
+        self.last_batch_stats = {
+            "documents": len(texts),
+            "batch_size": batch_size,
+            "batches": (len(texts) + batch_size - 1) // batch_size,
+            "seconds": round(elapsed, 4),
+            "docs_per_sec": round(len(texts) / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+        if len(texts) > 1:
+            print(f"📊 배치 분류: {len(texts)}건, {elapsed:.2f}초 "
+                  f"({self.last_batch_stats['docs_per_sec']} docs/sec, batch_size={batch_size}, "
+                  f"{self.device}, {self.backend})")
         return results
 
 
@@ -253,3 +431,190 @@ class ClassificationService:
 def get_classification_service():
     """ClassificationService 인스턴스를 반환 (context manager 사용 권장)"""
     return ClassificationService()
+
+
+class ResidentClassifier:
+    """프로세스에 상주하는 분류 모델 - 한 번 로드해 모든 요청이 공유하고, 유휴 시간 초과 시 언로드"""
+
+    def __init__(self, model_dir: str = None, idle_timeout: float = CLASSIFIER_IDLE_TIMEOUT):
+        """
+        Args:
+            model_dir: 학습된 모델이 저장된 디렉토리
+            idle_timeout: 유휴 언로드까지의 시간(초), 0 이하이면 언로드하지 않음
+        """
+        self.model_dir = model_dir
+        self.idle_timeout = idle_timeout
+        self._service = None
+        # 로드/언로드 보호
+        self._lock = threading.Lock()
+        # 추론 직렬화 (토크나이저는 스레드 간 공유 시 안전하지 않음, CPU 추론은 연산 스레드를 이미 모두 사용)
+        self._predict_lock = threading.Lock()
+        self._inflight = 0
+        self._last_used = None
+        self._loaded_at = None
+        self._monitor = None
+        self._stats = {
+            "loads": 0,
+            "load_failures": 0,
+            "total_load_time": 0.0,
+            "last_load_time": None,
+            "idle_unloads": 0,
+            "requests": 0,
+            "documents": 0,
+            "total_predict_time": 0.0,
+            "embedding_documents": 0,
+        }
+
+    def _load_locked(self):
+        """모델 로드 (lock 보유 상태에서 호출)"""
+        start_time = time.perf_counter()
+        service = ClassificationService(self.model_dir)
+        service._ensure_loaded()
+        load_time = time.perf_counter() - start_time
+
+        if service.model is None:
+            self._stats["load_failures"] += 1
+            return None
+
+        self._service = service
+        self._loaded_at = time.time()
+        self._stats["loads"] += 1
+        self._stats["total_load_time"] += load_time
+        self._stats["last_load_time"] = load_time
+        print(f"✓ 상주 분류 모델 로드 ({load_time:.2f}초, 누적 {self._stats['loads']}회)")
+
+        if self.idle_timeout and self.idle_timeout > 0 and self._monitor is None:
+            self._monitor = threading.Thread(target=self._idle_monitor, daemon=True)
+            self._monitor.start()
+        return service
+
+    def _acquire(self):
+        with self._lock:
+            self._inflight += 1
+            self._last_used = time.time()
+            try:
+                return self._service or self._load_locked()
+            except Exception:
+                self._inflight -= 1
+                raise
+
+    def _release(self):
+        with self._lock:
+            self._inflight -= 1
+            self._last_used = time.time()
+
+    @property
+    def encoder_key(self):
+        """상주 모델의 인코더 식별자 (모델을 로드하지 않고 가중치 파일로 계산)"""
+        service = self._service
+        return (service or ClassificationService(self.model_dir)).encoder_key
+
+    def predict_batch(self, texts: list, return_probs: bool = False, batch_size: int = None,
+                      return_embeddings: bool = False) -> list:
+        """상주 모델로 배치 예측 (ClassificationService.predict_batch 와 같은 형식)"""
+        service = self._acquire()
+        try:
+            if service is None:
+                return [ClassificationService._unavailable_result() for _ in texts]
+
+            start_time = time.perf_counter()
+            with self._predict_lock:
+                results = service.predict_batch(texts, return_probs=return_probs, batch_size=batch_size,
+                                                return_embeddings=return_embeddings)
+            with self._lock:
+                self._stats["requests"] += 1
+                self._stats["documents"] += len(texts)
+                self._stats["total_predict_time"] += time.perf_counter() - start_time
+            return results
+        finally:
+            self._release()
+
+    def predict(self, text: str, return_probs: bool = False) -> Dict:
+        """상주 모델로 문서 하나 예측"""
+        return self.predict_batch([text], return_probs=return_probs, batch_size=1)[0]
+
+    def classify_embeddings(self, embeddings, return_probs: bool = False) -> list:
+        """저장된 문서 임베딩에 상주 모델의 분류 헤드만 적용"""
+        service = self._acquire()
+        try:
+            if service is None:
+                return [ClassificationService._unavailable_result() for _ in embeddings]
+
+            results = service.classify_embeddings(embeddings, return_probs=return_probs)
+            with self._lock:
+                self._stats["embedding_documents"] += len(results)
+            return results
+        finally:
+            self._release()
+
+    def _idle_monitor(self):
+        """유휴 시간 초과 시 모델 언로드"""
+        interval = max(1.0, min(self.idle_timeout / 4, 30.0))
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                if (self._service is not None and self._inflight == 0 and self._last_used is not None
+                        and time.time() - self._last_used >= self.idle_timeout):
+                    print(f"🧹 분류 모델 유휴 시간 초과 ({self.idle_timeout:.0f}초) - 언로드")
+                    self._unload_locked()
+                    self._stats["idle_unloads"] += 1
+
+    def _unload_locked(self):
+        service, self._service, self._loaded_at = self._service, None, None
+        if service is not None:
+            service.cleanup()
+
+    def unload(self):
+        """모델 언로드 (진행 중인 예측이 끝날 때까지 대기)"""
+        with self._predict_lock, self._lock:
+            self._unload_locked()
+
+    def status(self) -> dict:
+        """상주 모델 상태 (로드 여부, 로드 횟수/시간, 요청 처리량)"""
+        with self._lock:
+            now = time.time()
+            loads = self._stats["loads"]
+            documents = self._stats["documents"]
+            service = self._service
+            return {
+                "loaded": service is not None,
+                "device": service.device if service is not None else None,
+                "backend": service.backend if service is not None else CLASSIFY_BACKEND,
+                "model_dir": service.model_dir if service is not None else self.model_dir,
+                "inflight": self._inflight,
+                "idle_timeout": self.idle_timeout,
+                "idle_seconds": round(now - self._last_used, 1) if self._last_used else None,
+                "uptime_seconds": round(now - self._loaded_at, 1) if self._loaded_at else 0,
+                "loads": loads,
+                "load_failures": self._stats["load_failures"],
+                "avg_load_time": round(self._stats["total_load_time"] / loads, 3) if loads else None,
+                "last_load_time": round(self._stats["last_load_time"], 3)
+                if self._stats["last_load_time"] is not None else None,
+                "idle_unloads": self._stats["idle_unloads"],
+                "requests": self._stats["requests"],
+                "documents": documents,
+                "embedding_documents": self._stats["embedding_documents"],
+                "avg_predict_ms_per_doc": round(self._stats["total_predict_time"] / documents * 1000, 1)
+                if documents else None,
+                "last_batch": service.last_batch_stats if service is not None else None,
+            }
+
+
+_resident_classifier = None
+_resident_classifier_lock = threading.Lock()
+
+
+def get_resident_classifier() -> ResidentClassifier:
+    """프로세스 전역 상주 분류 모델 반환"""
+    global _resident_classifier
+    with _resident_classifier_lock:
+        if _resident_classifier is None:
+            _resident_classifier = ResidentClassifier()
+        return _resident_classifier
+
+
+def shutdown_resident_classifier():
+    """서버 종료 시 상주 분류 모델 언로드"""
+    with _resident_classifier_lock:
+        if _resident_classifier is not None:
+            _resident_classifier.unload()
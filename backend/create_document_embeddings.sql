@@ -0,0 +1,20 @@
+-- 문서 임베딩 저장 테이블 생성
+-- 분류 헤드 입력 벡터(float32)를 OCR 결과 / 인코더별로 저장해 재분류 시 인코더를 다시 실행하지 않음
+CREATE TABLE IF NOT EXISTS document_embeddings (
+    ocr_id INTEGER NOT NULL,
+    encoder_key VARCHAR(100) NOT NULL,   -- "구분:가중치 파일 SHA-256 앞 16자리" (예: torch:1a2b3c4d5e6f7a8b)
+    dim INTEGER NOT NULL,                -- 벡터 차원 (klue/bert-base: 768)
+    embedding BYTEA NOT NULL,            -- float32 little-endian 배열
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (ocr_id, encoder_key),
+    FOREIGN KEY (ocr_id) REFERENCES ocr_results(ocr_id) ON DELETE CASCADE
+);
+
+-- 인덱스 추가
+CREATE INDEX IF NOT EXISTS idx_document_embeddings_encoder ON document_embeddings(encoder_key);
+
+-- 확인
+SELECT encoder_key, COUNT(*) AS documents, MAX(dim) AS dim, MAX(created_at) AS last_created
+FROM document_embeddings
+GROUP BY encoder_key
+ORDER BY last_created DESC;
@@ -0,0 +1,14 @@
+-- 페이지 단위 OCR 중복 제거 캐시 테이블 생성
+CREATE TABLE IF NOT EXISTS ocr_page_cache (
+    image_hash VARCHAR(64) NOT NULL,     -- 전처리된 페이지 이미지 SHA-256
+    cache_key VARCHAR(200) NOT NULL,     -- OCR 엔진 + DPI 처리 방식
+    text TEXT,
+    dpi INTEGER,                         -- 결과를 만든 렌더링 DPI
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (image_hash, cache_key)
+);
+
+-- 확인
+SELECT cache_key, COUNT(*) AS pages
+FROM ocr_page_cache
+GROUP BY cache_key;
@@ -0,0 +1,25 @@
+-- 페이지 단위 OCR 체크포인트 테이블 생성
+CREATE TABLE IF NOT EXISTS ocr_pages (
+    page_id SERIAL PRIMARY KEY,
+    doc_id INTEGER NOT NULL,
+    ocr_id INTEGER,                      -- 문서 OCR 완료 후 연결되는 ocr_results.ocr_id
+    content_hash VARCHAR(64) NOT NULL,   -- PDF 내용 SHA-256 (파일이 바뀌면 체크포인트 무효)
+    ocr_config VARCHAR(200) NOT NULL,    -- OCR 설정 키
+    page_num INTEGER NOT NULL,
+    text TEXT,
+    engine VARCHAR(50),
+    meta TEXT,                           -- 그 외 페이지 정보 (JSON)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (doc_id) REFERENCES pdf_documents(doc_id) ON DELETE CASCADE,
+    UNIQUE (doc_id, content_hash, ocr_config, page_num)
+);
+
+-- 인덱스 추가
+CREATE INDEX IF NOT EXISTS idx_ocr_pages_ocr_id ON ocr_pages(ocr_id, page_num);
+
+-- 확인
+SELECT doc_id, COUNT(*) AS pages, COUNT(ocr_id) AS attached
+FROM ocr_pages
+GROUP BY doc_id
+ORDER BY doc_id DESC
+LIMIT 10;
@@ -0,0 +1,232 @@
+"""
+커스텀 분류 모델 레지스트리
+/category/train 으로 학습한 모델(models/bert_custom_*)을 요청마다 디스크에서 다시 읽지 않도록
+(모델 경로, 수정 시각) 별로 한 번만 로드해 모든 요청이 공유
+
+메모리 예산(CUSTOM_MODEL_MEMORY_MB)을 넘으면 가장 오래 사용하지 않은 모델부터 언로드 (LRU)
+같은 경로의 모델 파일이 바뀌면 (다시 학습/복사) 이전 버전은 바로 언로드하고 새로 로드
+"""
+import os
+import gc
+import json
+import time
+import threading
+from collections import OrderedDict
+
+
+# 상주 커스텀 모델 전체 메모리 예산(MB) - 가중치/버퍼 크기 기준, 0 이하이면 제한 없음
+CUSTOM_MODEL_MEMORY_MB = float(os.environ.get("CUSTOM_MODEL_MEMORY_MB", "2048"))
+
+
+class LoadedCustomModel:
+    """로드된 커스텀 모델 하나 (토크나이저, 모델, 레이블 매핑)"""
+
+    def __init__(self, model_path: str, mtime: float, tokenizer, model, device: str, id_to_label: dict):
+        self.model_path = model_path
+        self.mtime = mtime
+        self.tokenizer = tokenizer
+        self.model = model
+        self.device = device
+        self.id_to_label = id_to_label
+        # 추론 직렬화 - 같은 모델을 쓰는 요청들이 토크나이저/모델을 공유 (fast 토크나이저는 동시 사용 시 오류)
+        self.predict_lock = threading.Lock()
+        # 파라미터 + 버퍼 크기 (메모리 예산 계산용)
+        self.size_bytes = sum(t.numel() * t.element_size() for t in list(model.parameters()) + list(model.buffers()))
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+        self.uses = 0
+
+
+def _model_mtime(model_path: str) -> float:
+    """모델 디렉토리 안 파일들의 가장 최근 수정 시각 (가중치/설정/레이블 매핑 중 하나라도 바뀌면 달라짐)"""
+    mtimes = [os.path.getmtime(model_path)]
+    for entry in os.scandir(model_path):
+        if entry.is_file():
+            mtimes.append(entry.stat().st_mtime)
+    return max(mtimes)
+
+
+class CustomModelRegistry:
+    """(모델 경로, 수정 시각) → 로드된 모델, 메모리 예산 안에서 LRU 로 유지"""
+
+    def __init__(self, memory_budget_mb: float = CUSTOM_MODEL_MEMORY_MB):
+        self.memory_budget = memory_budget_mb * 1024 * 1024 if memory_budget_mb and memory_budget_mb > 0 else None
+        # {(실제 경로, 수정 시각): LoadedCustomModel} - 뒤쪽이 최근 사용
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        # 같은 모델을 동시에 요청해도 한 번만 로드하도록 경로별 로드 lock
+        self._load_locks = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "load_failures": 0,
+            "total_load_time": 0.0,
+            "evictions": 0,
+            "stale_evictions": 0,
+        }
+
+    def get(self, model_path: str) -> LoadedCustomModel:
+        """모델 반환 (없으면 로드) - 로드 실패 시 예외"""
+        path = os.path.realpath(model_path)
+        key = (path, _model_mtime(path))
+
+        with self._lock:
+            loaded = self._lookup_locked(key)
+            if loaded is not None:
+                return loaded
+            load_lock = self._load_locks.setdefault(path, threading.Lock())
+
+        with load_lock:
+            # 대기하는 동안 다른 요청이 로드했으면 그 모델 사용
+            with self._lock:
+                loaded = self._lookup_locked(key)
+                if loaded is not None:
+                    return loaded
+                self._stats["misses"] += 1
+
+            start_time = time.perf_counter()
+            try:
+                loaded = self._load(path, key[1])
+            except Exception:
+                with self._lock:
+                    self._stats["load_failures"] += 1
+                raise
+            load_time = time.perf_counter() - start_time
+
+            with self._lock:
+                # 같은 경로의 이전 버전은 더 이상 쓰이지 않으므로 언로드
+                for stale_key in [k for k in self._models if k[0] == path and k != key]:
+                    self._evict_locked(stale_key)
+                    self._stats["stale_evictions"] += 1
+                self._models[key] = loaded
+                loaded.uses += 1
+                loaded.last_used = time.time()
+                self._stats["loads"] += 1
+                self._stats["total_load_time"] += load_time
+                self._enforce_budget_locked(keep=key)
+                print(f"📦 커스텀 모델 로드: {model_path} ({loaded.size_bytes / 1024 / 1024:.0f}MB, {load_time:.2f}초, "
+                      f"상주 {len(self._models)}개 / {self._used_bytes_locked() / 1024 / 1024:.0f}MB)")
+
+        return loaded
+
+    def _lookup_locked(self, key):
+        loaded = self._models.get(key)
+        if loaded is None:
+            return None
+        self._models.move_to_end(key)
+        self._stats["hits"] += 1
+        loaded.uses += 1
+        loaded.last_used = time.time()
+        return loaded
+
+    @staticmethod
+    def _load(path: str, mtime: float) -> LoadedCustomModel:
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        import torch
+
+        tokenizer = AutoTokenizer.from_pretrained(path)
+        model = AutoModelForSequenceClassification.from_pretrained(path)
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model.to(device)
+        model.eval()
+
+        # 레이블 매핑 로드
+        with open(os.path.join(path, "label_mappings.json"), 'r', encoding='utf-8') as f:
+            label_mappings = json.load(f)
+        id_to_label = {int(k): v for k, v in label_mappings['id2label'].items()}
+
+        return LoadedCustomModel(path, mtime, tokenizer, model, device, id_to_label)
+
+    def _used_bytes_locked(self) -> int:
+        return sum(loaded.size_bytes for loaded in self._models.values())
+
+    def _enforce_budget_locked(self, keep):
+        """메모리 예산을 넘으면 가장 오래 사용하지 않은 모델부터 언로드 (방금 로드한 모델은 유지)"""
+        if self.memory_budget is None:
+            return
+        while self._used_bytes_locked() > self.memory_budget:
+            victim = next((k for k in self._models if k != keep), None)
+            if victim is None:
+                break
+            self._evict_locked(victim)
+            self._stats["evictions"] += 1
+
+    def _drop_load_lock_locked(self, path: str):
+        """경로에 상주 모델이 없으면 그 경로의 로드 lock 제거 (로드 중인 lock 은 유지)"""
+        if any(k[0] == path for k in self._models):
+            return
+        load_lock = self._load_locks.get(path)
+        if load_lock is not None and not load_lock.locked():
+            del self._load_locks[path]
+
+    def _evict_locked(self, key):
+        loaded = self._models.pop(key)
+        self._drop_load_lock_locked(key[0])
+        print(f"🧹 커스텀 모델 언로드: {loaded.model_path} ({loaded.size_bytes / 1024 / 1024:.0f}MB)")
+        # 레지스트리 참조만 제거 - 진행 중인 요청이 모델을 쓰고 있으면 그 요청이 끝난 뒤 해제됨
+        device = loaded.device
+        del loaded
+        gc.collect()
+        if device == "cuda":
+            import torch
+            torch.cuda.empty_cache()
+
+    def clear(self):
+        """모든 모델 언로드"""
+        with self._lock:
+            for key in list(self._models):
+                self._evict_locked(key)
+            self._load_locks = {path: lock for path, lock in self._load_locks.items() if lock.locked()}
+
+    def status(self) -> dict:
+        """적중/미스 통계와 상주 모델 목록 (최근 사용 순)"""
+        with self._lock:
+            now = time.time()
+            lookups = self._stats["hits"] + self._stats["misses"]
+            loads = self._stats["loads"]
+            return {
+                "memory_budget_mb": round(self.memory_budget / 1024 / 1024, 1) if self.memory_budget else None,
+                "used_mb": round(self._used_bytes_locked() / 1024 / 1024, 1),
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+                "loads": loads,
+                "load_failures": self._stats["load_failures"],
+                "avg_load_time": round(self._stats["total_load_time"] / loads, 3) if loads else None,
+                "evictions": self._stats["evictions"],
+                "stale_evictions": self._stats["stale_evictions"],
+                "resident": [
+                    {
+                        "model_path": loaded.model_path,
+                        "mtime": loaded.mtime,
+                        "size_mb": round(loaded.size_bytes / 1024 / 1024, 1),
+                        "device": loaded.device,
+                        "labels": len(loaded.id_to_label),
+                        "uses": loaded.uses,
+                        "idle_seconds": round(now - loaded.last_used, 1),
+                        "uptime_seconds": round(now - loaded.loaded_at, 1),
+                    }
+                    for loaded in reversed(self._models.values())
+                ],
+            }
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_custom_model_registry() -> CustomModelRegistry:
+    """프로세스 전역 커스텀 모델 레지스트리 반환"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CustomModelRegistry()
+        return _registry
+
+
+def shutdown_custom_model_registry():
+    """서버 종료 시 상주 커스텀 모델 언로드"""
+    with _registry_lock:
+        if _registry is not None:
+            _registry.clear()
@@ -5,8 +5,8 @@ from psycopg2 import pool
 
 class PostgresDB:
     def __init__(self):
-        # 커넥션 풀 생성
-        self.postgre_pool = psycopg2.pool.SimpleConnectionPool(
+        # 커넥션 풀 생성 (OCR 작업 스레드에서도 사용하므로 스레드 안전한 풀 사용)
+        self.postgre_pool = psycopg2.pool.ThreadedConnectionPool(
             minconn=1,  # 최소 커넥션 수
             maxconn=10, # 최대 커넥션 수
             dbname="postgres",
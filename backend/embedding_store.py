@@ -0,0 +1,196 @@
+"""
+문서 임베딩 저장소
+분류 모델 인코더(BERT)의 출력 중 분류 헤드 입력이 되는 벡터를 (ocr_id, 인코더 키) 별로
+document_embeddings 테이블에 float32 bytea 로 저장
+
+같은 인코더로 다시 분류할 때는 인코더를 실행하지 않고 저장된 임베딩에 분류 헤드(행렬 곱)만 적용
+인코더 키는 인코더 가중치(분류 헤드 제외) 해시로 만들므로 인코더가 바뀌면 자동으로 새 키가 되고
+헤드만 다시 학습한 모델은 같은 키로 저장된 임베딩을 그대로 재사용
+"""
+import os
+import hashlib
+import threading
+
+import numpy as np
+
+
+# 분류 시 임베딩 저장/재사용 여부
+EMBEDDING_STORE_ENABLED = os.environ.get("EMBEDDING_STORE_ENABLED", "1") == "1"
+
+_table_ready = False
+_table_lock = threading.Lock()
+
+# 인코더 가중치 이름 접두사 (TwoTaskBertModel / BertForSequenceClassification 모두 "bert.")
+# 분류 헤드(classifiers.* / classifier.*)는 인코더 키에 포함하지 않음
+ENCODER_PREFIX = "bert."
+
+# {(경로, 크기, 수정 시각, 구분, 접두사): 인코더 키} - 같은 파일을 매번 다시 해시하지 않음
+_fingerprints = {}
+_fingerprint_lock = threading.Lock()
+
+
+def ensure_embeddings_table(cur):
+    """document_embeddings 테이블 생성 (프로세스당 한 번만 실행)"""
+    global _table_ready
+    with _table_lock:
+        if _table_ready:
+            return
+
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS document_embeddings (
+                ocr_id INTEGER NOT NULL,
+                encoder_key VARCHAR(100) NOT NULL,
+                dim INTEGER NOT NULL,
+                embedding BYTEA NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (ocr_id, encoder_key),
+                FOREIGN KEY (ocr_id) REFERENCES ocr_results(ocr_id) ON DELETE CASCADE
+            )
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_document_embeddings_encoder
+            ON document_embeddings(encoder_key)
+        """)
+        _table_ready = True
+
+
+def _tensor_array(tensor) -> np.ndarray:
+    """torch 텐서 / numpy 배열 → 연속 메모리 numpy 배열 (bfloat16 은 float32 로)"""
+    if hasattr(tensor, "detach"):
+        tensor = tensor.detach().cpu().contiguous()
+        if str(tensor.dtype) == "torch.bfloat16":
+            tensor = tensor.float()
+        tensor = tensor.numpy()
+    return np.ascontiguousarray(tensor)
+
+
+def encoder_state_fingerprint(state_dict: dict, variant: str, prefix: str = ENCODER_PREFIX):
+    """state dict 중 인코더 가중치(prefix 로 시작하는 텐서)만으로 만든 인코더 키
+
+    분류 헤드는 키에 포함하지 않으므로 헤드만 다시 학습해도 저장된 임베딩을 그대로 재사용
+
+    Returns:
+        str | None: 인코더 가중치가 없으면 None
+    """
+    names = sorted(name for name in state_dict if name.startswith(prefix))
+    if not names:
+        return None
+
+    digest = hashlib.sha256()
+    for name in names:
+        array = _tensor_array(state_dict[name])
+        digest.update(f"{name}:{array.dtype}:{array.shape};".encode())
+        digest.update(array.tobytes())
+    return f"{variant}:{digest.hexdigest()[:16]}"
+
+
+def _load_state_dict(weights_path: str, prefix: str) -> dict:
+    """가중치 파일에서 인코더 텐서만 읽음 (safetensors 는 필요한 텐서만, .pt/.bin 은 가능하면 mmap)"""
+    if weights_path.endswith(".safetensors"):
+        from safetensors import safe_open
+        with safe_open(weights_path, framework="pt") as f:
+            return {name: f.get_tensor(name) for name in f.keys() if name.startswith(prefix)}
+
+    import torch
+    try:
+        state_dict = torch.load(weights_path, map_location="cpu", mmap=True)
+    except (TypeError, RuntimeError):
+        # mmap 미지원 (이전 torch 버전 / 이전 저장 형식)
+        state_dict = torch.load(weights_path, map_location="cpu")
+    return {name: tensor for name, tensor in state_dict.items() if name.startswith(prefix)}
+
+
+def encoder_fingerprint(weights_path: str, variant: str, prefix: str = ENCODER_PREFIX):
+    """인코더 키 - "구분:인코더 가중치 SHA-256 앞 16자리"
+
+    Args:
+        weights_path: 모델 가중치 파일 (model.pt, model.safetensors 등) - 분류 헤드가 함께 있어도 됨
+        variant: 같은 가중치라도 임베딩이 달라지는 실행 방식 구분 (예: "torch", "int8", "custom")
+        prefix: 인코더 가중치 이름 접두사
+
+    Returns:
+        str | None: 파일이 없거나 인코더 가중치가 없으면 None
+    """
+    try:
+        stat = os.stat(weights_path)
+    except OSError:
+        return None
+
+    cache_key = (os.path.realpath(weights_path), stat.st_size, stat.st_mtime_ns, variant, prefix)
+    with _fingerprint_lock:
+        if cache_key in _fingerprints:
+            return _fingerprints[cache_key]
+
+    key = encoder_state_fingerprint(_load_state_dict(weights_path, prefix), variant, prefix)
+
+    with _fingerprint_lock:
+        _fingerprints[cache_key] = key
+    return key
+
+
+def model_dir_fingerprint(model_dir: str, variant: str = "custom"):
+    """transformers save_pretrained 디렉토리의 인코더 키 (model.safetensors 또는 pytorch_model.bin 기준)"""
+    for weights_file in ("model.safetensors", "pytorch_model.bin"):
+        key = encoder_fingerprint(os.path.join(model_dir, weights_file), variant)
+        if key:
+            return key
+    return None
+
+
+def load_embeddings(cur, ocr_ids: list, encoder_key: str) -> dict:
+    """저장된 임베딩 조회
+
+    Returns:
+        dict[int, np.ndarray]: {ocr_id: float32 벡터} (저장되지 않은 ID는 제외)
+    """
+    ocr_ids = list(dict.fromkeys(ocr_ids))
+    if not ocr_ids or not encoder_key:
+        return {}
+
+    ensure_embeddings_table(cur)
+    cur.execute("""
+        SELECT ocr_id, dim, embedding
+        FROM document_embeddings
+        WHERE encoder_key = %s AND ocr_id = ANY(%s)
+    """, (encoder_key, ocr_ids))
+
+    embeddings = {}
+    for ocr_id, dim, data in cur.fetchall():
+        vector = np.frombuffer(bytes(data), dtype=np.float32)
+        if vector.shape[0] == dim:
+            embeddings[ocr_id] = vector
+    return embeddings
+
+
+def save_embeddings(cur, encoder_key: str, embeddings: dict):
+    """임베딩 저장 ({ocr_id: 벡터}) - 이미 있는 (ocr_id, 인코더 키) 는 덮어씀"""
+    if not embeddings or not encoder_key:
+        return
+
+    ensure_embeddings_table(cur)
+    for ocr_id, vector in embeddings.items():
+        vector = np.ascontiguousarray(vector, dtype=np.float32)
+        cur.execute("""
+            INSERT INTO document_embeddings (ocr_id, encoder_key, dim, embedding)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (ocr_id, encoder_key) DO UPDATE
+            SET dim = EXCLUDED.dim,
+                embedding = EXCLUDED.embedding,
+                created_at = CURRENT_TIMESTAMP
+        """, (ocr_id, encoder_key, vector.shape[0], vector.tobytes()))
+
+
+def embedding_stats(cur) -> list:
+    """인코더 키별 저장된 임베딩 수"""
+    ensure_embeddings_table(cur)
+    cur.execute("""
+        SELECT encoder_key, COUNT(*), MAX(dim), MAX(created_at)
+        FROM document_embeddings
+        GROUP BY encoder_key
+        ORDER BY MAX(created_at) DESC
+    """)
+    return [
+        {"encoder_key": key, "documents": count, "dim": dim,
+         "last_created": created.isoformat() if created else None}
+        for key, count, dim, created in cur.fetchall()
+    ]
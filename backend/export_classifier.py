@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+문서 분류 모델 CPU 추론용 변환
+학습된 TwoTaskBertModel(model.pt, 두 분류 헤드 포함)을 CPU 추론 파일로 변환해 같은 모델 디렉토리에 저장하고
+fp32 모델과 예측이 일치하는지 검사
+
+    int8:      PyTorch 동적 int8 양자화 → model_int8.pt
+    onnx:      ONNX (fp32)             → model.onnx
+    onnx-int8: ONNX 동적 int8 양자화     → model_int8.onnx   (onnx 변환 결과를 양자화)
+
+변환 후 서버는 CLASSIFY_BACKEND=int8 / onnx / onnx-int8 로 해당 파일을 사용
+검증 텍스트는 bench_classification.py 와 같은 형식 (학습 데이터 JSON 또는 .txt 폴더)
+
+사용법:
+    python export_classifier.py multitask_training_data/test.json
+    python export_classifier.py texts/ --formats int8 onnx-int8 --min-agreement 0.99
+"""
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+from datetime import datetime
+
+import torch
+import torch.nn as nn
+
+from classification_service import (
+    ClassificationService, quantize_int8, TASKS, ONNX_AVAILABLE,
+    BACKEND_TORCH, BACKEND_INT8, BACKEND_ONNX, BACKEND_ONNX_INT8,
+    INT8_MODEL_FILE, ONNX_MODEL_FILES, ONNX_OUTPUT_NAMES,
+)
+from bench_classification import load_texts
+
+
+EXPORT_FORMATS = (BACKEND_INT8, BACKEND_ONNX, BACKEND_ONNX_INT8)
+
+# 변환 결과와 검증 결과를 기록하는 파일 (모델 디렉토리)
+EXPORT_INFO_FILE = "export_info.json"
+
+
+class _OnnxExportWrapper(nn.Module):
+    """ONNX 변환용 래퍼 - 위치 인자로 입력을 받고 태스크별 로짓을 TASKS 순서의 튜플로 반환"""
+
+    def __init__(self, model, input_names: list):
+        super().__init__()
+        self.model = model
+        self.input_names = input_names
+
+    def forward(self, *inputs):
+        logits = self.model(**dict(zip(self.input_names, inputs))).logits
+        return tuple(logits[task] for task in TASKS)
+
+
+def export_int8(service: ClassificationService) -> str:
+    """PyTorch 동적 int8 양자화 가중치 저장"""
+    path = os.path.join(service.model_dir, INT8_MODEL_FILE)
+    # 원본 모델은 검증 기준으로 계속 사용하므로 복사본을 양자화
+    torch.save(quantize_int8(copy.deepcopy(service.model)).state_dict(), path)
+    return path
+
+
+def export_onnx(service: ClassificationService, opset: int) -> str:
+    """ONNX (fp32) 변환 - 배치 크기와 시퀀스 길이는 동적 축"""
+    path = os.path.join(service.model_dir, ONNX_MODEL_FILES[BACKEND_ONNX])
+    sample = service.tokenizer(["분류 모델 변환용 예시 문서입니다.", "두 번째 예시"],
+                               padding=True, return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes.update({name: {0: "batch"} for name in ONNX_OUTPUT_NAMES})
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _OnnxExportWrapper(service.model, input_names).eval(),
+            tuple(sample[name] for name in input_names),
+            path,
+            input_names=input_names,
+            output_names=ONNX_OUTPUT_NAMES,
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+    return path
+
+
+def export_onnx_int8(model_dir: str) -> str:
+    """ONNX 모델의 가중치를 동적 int8 로 양자화"""
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    source = os.path.join(model_dir, ONNX_MODEL_FILES[BACKEND_ONNX])
+    path = os.path.join(model_dir, ONNX_MODEL_FILES[BACKEND_ONNX_INT8])
+    quantize_dynamic(source, path, weight_type=QuantType.QInt8)
+    return path
+
+
+def compare_predictions(reference: list, candidate: list) -> dict:
+    """fp32 예측과 변환 모델 예측 비교 - 태스크별 1위 레이블 일치율, 일치한 문서의 최대 신뢰도 차이"""
+    report = {}
+    for task in TASKS:
+        matched = [(r, c) for r, c in zip(reference, candidate) if r[task] == c[task]]
+        report[task] = {
+            "agreement": len(matched) / len(reference) if reference else 1.0,
+            "max_confidence_diff": max(
+                (abs(r["confidence"][task] - c["confidence"][task]) for r, c in matched), default=0.0
+            ),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 분류 모델 CPU 추론용 변환 (int8 / ONNX)")
+    parser.add_argument("path", help="예측 일치 검사용 텍스트 (학습 데이터 형식 JSON 파일 또는 .txt 폴더)")
+    parser.add_argument("--formats", nargs="+", choices=EXPORT_FORMATS, default=list(EXPORT_FORMATS),
+                        help="변환할 형식")
+    parser.add_argument("--model-dir", default=None, help="모델 디렉토리 (기본: twotask_bert_model)")
+    parser.add_argument("--docs", type=int, default=128, help="검사할 최대 문서 수")
+    parser.add_argument("--min-agreement", type=float, default=0.98,
+                        help="태스크별 최소 예측 일치율 (미달 시 종료 코드 1)")
+    parser.add_argument("--opset", type=int, default=14, help="ONNX opset 버전")
+    args = parser.parse_args()
+
+    formats = [fmt for fmt in EXPORT_FORMATS if fmt in args.formats]
+    if BACKEND_ONNX_INT8 in formats and BACKEND_ONNX not in formats:
+        # onnx-int8 은 onnx 변환 결과를 양자화
+        formats.insert(formats.index(BACKEND_ONNX_INT8), BACKEND_ONNX)
+    if not ONNX_AVAILABLE and any(fmt in ONNX_MODEL_FILES for fmt in formats):
+        print("❌ ONNX 변환/검증에는 onnx, onnxruntime 패키지가 필요합니다")
+        sys.exit(1)
+
+    texts = load_texts(args.path, args.docs)
+    if not texts:
+        print("❌ 검사할 문서가 없습니다")
+        sys.exit(1)
+
+    # 기준 fp32 모델 (변환도 CPU에서)
+    reference = ClassificationService(args.model_dir, backend=BACKEND_TORCH)
+    reference.device = "cpu"
+    reference._ensure_loaded()
+    if reference.model is None:
+        print("❌ 분류 모델을 로드할 수 없습니다")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("📦 문서 분류 모델 CPU 추론용 변환")
+    print("=" * 70)
+    print(f"  모델: {reference.model_dir}, 형식: {', '.join(formats)}, 검사 문서: {len(texts)}개")
+    print()
+
+    expected = reference.predict_batch(texts)
+
+    info_path = os.path.join(reference.model_dir, EXPORT_INFO_FILE)
+    info = {}
+    if os.path.exists(info_path):
+        with open(info_path, "r", encoding="utf-8") as f:
+            info = json.load(f)
+
+    passed = True
+    for fmt in formats:
+        start_time = time.perf_counter()
+        if fmt == BACKEND_INT8:
+            path = export_int8(reference)
+        elif fmt == BACKEND_ONNX:
+            path = export_onnx(reference, args.opset)
+        else:
+            path = export_onnx_int8(reference.model_dir)
+        export_time = time.perf_counter() - start_time
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"✓ {fmt}: {path} ({size_mb:.1f}MB, {export_time:.1f}초)")
+
+        # 변환 파일을 서버와 같은 방식으로 로드해 예측 비교
+        service = ClassificationService(reference.model_dir, backend=fmt)
+        service._ensure_loaded()
+        if service.model is None:
+            print(f"❌ {fmt}: 변환 모델을 로드할 수 없습니다")
+            passed = False
+            continue
+        report = compare_predictions(expected, service.predict_batch(texts))
+        service.cleanup()
+
+        for task, result in report.items():
+            ok = result["agreement"] >= args.min_agreement
+            passed = passed and ok
+            print(f"   {'✅' if ok else '❌'} {task}: 예측 일치 {result['agreement']:.2%}, "
+                  f"최대 신뢰도 차이 {result['max_confidence_diff']:.4f}")
+
+        info[fmt] = {
+            "file": os.path.basename(path),
+            "size_mb": round(size_mb, 1),
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+            "documents": len(texts),
+            "parity": report,
+        }
+
+    with open(info_path, "w", encoding="utf-8") as f:
+        json.dump(info, f, ensure_ascii=False, indent=2)
+
+    print("=" * 70)
+    if not passed:
+        print(f"❌ 예측 일치율이 기준({args.min_agreement:.0%})에 미달한 형식이 있습니다")
+        sys.exit(1)
+    print("✅ 모든 형식이 fp32 모델과 일치합니다 - 속도 비교: python bench_classification.py <path> --backends ...")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+OCR 결과 캐시
+PDF 내용(SHA-256)과 OCR 설정이 같은 기존 결과를 재사용해 중복 업로드의 OCR을 생략
+"""
+import json
+import hashlib
+import threading
+
+from ocr_service import (
+    PDF_DPI, OCR_TEXT_LAYER_MODE, OCR_DPI_MODE, OCR_ADAPTIVE_LOW_DPI, OCR_ADAPTIVE_HIGH_DPI, ENGINE_PADDLEOCR_VL,
+    OCR_PREPROCESS, OCR_GRAYSCALE, OCR_MAX_PAGE_SIDE, OCR_EMBEDDED_IMAGES
+)
+from rasterizers import OCR_RASTERIZER
+
+
+# 캐시 사용 여부
+OCR_CACHE_ENABLED = True
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_columns_ready = False
+_columns_lock = threading.Lock()
+
+
+def compute_content_hash(pdf_path: str) -> str:
+    """PDF 파일 내용의 SHA-256 (파일명과 무관)"""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def ocr_config_key(mode: str = None, dpi_mode: str = None, engine: str = ENGINE_PADDLEOCR_VL) -> str:
+    """OCR 결과에 영향을 주는 설정을 캐시 키 문자열로 변환"""
+    if (dpi_mode or OCR_DPI_MODE) == "adaptive":
+        dpi = f"{OCR_ADAPTIVE_LOW_DPI}-{OCR_ADAPTIVE_HIGH_DPI}"
+    else:
+        dpi = PDF_DPI
+    key = f"{engine}:dpi={dpi}:mode={mode or OCR_TEXT_LAYER_MODE}"
+    # 기본 백엔드(poppler)는 기존 캐시 키와 호환되도록 생략
+    if OCR_RASTERIZER != "poppler":
+        key += f":raster={OCR_RASTERIZER}"
+    # 전처리(그레이스케일/해상도 상한)는 인식 결과를 바꾸므로 설정별로 구분
+    # 전처리 도입 전 결과(전처리 없음)는 기존 캐시 키 그대로 유지
+    if OCR_PREPROCESS:
+        key += f":prep=gray{int(OCR_GRAYSCALE)}-max{OCR_MAX_PAGE_SIDE}"
+    # 단일 이미지 스캔 페이지는 렌더링 대신 내장 이미지를 OCR 하므로 결과가 달라짐
+    if OCR_EMBEDDED_IMAGES:
+        key += ":embedded"
+    return key
+
+
+def ensure_cache_columns(cur):
+    """ocr_results 에 캐시 컬럼 추가 (프로세스당 한 번만 실행)"""
+    global _columns_ready
+    with _columns_lock:
+        if _columns_ready:
+            return
+
+        cur.execute("""
+            ALTER TABLE ocr_results
+            ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64),
+            ADD COLUMN IF NOT EXISTS ocr_config VARCHAR(200),
+            ADD COLUMN IF NOT EXISTS cached_from INTEGER,
+            ADD COLUMN IF NOT EXISTS page_count INTEGER
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ocr_results_content_hash
+            ON ocr_results(content_hash, ocr_config)
+        """)
+        _columns_ready = True
+
+
+def find_cached_result(cur, content_hash: str, config_key: str):
+    """같은 내용/설정으로 처리된 가장 최근 OCR 결과 조회
+
+    Returns:
+        tuple | None: (ocr_id, page_count, processing_time)
+    """
+    cur.execute("""
+        SELECT ocr_id, page_count, page_data, processing_time
+        FROM ocr_results
+        WHERE content_hash = %s AND ocr_config = %s AND cached_from IS NULL
+        ORDER BY created_at DESC
+        LIMIT 1
+    """, (content_hash, config_key))
+
+    row = cur.fetchone()
+    if not row:
+        return None
+
+    ocr_id, page_count, page_data, processing_time = row
+    if page_count is None:
+        # page_count 컬럼 이전에 저장된 결과
+        if isinstance(page_data, str):
+            page_data = json.loads(page_data) if page_data else []
+        page_count = len(page_data or [])
+    return ocr_id, page_count, processing_time
+
+
+def copy_cached_result(cur, source_ocr_id: int, doc_id: int, processing_time: float) -> int:
+    """캐시된 OCR 결과를 새 doc_id 로 기록
+
+    Returns:
+        int: 새 ocr_id
+    """
+    cur.execute("""
+        INSERT INTO ocr_results
+            (doc_id, full_text, page_data, ocr_engine, processing_time, content_hash, ocr_config, cached_from,
+             page_count)
+        SELECT %s, full_text, page_data, ocr_engine, %s, content_hash, ocr_config, ocr_id, page_count
+        FROM ocr_results
+        WHERE ocr_id = %s
+        RETURNING ocr_id
+    """, (doc_id, processing_time, source_ocr_id))
+    return cur.fetchone()[0]
+
+
+class OCRCacheStats:
+    """캐시 적중 통계 (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def record_hit(self, saved_seconds: float):
+        with self._lock:
+            self.hits += 1
+            self.saved_seconds += saved_seconds or 0.0
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": OCR_CACHE_ENABLED,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "saved_seconds": round(self.saved_seconds, 2),
+            }
+
+
+cache_stats = OCRCacheStats()
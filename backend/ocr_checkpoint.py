@@ -0,0 +1,202 @@
+"""
+페이지 단위 OCR 체크포인트
+페이지가 끝날 때마다 ocr_pages 테이블에 저장하고, 중단된 작업을 다시 실행하면 남은 페이지만 처리
+OCR 이 끝나면 같은 행이 결과의 페이지 텍스트 원본이 됨 (조회는 ocr_text)
+"""
+import json
+import threading
+
+from db_conn import db_pool
+
+
+# 이전에 완료된 페이지를 건너뛰고 이어서 처리할지 여부
+OCR_RESUME_ENABLED = True
+
+_table_ready = False
+_table_lock = threading.Lock()
+
+# page_data 항목 중 별도 컬럼으로 저장하는 키 (나머지는 meta 에 JSON 으로 저장)
+_COLUMN_KEYS = ("page", "text", "engine")
+
+
+def ensure_pages_table(cur):
+    """ocr_pages 테이블 생성 (프로세스당 한 번만 실행)"""
+    global _table_ready
+    with _table_lock:
+        if _table_ready:
+            return
+
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_pages (
+                page_id SERIAL PRIMARY KEY,
+                doc_id INTEGER NOT NULL,
+                ocr_id INTEGER,
+                content_hash VARCHAR(64) NOT NULL,
+                ocr_config VARCHAR(200) NOT NULL,
+                page_num INTEGER NOT NULL,
+                text TEXT,
+                engine VARCHAR(50),
+                meta TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (doc_id) REFERENCES pdf_documents(doc_id) ON DELETE CASCADE,
+                UNIQUE (doc_id, content_hash, ocr_config, page_num)
+            )
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ocr_pages_ocr_id
+            ON ocr_pages(ocr_id, page_num)
+        """)
+        # 페이지 내용 해시 (수정본 증분 OCR에서 바뀌지 않은 페이지 조회)
+        cur.execute("ALTER TABLE ocr_pages ADD COLUMN IF NOT EXISTS page_hash VARCHAR(64)")
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_ocr_pages_page_hash
+            ON ocr_pages(page_hash, ocr_config)
+        """)
+        _table_ready = True
+
+
+def _row_to_entry(page_num: int, text: str, engine: str, meta: str) -> dict:
+    entry = {"page": page_num, "text": text or "", "engine": engine}
+    if meta:
+        entry.update(json.loads(meta))
+    return entry
+
+
+def load_completed_pages(cur, doc_id: int, content_hash: str, config_key: str) -> dict:
+    """같은 문서/내용/설정으로 이미 끝난 페이지 조회
+
+    Returns:
+        dict[int, dict]: {페이지 번호: 페이지 데이터}
+    """
+    cur.execute("""
+        SELECT page_num, text, engine, meta
+        FROM ocr_pages
+        WHERE doc_id = %s AND content_hash = %s AND ocr_config = %s
+        ORDER BY page_num
+    """, (doc_id, content_hash, config_key))
+    return {row[0]: _row_to_entry(*row) for row in cur.fetchall()}
+
+
+def _upsert_page(cur, doc_id: int, content_hash: str, config_key: str, entry: dict, page_hash: str = None,
+                 ocr_id: int = None):
+    meta = {k: v for k, v in entry.items() if k not in _COLUMN_KEYS}
+    cur.execute("""
+        INSERT INTO ocr_pages (doc_id, ocr_id, content_hash, ocr_config, page_num, text, engine, meta, page_hash)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (doc_id, content_hash, ocr_config, page_num)
+        DO UPDATE SET text = EXCLUDED.text, engine = EXCLUDED.engine, meta = EXCLUDED.meta,
+                      page_hash = EXCLUDED.page_hash, ocr_id = COALESCE(EXCLUDED.ocr_id, ocr_pages.ocr_id),
+                      created_at = NOW()
+    """, (doc_id, ocr_id, content_hash, config_key, entry["page"], entry.get("text", ""),
+          entry.get("engine"), json.dumps(meta, ensure_ascii=False) if meta else None, page_hash))
+
+
+def attach_pages(cur, doc_id: int, content_hash: str, config_key: str, ocr_id: int):
+    """최종 저장된 ocr_results 행에 페이지 체크포인트 연결"""
+    cur.execute("""
+        UPDATE ocr_pages
+        SET ocr_id = %s
+        WHERE doc_id = %s AND content_hash = %s AND ocr_config = %s
+    """, (ocr_id, doc_id, content_hash, config_key))
+
+
+def store_pages(cur, doc_id: int, content_hash: str, config_key: str, ocr_id: int, page_data: list,
+                page_hashes: list = None):
+    """OCR 결과의 페이지를 ocr_pages 에 확정 (ocr_pages 가 문서 텍스트의 원본)
+
+    체크포인트로 이미 저장된 페이지는 ocr_id 만 연결하고, 체크포인트 저장에 실패했던 페이지만 새로 저장
+    """
+    attach_pages(cur, doc_id, content_hash, config_key, ocr_id)
+    cur.execute("""
+        SELECT page_num
+        FROM ocr_pages
+        WHERE doc_id = %s AND content_hash = %s AND ocr_config = %s
+    """, (doc_id, content_hash, config_key))
+    stored = {row[0] for row in cur.fetchall()}
+
+    page_hashes = page_hashes or []
+    for entry in page_data:
+        if entry["page"] in stored:
+            continue
+        page_hash = page_hashes[entry["page"] - 1] if entry["page"] <= len(page_hashes) else None
+        _upsert_page(cur, doc_id, content_hash, config_key, entry, page_hash, ocr_id)
+
+
+def copy_pages(cur, source_ocr_id: int, doc_id: int, ocr_id: int):
+    """캐시에서 복사한 결과의 페이지를 새 문서 소유로 복사 (원본 문서가 삭제되어도 텍스트 유지)"""
+    cur.execute("""
+        INSERT INTO ocr_pages (doc_id, ocr_id, content_hash, ocr_config, page_num, text, engine, meta, page_hash)
+        SELECT %s, %s, p.content_hash, p.ocr_config, p.page_num, p.text, p.engine, p.meta, p.page_hash
+        FROM ocr_results r
+        JOIN ocr_pages p
+          ON p.doc_id = r.doc_id AND p.content_hash = r.content_hash AND p.ocr_config = r.ocr_config
+        WHERE r.ocr_id = %s
+        ON CONFLICT (doc_id, content_hash, ocr_config, page_num)
+        DO UPDATE SET ocr_id = EXCLUDED.ocr_id, text = EXCLUDED.text, engine = EXCLUDED.engine,
+                      meta = EXCLUDED.meta, page_hash = EXCLUDED.page_hash
+    """, (doc_id, ocr_id, source_ocr_id))
+
+
+class PageCheckpointWriter:
+    """페이지가 끝날 때마다 즉시 커밋 (작업이 죽어도 완료된 페이지는 남음)"""
+
+    def __init__(self, doc_id: int, content_hash: str, config_key: str, page_hashes: list = None, conn=None):
+        """
+        Args:
+            page_hashes: 페이지별 내용 해시 (인덱스 0 이 1페이지) - 있으면 page_hash 컬럼에 함께 저장
+            conn: 저장에 쓸 커넥션 - OCR 동안 커밋된 상태로 쉬고 있는 호출한 쪽 커넥션을 빌려 씀
+                  (None이면 첫 저장 때 풀에서 따로 받아 close 에서 반납)
+        """
+        self.doc_id = doc_id
+        self.content_hash = content_hash
+        self.config_key = config_key
+        self.page_hashes = page_hashes or []
+        self.saved = 0
+        self.failed = 0
+        self._conn = conn
+        self._owns_conn = conn is None
+        # 여러 스레드(분할 처리 구간별 결과 수집)에서 호출돼도 커넥션 획득/커밋/롤백이 섞이지 않도록
+        self._lock = threading.Lock()
+
+    def _page_hash(self, page_num: int):
+        return self.page_hashes[page_num - 1] if 0 < page_num <= len(self.page_hashes) else None
+
+    def write(self, entry: dict):
+        """페이지 하나 저장 - 실패해도 OCR 자체는 계속 진행"""
+        self.write_many([entry])
+
+    def write_many(self, entries: list):
+        """여러 페이지를 한 번에 커밋 (이전 버전에서 가져온 페이지 등)"""
+        entries = list(entries)
+        if not entries:
+            return
+        with self._lock:
+            self._write_locked(entries)
+
+    def _write_locked(self, entries: list):
+        if self._conn is None:
+            self._conn = db_pool.get_conn()
+            self._owns_conn = True
+
+        cur = self._conn.cursor()
+        try:
+            for entry in entries:
+                _upsert_page(cur, self.doc_id, self.content_hash, self.config_key, entry,
+                             self._page_hash(entry["page"]))
+            self._conn.commit()
+            self.saved += len(entries)
+        except Exception as e:
+            self._conn.rollback()
+            self.failed += len(entries)
+            pages = ", ".join(str(entry.get("page")) for entry in entries)
+            print(f"⚠️ 페이지 체크포인트 저장 실패 (doc_id={self.doc_id}, page={pages}): {e}")
+        finally:
+            cur.close()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._owns_conn:
+                db_pool.release_conn(self._conn)
+            self._conn = None
+        if self.failed:
+            print(f"⚠️ 체크포인트에 저장하지 못한 페이지 {self.failed}개 (doc_id={self.doc_id}) - 재개 시 다시 처리")
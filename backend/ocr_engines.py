@@ -0,0 +1,281 @@
+"""
+OCR 엔진 레지스트리
+페이지 이미지 → 텍스트 변환 엔진 (PaddleOCR-VL / Tesseract) 을 이름으로 선택
+"""
+import os
+import shutil
+from tempfile import NamedTemporaryFile
+
+try:
+    from paddleocr import PaddleOCRVL
+    import paddle
+    import numpy as np
+    PADDLEOCR_AVAILABLE = True
+except ImportError:
+    PADDLEOCR_AVAILABLE = False
+    print("⚠️ PaddleOCR not available. OCR features will be disabled.")
+
+try:
+    import pytesseract
+    TESSERACT_AVAILABLE = shutil.which(pytesseract.pytesseract.tesseract_cmd) is not None
+except ImportError:
+    TESSERACT_AVAILABLE = False
+
+
+def _detect_device() -> str:
+    """사용 가능한 추론 장치 ("gpu:0" 또는 "cpu")"""
+    if not PADDLEOCR_AVAILABLE:
+        return "cpu"
+    try:
+        if paddle.device.is_compiled_with_cuda() and paddle.device.cuda.device_count() > 0:
+            return "gpu:0"
+    except Exception:
+        pass
+    return "cpu"
+
+
+# 추론 장치 (환경변수로 강제 지정 가능, 기본값은 GPU가 있으면 gpu:0)
+OCR_DEVICE = os.environ.get("OCR_DEVICE") or _detect_device()
+
+# PaddleOCRVL 설정
+PADDLEOCR_CONFIG = {
+    "use_doc_orientation_classify": False,
+    "use_doc_unwarping": False,
+    "use_layout_detection": False,
+    "use_chart_recognition": False,
+    "device": OCR_DEVICE,
+}
+
+# 페이지 이미지를 임시 PNG 파일 대신 메모리 배열로 파이프라인에 전달 (실패 시 임시 파일로 폴백)
+OCR_ARRAY_INPUT = True
+
+# Tesseract 인식 언어 / 옵션 (LSTM 엔진, 자동 페이지 분할)
+TESSERACT_LANG = os.environ.get("TESSERACT_LANG", "kor+eng")
+TESSERACT_CONFIG = "--oem 1 --psm 3"
+
+# 엔진 이름 (page_data 의 "engine", ocr_results.ocr_engine, 캐시 키에 그대로 사용)
+ENGINE_PADDLEOCR_VL = "PaddleOCRVL"
+ENGINE_TESSERACT = "Tesseract"
+
+# 노드 기본 엔진 (요청에서 engine 을 지정하지 않았을 때)
+OCR_ENGINE = os.environ.get("OCR_ENGINE", ENGINE_PADDLEOCR_VL)
+
+
+def image_to_array(image):
+    """PIL 이미지를 파이프라인 입력용 ndarray로 변환 (PaddleX는 OpenCV와 같은 BGR 순서 사용)"""
+    rgb = np.asarray(image.convert("RGB"))
+    return np.ascontiguousarray(rgb[:, :, ::-1])
+
+
+def result_confidence(res):
+    """OCR 결과의 평균 인식 신뢰도 (엔진이 rec_scores 를 제공하지 않으면 None)"""
+    try:
+        data = res.json
+        data = data.get("res", data)
+        scores = data.get("rec_scores")
+        if scores is None:
+            scores = [
+                item.get("rec_score") for item in data.get("parsing_res_list", [])
+                if isinstance(item, dict) and item.get("rec_score") is not None
+            ]
+        scores = list(scores or [])
+        return float(sum(scores) / len(scores)) if scores else None
+    except Exception:
+        return None
+
+
+class OCREngine:
+    """OCR 엔진 공통 인터페이스"""
+
+    name = None
+
+    def __init__(self, cpu_threads: int = None):
+        """
+        Args:
+            cpu_threads: CPU 추론 시 사용할 연산 스레드 수 (None이면 엔진 기본값)
+        """
+        self.cpu_threads = cpu_threads
+        self.is_loaded = False
+
+    @staticmethod
+    def is_available() -> bool:
+        return False
+
+    def load(self):
+        """모델 로드"""
+        self.is_loaded = True
+
+    def recognize(self, images: list) -> list:
+        """이미지 묶음 인식
+
+        Returns:
+            list[tuple[str, float | None]]: 입력 순서대로 (텍스트, 평균 인식 신뢰도 0~1)
+        """
+        raise NotImplementedError
+
+    def release_memory(self):
+        """배치 처리 후 장치 메모리 정리"""
+
+    def unload(self):
+        """모델 언로드"""
+        self.is_loaded = False
+
+
+class PaddleOCRVLEngine(OCREngine):
+    """PaddleOCR-VL - 정확도가 높지만 GPU가 없으면 느림"""
+
+    name = ENGINE_PADDLEOCR_VL
+
+    def __init__(self, cpu_threads: int = None):
+        super().__init__(cpu_threads)
+        self.pipeline = None
+        self._array_input = OCR_ARRAY_INPUT
+
+    @staticmethod
+    def is_available() -> bool:
+        return PADDLEOCR_AVAILABLE
+
+    def load(self):
+        if self.is_loaded:
+            return
+        print(f"Loading PaddleOCR-VL model...")
+        config = dict(PADDLEOCR_CONFIG)
+        if config["device"] == "cpu" and self.cpu_threads:
+            config["cpu_threads"] = self.cpu_threads
+        self.pipeline = PaddleOCRVL(**config)
+        self.is_loaded = True
+        print(f"✓ PaddleOCR-VL loaded successfully")
+
+    def _predict_files(self, images: list) -> list:
+        """임시 PNG 파일을 거쳐 이미지 처리 (폴백 경로)"""
+        temp_img_paths = []
+        try:
+            for image in images:
+                with NamedTemporaryFile(delete=False, suffix=".png") as tmp_img:
+                    image.save(tmp_img.name)
+                    temp_img_paths.append(tmp_img.name)
+
+            inputs = temp_img_paths if len(temp_img_paths) > 1 else temp_img_paths[0]
+            return list(self.pipeline.predict(input=inputs, use_queues=False))
+        finally:
+            # 임시 이미지 파일 삭제
+            for temp_img_path in temp_img_paths:
+                if os.path.exists(temp_img_path):
+                    os.remove(temp_img_path)
+
+    def _predict_images(self, images: list) -> list:
+        """이미지 여러 장을 한 번에 처리 - 입력 순서대로 이미지당 결과 하나
+
+        메모리 배열로 전달하고, 파이프라인이 거부하면 임시 파일로 폴백
+        """
+        if not self._array_input:
+            return self._predict_files(images)
+
+        arrays = [image_to_array(image) for image in images]
+        try:
+            # predict는 제너레이터이므로 예외가 여기서 발생하도록 즉시 소비
+            return list(self.pipeline.predict(input=arrays if len(arrays) > 1 else arrays[0], use_queues=False))
+        except Exception as e:
+            print(f"⚠️ 배열 입력 처리 실패, 임시 파일 방식으로 재시도: {e}")
+            output = self._predict_files(images)
+            # 파일 방식은 성공했으므로 입력 형식 문제로 보고 이후에는 파일 방식 사용
+            self._array_input = False
+            return output
+
+    def recognize(self, images: list) -> list:
+        outputs = self._predict_images(images)
+        return [(res.markdown.get('markdown_texts', ''), result_confidence(res)) for res in outputs]
+
+    def release_memory(self):
+        # GPU 메모리 즉시 정리
+        if OCR_DEVICE.startswith("gpu"):
+            paddle.device.cuda.empty_cache()
+
+    def unload(self):
+        if self.pipeline is not None:
+            del self.pipeline
+            self.pipeline = None
+        if self.is_loaded:
+            self.release_memory()
+        self.is_loaded = False
+
+
+class TesseractEngine(OCREngine):
+    """로컬 Tesseract - 모델이 가볍고 CPU만으로 빠르게 처리 (레이아웃/표 인식은 약함)"""
+
+    name = ENGINE_TESSERACT
+
+    @staticmethod
+    def is_available() -> bool:
+        return TESSERACT_AVAILABLE
+
+    def load(self):
+        if self.cpu_threads:
+            # Tesseract 는 OpenMP 스레드 수를 OMP_THREAD_LIMIT 로 제한
+            os.environ["OMP_THREAD_LIMIT"] = str(self.cpu_threads)
+        self.is_loaded = True
+
+    def recognize(self, images: list) -> list:
+        return [self._recognize_one(image) for image in images]
+
+    @staticmethod
+    def _recognize_one(image) -> tuple:
+        data = pytesseract.image_to_data(
+            image, lang=TESSERACT_LANG, config=TESSERACT_CONFIG, output_type=pytesseract.Output.DICT
+        )
+
+        # 단어를 줄/문단 단위로 다시 조립하고, 단어 신뢰도(0~100) 평균을 0~1 로 환산
+        lines, scores = {}, []
+        for index, word in enumerate(data["text"]):
+            if not word.strip():
+                continue
+            key = (data["block_num"][index], data["par_num"][index], data["line_num"][index])
+            lines.setdefault(key, []).append(word)
+            confidence = float(data["conf"][index])
+            if confidence >= 0:
+                scores.append(confidence / 100)
+
+        text, previous = "", None
+        for key, words in lines.items():
+            if previous is not None:
+                text += "\n\n" if key[:2] != previous[:2] else "\n"
+            text += " ".join(words)
+            previous = key
+        return text, (sum(scores) / len(scores) if scores else None)
+
+
+OCR_ENGINES = {
+    PaddleOCRVLEngine.name: PaddleOCRVLEngine,
+    TesseractEngine.name: TesseractEngine,
+}
+
+
+def available_engines() -> list:
+    """현재 환경에서 사용할 수 있는 엔진 이름 목록"""
+    return [name for name, cls in OCR_ENGINES.items() if cls.is_available()]
+
+
+def resolve_engine(name: str = None) -> str:
+    """실제로 사용할 엔진 이름 결정
+
+    요청에서 지정한 엔진은 그대로 사용하고 (없으면 ValueError),
+    지정하지 않았는데 노드 기본 엔진을 쓸 수 없으면 사용 가능한 다른 엔진으로 대체
+
+    Returns:
+        str | None: 엔진 이름 (사용 가능한 엔진이 하나도 없으면 None)
+    """
+    if name:
+        if name not in OCR_ENGINES:
+            raise ValueError(f"알 수 없는 OCR 엔진: {name} (지원: {', '.join(OCR_ENGINES)})")
+        if not OCR_ENGINES[name].is_available():
+            raise ValueError(f"OCR 엔진 '{name}' 을(를) 이 서버에서 사용할 수 없습니다")
+        return name
+
+    if OCR_ENGINE in OCR_ENGINES and OCR_ENGINES[OCR_ENGINE].is_available():
+        return OCR_ENGINE
+    return next(iter(available_engines()), None)
+
+
+def create_engine(name: str, cpu_threads: int = None) -> OCREngine:
+    """이름으로 엔진 인스턴스 생성 (모델은 load() 호출 시 로드)"""
+    return OCR_ENGINES[name](cpu_threads=cpu_threads)
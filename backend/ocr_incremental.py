@@ -0,0 +1,147 @@
+"""
+수정본 PDF 증분 OCR
+페이지마다 내용 해시(page_hash)를 ocr_pages 에 함께 저장하고, 같은 경로에 다시 올라온 수정본은
+해시가 바뀐 페이지만 OCR - 바뀌지 않은 페이지는 이전 버전의 결과 텍스트를 그대로 이어 붙임
+
+페이지 해시는 렌더링 없이 PDF 객체 구조로 계산하므로 (페이지 순서가 바뀌거나 페이지가 추가/삭제되어도)
+해시로 매칭되는 페이지는 모두 재사용
+"""
+import json
+import hashlib
+
+from PyPDF2 import PdfReader
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+
+# 이전 버전의 바뀌지 않은 페이지 재사용 여부
+OCR_INCREMENTAL_ENABLED = True
+
+# 페이지 해시에서 제외할 키 - 다른 페이지/문서 구조를 가리키거나 렌더링 결과와 무관한 항목
+_IGNORED_KEYS = {"/Parent", "/P", "/Dest", "/A", "/StructParents", "/Metadata", "/Thumb", "/PieceInfo", "/LastModified"}
+
+
+def _hash_object(obj, digest, visited: dict):
+    """PDF 객체를 재귀적으로 해시 (간접 참조는 객체 번호 대신 내용으로 - 다시 저장해 번호가 바뀌어도 같은 값)"""
+    if isinstance(obj, IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key in visited:
+            # 이미 해시한 객체 (공유 리소스 / 순환 참조) 는 처음 방문한 순서로만 표시
+            digest.update(b"R%d;" % visited[key])
+            return
+        visited[key] = len(visited)
+        obj = obj.get_object()
+
+    if isinstance(obj, DictionaryObject):
+        digest.update(b"<<")
+        for key in sorted(obj.keys()):
+            if key in _IGNORED_KEYS:
+                continue
+            digest.update(str(key).encode("utf-8", "replace"))
+            _hash_object(obj.raw_get(key), digest, visited)
+        digest.update(b">>")
+        if isinstance(obj, StreamObject):
+            # 스트림은 압축된 원본 데이터 그대로 (디코딩 비용 없음)
+            data = getattr(obj, "_data", b"") or b""
+            digest.update(b"stream%d:" % len(data))
+            digest.update(data)
+    elif isinstance(obj, ArrayObject):
+        digest.update(b"[")
+        for item in obj:
+            _hash_object(item, digest, visited)
+        digest.update(b"]")
+    else:
+        digest.update(type(obj).__name__.encode())
+        digest.update(repr(obj).encode("utf-8", "replace"))
+        digest.update(b";")
+
+
+def _inherited_resources(page):
+    """상위 /Pages 노드에서 상속되는 /Resources (페이지에 직접 있으면 None)
+
+    /Parent 는 해시에서 제외하므로 상속 리소스(폰트/이미지)는 따로 찾아 반영해야 함
+    """
+    if "/Resources" in page:
+        return None
+    node, seen = page.get("/Parent"), set()
+    while node is not None:
+        node = node.get_object()
+        if id(node) in seen:
+            break
+        seen.add(id(node))
+        if "/Resources" in node:
+            return node.raw_get("/Resources")
+        node = node.get("/Parent")
+    return None
+
+
+def page_content_hashes(pdf_path: str) -> list:
+    """페이지별 내용 해시 (SHA-256) 목록 - 인덱스 0 이 1페이지
+
+    콘텐츠 스트림, 리소스(폰트/이미지, 상위 노드에서 상속된 것 포함), 페이지 크기/회전, 주석이 같으면 같은 해시
+
+    Returns:
+        list[str] | None: PDF를 읽을 수 없으면 None
+    """
+    try:
+        reader = PdfReader(pdf_path)
+        hashes = []
+        for page in reader.pages:
+            digest = hashlib.sha256()
+            # 페이지 크기/회전은 상위 /Pages 에서 상속될 수 있으므로 계산된 값을 따로 반영
+            digest.update(f"{list(map(float, page.mediabox))}:{page.get('/Rotate', 0)}:".encode())
+            visited = {}
+            resources = _inherited_resources(page)
+            if resources is not None:
+                digest.update(b"/Resources(inherited)")
+                _hash_object(resources, digest, visited)
+            _hash_object(page, digest, visited)
+            hashes.append(digest.hexdigest())
+        return hashes
+    except Exception as e:
+        print(f"⚠️ 페이지 해시 계산 실패 ({pdf_path}): {e}")
+        return None
+
+
+def load_unchanged_pages(cur, filename: str, content_hash: str, config_key: str,
+                         page_hashes: list, skip_pages=()) -> dict:
+    """같은 경로의 이전 버전 OCR 결과에서 내용이 같은 페이지 조회
+
+    완료된 결과(ocr_id 가 연결된 ocr_pages)만 사용하고, 같은 해시가 여러 버전에 있으면 가장 최근 결과 사용
+
+    Args:
+        filename: pdf_documents.filename (다시 업로드하면 같은 경로로 새 문서 행이 생김)
+        content_hash: 현재 파일 내용 해시 (같은 내용의 이전 결과는 캐시/체크포인트가 처리)
+        page_hashes: 현재 파일의 페이지 해시 목록
+        skip_pages: 이미 처리된 페이지 번호 (체크포인트에서 재개하는 페이지)
+
+    Returns:
+        dict[int, dict]: {현재 페이지 번호: 페이지 데이터}
+    """
+    if not page_hashes:
+        return {}
+
+    cur.execute("""
+        SELECT DISTINCT ON (p.page_hash) p.page_hash, p.ocr_id, p.text, p.engine, p.meta
+        FROM ocr_pages p
+        JOIN pdf_documents d ON d.doc_id = p.doc_id
+        WHERE d.filename = %s
+          AND p.ocr_config = %s
+          AND p.content_hash <> %s
+          AND p.ocr_id IS NOT NULL
+          AND p.page_hash = ANY(%s)
+        ORDER BY p.page_hash, p.ocr_id DESC
+    """, (filename, config_key, content_hash, list(set(page_hashes))))
+    previous = {row[0]: row[1:] for row in cur.fetchall()}
+
+    pages = {}
+    for page_num, page_hash in enumerate(page_hashes, 1):
+        if page_num in skip_pages or page_hash not in previous:
+            continue
+        ocr_id, text, engine, meta = previous[page_hash]
+        entry = {"page": page_num, "text": text or "", "engine": engine}
+        if meta:
+            entry.update(json.loads(meta))
+        entry["page"] = page_num
+        entry["unchanged_from"] = ocr_id
+        pages[page_num] = entry
+    return pages
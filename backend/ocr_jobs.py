@@ -0,0 +1,157 @@
+"""
+비동기 OCR 작업 관리
+OCR 요청을 작업 ID로 접수하고 이벤트 루프 밖의 스레드에서 실행하며 페이지 단위 진행 상황을 보고
+"""
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# 동시에 실행할 OCR 작업 수 (실제 추론 병렬도는 OCR 워커 풀 크기로 결정)
+OCR_JOB_CONCURRENCY = int(os.environ.get("OCR_JOB_CONCURRENCY", "2"))
+
+# 완료된 작업 정보를 보관하는 시간(초)
+OCR_JOB_RETENTION = 3600
+
+
+class OCRJob:
+    """OCR 작업 하나의 상태"""
+
+    def __init__(self, filepath: str, options: dict):
+        self.job_id = uuid.uuid4().hex
+        self.filepath = filepath
+        self.options = options
+        self.state = "queued"  # queued → running → completed / failed
+        self.total_pages = None
+        self.pages_done = 0
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self._first_page_at = None
+        self._first_page_done = 0
+        self._lock = threading.Lock()
+
+    def update_progress(self, entry: dict, done: int, total: int):
+        """페이지 완료 콜백"""
+        with self._lock:
+            now = time.time()
+            if self._first_page_at is None:
+                self._first_page_at = now
+                self._first_page_done = done
+            self.pages_done = done
+            self.total_pages = total
+
+    def eta_seconds(self):
+        """남은 예상 시간(초) - 첫 페이지 이후의 처리 속도로 계산"""
+        if self.state != "running" or not self.total_pages or self._first_page_at is None:
+            return None
+
+        pages_since = self.pages_done - self._first_page_done
+        if pages_since <= 0:
+            return None
+
+        seconds_per_page = (time.time() - self._first_page_at) / pages_since
+        return round(seconds_per_page * max(0, self.total_pages - self.pages_done), 1)
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        with self._lock:
+            progress = min(100.0, self.pages_done / self.total_pages * 100) if self.total_pages else 0
+            if self.state == "completed":
+                progress = 100
+
+            data = {
+                "job_id": self.job_id,
+                "filepath": self.filepath,
+                "state": self.state,
+                "pages_done": self.pages_done,
+                "total_pages": self.total_pages,
+                "progress": round(progress, 1),
+                "eta_seconds": self.eta_seconds(),
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "elapsed_seconds": round((self.finished_at or time.time()) - self.started_at, 2)
+                if self.started_at else 0,
+                "error": self.error,
+            }
+            if include_result:
+                data["result"] = self.result
+            return data
+
+
+class OCRJobManager:
+    """OCR 작업 접수/실행/조회"""
+
+    def __init__(self, max_concurrent: int = OCR_JOB_CONCURRENCY, retention: float = OCR_JOB_RETENTION):
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent), thread_name_prefix="ocr-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self.retention = retention
+
+    def submit(self, func, filepath: str, **options) -> OCRJob:
+        """작업 접수 - 즉시 반환하고 func(filepath, on_page=..., **options) 를 백그라운드에서 실행
+
+        func 는 {"success": bool, ...} 형태의 결과 dict 를 반환해야 함
+        """
+        job = OCRJob(filepath, options)
+        with self._lock:
+            self._prune_locked()
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def _run(self, job: OCRJob, func):
+        job.state = "running"
+        job.started_at = time.time()
+        try:
+            result = func(job.filepath, on_page=job.update_progress, **job.options)
+            job.result = result
+            if result.get("success"):
+                job.state = "completed"
+                if job.total_pages is None:
+                    job.total_pages = job.pages_done = result.get("page_count")
+            else:
+                job.state = "failed"
+                job.error = result.get("error") or result.get("message")
+        except Exception as e:
+            job.state = "failed"
+            job.error = str(e)
+            print(f"❌ OCR 작업 실패 ({job.job_id}): {e}")
+        finally:
+            job.finished_at = time.time()
+
+    def _prune_locked(self):
+        """보관 시간이 지난 완료 작업 정리"""
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.retention
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list:
+        with self._lock:
+            self._prune_locked()
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_ocr_job_manager() -> OCRJobManager:
+    """프로세스 전역 OCR 작업 관리자 반환"""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = OCRJobManager()
+        return _job_manager
@@ -0,0 +1,155 @@
+"""
+페이지 단위 OCR 중복 제거 캐시
+전처리된 페이지 이미지의 SHA-256 으로 이전 OCR 결과를 찾아, 여러 문서에 반복되는 페이지
+(표지, 서명 페이지, 정형화된 부록 등)는 추론 없이 텍스트를 재사용
+
+조회 순서: 프로세스 메모리 LRU → ocr_page_cache 테이블 (워커 프로세스/서버 재시작 간 공유)
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+# 페이지 캐시 사용 여부 / DB 공유 여부
+OCR_PAGE_CACHE_ENABLED = True
+OCR_PAGE_CACHE_DB = True
+
+# 프로세스 메모리에 보관할 최대 페이지 수
+OCR_PAGE_CACHE_SIZE = 2000
+
+
+def page_image_hash(image) -> str:
+    """페이지 이미지 픽셀 내용의 SHA-256 (모드/크기 포함 - 같은 페이지라도 DPI가 다르면 다른 키)"""
+    digest = hashlib.sha256(f"{image.mode}:{image.width}x{image.height}:".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def ensure_page_cache_table(cur):
+    """ocr_page_cache 테이블 생성"""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS ocr_page_cache (
+            image_hash VARCHAR(64) NOT NULL,
+            cache_key VARCHAR(200) NOT NULL,
+            text TEXT,
+            dpi INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (image_hash, cache_key)
+        )
+    """)
+
+
+class PageImageCache:
+    """페이지 이미지 해시 → OCR 텍스트 캐시 (메모리 LRU + DB)"""
+
+    def __init__(self, max_entries: int = OCR_PAGE_CACHE_SIZE, use_db: bool = OCR_PAGE_CACHE_DB):
+        self.max_entries = max_entries
+        self.use_db = use_db
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._table_ready = False
+        self.stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0}
+
+    def _remember(self, key: tuple, value: tuple):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _db_call(self, func):
+        """DB 조회/저장 실행 - DB를 사용할 수 없으면 이후에는 메모리 캐시만 사용"""
+        try:
+            from db_conn import db_pool
+            conn = db_pool.get_conn()
+        except Exception as e:
+            print(f"⚠️ 페이지 캐시 DB 사용 불가, 메모리 캐시만 사용: {e}")
+            self.use_db = False
+            return None
+
+        cur = conn.cursor()
+        try:
+            if not self._table_ready:
+                ensure_page_cache_table(cur)
+                self._table_ready = True
+            result = func(cur)
+            conn.commit()
+            return result
+        except Exception as e:
+            conn.rollback()
+            print(f"⚠️ 페이지 캐시 DB 오류: {e}")
+            return None
+        finally:
+            cur.close()
+            db_pool.release_conn(conn)
+
+    def get(self, image_hash: str, cache_key: str):
+        """캐시된 결과 조회
+
+        Returns:
+            tuple[str, int] | None: (텍스트, 결과를 만든 DPI)
+        """
+        key = (image_hash, cache_key)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return value
+
+        if self.use_db:
+            def _select(cur):
+                cur.execute(
+                    "SELECT text, dpi FROM ocr_page_cache WHERE image_hash = %s AND cache_key = %s",
+                    (image_hash, cache_key)
+                )
+                return cur.fetchone()
+
+            row = self._db_call(_select)
+            if row is not None:
+                value = (row[0] or "", row[1])
+                self._remember(key, value)
+                with self._lock:
+                    self.stats["db_hits"] += 1
+                return value
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, image_hash: str, cache_key: str, text: str, dpi: int = None):
+        """OCR 결과 저장"""
+        self._remember((image_hash, cache_key), (text, dpi))
+        with self._lock:
+            self.stats["stores"] += 1
+
+        if self.use_db:
+            def _insert(cur):
+                cur.execute("""
+                    INSERT INTO ocr_page_cache (image_hash, cache_key, text, dpi)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (image_hash, cache_key) DO NOTHING
+                """, (image_hash, cache_key, text, dpi))
+
+            self._db_call(_insert)
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageImageCache:
+    """프로세스 전역 페이지 캐시 반환"""
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageImageCache()
+        return _page_cache
+
+
+def page_cache_table_stats(cur) -> dict:
+    """DB에 저장된 페이지 캐시 규모"""
+    ensure_page_cache_table(cur)
+    cur.execute("SELECT COUNT(*), COUNT(DISTINCT cache_key) FROM ocr_page_cache")
+    pages, configs = cur.fetchone()
+    return {"stored_pages": pages, "configs": configs}
@@ -0,0 +1,513 @@
+"""
+OCR 워커 풀
+PaddleOCR-VL 파이프라인을 미리 로드해 둔 워커 프로세스들에 OCR 작업을 위임
+요청마다 모델을 로드/해제하지 않고, 일정 시간 유휴 상태가 지속되면 풀 전체를 내려 메모리 반환
+"""
+import os
+import time
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+# 워커 프로세스 수 (GPU 하나에 여러 개를 띄우면 VRAM을 그만큼 더 사용)
+OCR_POOL_WORKERS = int(os.environ.get("OCR_POOL_WORKERS", "1"))
+
+# 유휴 상태가 이 시간(초) 이상 지속되면 워커를 종료하고 모델 언로드 (0이면 언로드하지 않음)
+OCR_POOL_IDLE_TIMEOUT = float(os.environ.get("OCR_POOL_IDLE_TIMEOUT", "600"))
+
+# GPU가 없는 노드(OCR_DEVICE=cpu)의 워커 구성: 프로세스 수 × 프로세스당 연산 스레드 수
+#   프로세스를 늘리면 한 문서의 페이지를 나눠 동시에 처리하고 (파이프라인이 프로세스마다 하나씩 로드됨)
+#   스레드를 늘리면 페이지 하나의 추론이 빨라짐
+# 기본값은 코어를 4개씩 묶어 프로세스로 나눔 (예: 32코어 → 8프로세스 × 4스레드)
+_CPU_COUNT = os.cpu_count() or 1
+OCR_CPU_THREADS = max(1, int(os.environ.get("OCR_CPU_THREADS", str(min(4, _CPU_COUNT)))))
+OCR_CPU_WORKERS = max(1, int(os.environ.get("OCR_CPU_WORKERS", str(max(1, _CPU_COUNT // OCR_CPU_THREADS)))))
+
+# 남은 페이지가 이 수 이상인 문서만 여러 워커로 나눠 처리 (CPU 모드)
+OCR_SHARD_MIN_PAGES = int(os.environ.get("OCR_SHARD_MIN_PAGES", "4"))
+
+
+# ============================================================
+# 워커 프로세스 측 코드
+# ============================================================
+
+_worker_service = None
+_worker_load_time = 0.0
+
+
+def _init_worker(cpu_threads: int = None):
+    """워커 프로세스 시작 시 OCR 파이프라인을 한 번만 로드"""
+    global _worker_service, _worker_load_time
+    if cpu_threads:
+        # 워커 여러 개가 각자 모든 코어를 쓰려고 경쟁하지 않도록 연산 스레드 수 제한
+        for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "OMP_THREAD_LIMIT"):
+            os.environ[var] = str(cpu_threads)
+    from ocr_service import OCRService
+
+    start_time = time.time()
+    _worker_service = OCRService(cpu_threads=cpu_threads)
+    _worker_service._ensure_loaded()
+    _worker_load_time = time.time() - start_time
+    print(f"✓ OCR 워커 준비 완료 (pid={os.getpid()}, 로드 시간: {_worker_load_time:.2f}초)")
+
+
+def _worker_ping():
+    """워커의 warm 상태 보고"""
+    return {
+        "pid": os.getpid(),
+        "loaded": _worker_service is not None and _worker_service._is_loaded,
+        "load_time": _worker_load_time,
+    }
+
+
+def _worker_call(method: str, args: tuple, options: dict, progress_queue=None):
+    """워커에서 OCRService 메서드 실행 (파이프라인은 유지)
+
+    Returns:
+        tuple: (워커 pid, 결과, 단계별 소요 시간)
+    """
+    if progress_queue is not None:
+        # 페이지 진행 상황은 큐를 통해 메인 프로세스로 전달
+        options = dict(options, on_page=lambda *event: progress_queue.put(event))
+    result = getattr(_worker_service, method)(*args, **options)
+    return os.getpid(), result, dict(_worker_service.stage_times)
+
+
+# ============================================================
+# 메인 프로세스 측 코드
+# ============================================================
+
+class OCRWorkerPool:
+    """warm 상태의 OCR 워커 프로세스 풀 - 유휴 시간 초과 시 자동 언로드"""
+
+    def __init__(self, num_workers: int = None, idle_timeout: float = OCR_POOL_IDLE_TIMEOUT,
+                 cpu_threads: int = None, device: str = None):
+        """
+        Args:
+            num_workers: 워커 프로세스 수 (None이면 GPU는 OCR_POOL_WORKERS, CPU는 OCR_CPU_WORKERS)
+            idle_timeout: 유휴 언로드까지의 시간(초), 0 이하이면 언로드하지 않음
+            cpu_threads: CPU 모드에서 워커당 연산 스레드 수 (None이면 OCR_CPU_THREADS)
+            device: 추론 장치 (None이면 ocr_service.OCR_DEVICE)
+        """
+        if device is None:
+            from ocr_service import OCR_DEVICE
+            device = OCR_DEVICE
+
+        self.device = device
+        # CPU 노드에서는 한 문서의 페이지를 여러 워커로 나눠 처리
+        self.cpu_mode = device == "cpu"
+        if num_workers is None:
+            num_workers = OCR_CPU_WORKERS if self.cpu_mode else OCR_POOL_WORKERS
+        self.num_workers = max(1, num_workers)
+        self.cpu_threads = (cpu_threads or OCR_CPU_THREADS) if self.cpu_mode else None
+        self.idle_timeout = idle_timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self._last_used = None
+        self._started_at = None
+        self._warm_workers = {}
+        self._monitor = None
+        self._manager = None
+        self._stats = {
+            "pool_starts": 0,
+            "idle_unloads": 0,
+            "tasks_completed": 0,
+            "tasks_failed": 0,
+            "total_task_time": 0.0,
+            "sharded_documents": 0,
+            "broken_pools": 0,
+            "stage_times": {},
+        }
+
+    def _start_locked(self):
+        """워커 풀 시작 (lock 보유 상태에서 호출)"""
+        threads = f", threads/worker={self.cpu_threads}" if self.cpu_mode else ""
+        print(f"🚀 OCR 워커 풀 시작 (device={self.device}, workers={self.num_workers}{threads})")
+        # CUDA/Paddle은 fork 이후 안전하지 않으므로 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.cpu_threads,),
+        )
+        self._started_at = time.time()
+        # 시작 후 한 번도 사용하지 않은 풀도 유휴 시간 초과 시 언로드되도록 시작 시각부터 계산
+        self._last_used = self._started_at
+        self._warm_workers = {}
+        self._stats["pool_starts"] += 1
+
+        # 워커를 미리 띄워 모델을 로드해 둠
+        for _ in range(self.num_workers):
+            self._executor.submit(_worker_ping).add_done_callback(self._record_ping)
+
+        if self.idle_timeout and self.idle_timeout > 0 and self._monitor is None:
+            self._monitor = threading.Thread(target=self._idle_monitor, daemon=True)
+            self._monitor.start()
+
+    def _record_ping(self, future):
+        """워커 ping 결과 기록"""
+        try:
+            info = future.result()
+        except Exception:
+            return
+        with self._lock:
+            self._warm_workers[info["pid"]] = info
+
+    def _idle_monitor(self):
+        """유휴 시간 초과 시 워커 풀 종료"""
+        interval = max(1.0, min(self.idle_timeout / 4, 30.0))
+        while True:
+            time.sleep(interval)
+            executor = None
+            with self._lock:
+                if (self._executor is not None and self._inflight == 0 and self._last_used is not None
+                        and time.time() - self._last_used >= self.idle_timeout):
+                    executor = self._executor
+                    self._executor = None
+                    self._warm_workers = {}
+                    self._stats["idle_unloads"] += 1
+            if executor is not None:
+                print(f"🧹 OCR 워커 풀 유휴 시간 초과 ({self.idle_timeout:.0f}초) - 모델 언로드")
+                executor.shutdown(wait=True)
+
+    def _discard_broken(self, executor):
+        """워커가 비정상 종료(OOM, segfault, 모델 로드 실패)되어 깨진 풀 폐기 - 다음 작업에서 새로 시작"""
+        with self._lock:
+            if self._executor is not executor:
+                # 이미 다른 작업이 폐기했거나 새 풀로 교체됨
+                return
+            self._executor = None
+            self._warm_workers = {}
+            self._stats["broken_pools"] += 1
+        print(f"⚠️ OCR 워커 프로세스 비정상 종료 - 워커 풀 폐기 후 다시 시작")
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        """워커 풀을 미리 시작 (warm-up)"""
+        with self._lock:
+            if self._executor is None:
+                self._start_locked()
+
+    def _progress_queue(self):
+        """워커 → 메인 프로세스 진행 상황 전달용 큐 (Manager는 처음 필요할 때 시작)"""
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.get_context("spawn").Manager()
+            return self._manager.Queue()
+
+    @staticmethod
+    def _drain_progress(progress_queue, future, on_page):
+        """작업이 끝날 때까지 진행 상황 큐를 비우며 콜백 호출"""
+        while True:
+            try:
+                event = progress_queue.get(timeout=0.2)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            except (EOFError, OSError):
+                break
+            try:
+                on_page(*event)
+            except Exception as e:
+                print(f"⚠️ OCR 진행 콜백 오류: {e}")
+
+    def submit(self, pdf_path: str, on_page=None, **options):
+        """PDF OCR 작업 제출
+
+        Args:
+            pdf_path: PDF 파일 경로
+            on_page: 페이지가 끝날 때마다 메인 프로세스에서 호출되는 콜백 (페이지 데이터, 완료 수, 전체 수)
+            **options: OCRService.extract_text_from_pdf 로 전달할 옵션
+
+        Returns:
+            concurrent.futures.Future: 결과는 (전체 텍스트, 페이지별 데이터)
+        """
+        return self._submit("extract_text_from_pdf", (pdf_path,), on_page, options)
+
+    def submit_batch(self, pdf_paths: list, on_page=None, **options):
+        """여러 PDF를 한 워커에서 페이지 배치로 처리하도록 제출
+
+        Args:
+            pdf_paths: PDF 파일 경로 목록
+            on_page: 페이지 완료 콜백 (문서 인덱스, 페이지 데이터, 완료 수, 전체 수)
+            **options: OCRService.extract_batch 로 전달할 옵션 (batch_size 등)
+
+        Returns:
+            concurrent.futures.Future: 결과는 문서별 (전체 텍스트, 페이지별 데이터) 목록
+        """
+        return self._submit("extract_batch", (list(pdf_paths),), on_page, options)
+
+    def _submit(self, method: str, args: tuple, on_page, options: dict, retry: bool = True):
+        """워커 풀에 OCRService 메서드 호출 제출
+
+        워커 풀이 깨져 있으면 (BrokenProcessPool) 풀을 새로 시작해 다시 제출하고,
+        retry 이면 작업 도중 워커가 죽었을 때도 새 풀에서 한 번 재시도
+        """
+        progress_queue = self._progress_queue() if on_page is not None else None
+
+        for _ in range(2):
+            with self._lock:
+                if self._executor is None:
+                    self._start_locked()
+                executor = self._executor
+                try:
+                    inner = executor.submit(_worker_call, method, args, options, progress_queue)
+                except BrokenProcessPool:
+                    inner = None
+                else:
+                    self._inflight += 1
+                    self._last_used = time.time()
+            if inner is not None:
+                break
+            self._discard_broken(executor)
+        else:
+            raise RuntimeError("OCR 워커 풀을 시작할 수 없습니다 (워커 프로세스가 비정상 종료됨)")
+
+        drain_thread = None
+        if progress_queue is not None:
+            drain_thread = threading.Thread(
+                target=self._drain_progress, args=(progress_queue, inner, on_page), daemon=True
+            )
+            drain_thread.start()
+
+        submitted_at = time.time()
+        # 작업 중 워커가 죽으면 새 풀에서 한 번 재시도
+        resubmit = (lambda: self._submit(method, args, on_page, options, retry=False)) if retry else None
+        outer = _UnwrapFuture(inner, drain_thread, resubmit)
+
+        def _on_done(future):
+            if isinstance(future.exception(), BrokenProcessPool):
+                self._discard_broken(executor)
+            with self._lock:
+                self._inflight -= 1
+                self._last_used = time.time()
+                self._stats["total_task_time"] += time.time() - submitted_at
+                if future.exception() is None:
+                    self._stats["tasks_completed"] += 1
+                    pid, _, stage_times = future.result()
+                    for stage, value in stage_times.items():
+                        self._stats["stage_times"][stage] = self._stats["stage_times"].get(stage, 0) + value
+                    self._warm_workers.setdefault(pid, {"pid": pid, "loaded": True, "load_time": None})
+                else:
+                    self._stats["tasks_failed"] += 1
+
+        inner.add_done_callback(_on_done)
+        return outer
+
+    def extract_text_from_pdf(self, pdf_path: str, on_page=None, **options) -> tuple:
+        """PDF에서 텍스트 추출 (워커 풀에서 실행, 완료까지 대기)
+
+        CPU 모드에서는 페이지를 연속 구간으로 나눠 여러 워커에서 동시에 처리한 뒤 페이지 순서대로 합침
+
+        Returns:
+            tuple[str, list[dict]]: (전체 텍스트, 페이지별 데이터)
+        """
+        shards = self._plan_shards(pdf_path, options)
+        if len(shards) <= 1:
+            return self.submit(pdf_path, on_page=on_page, **options).result()
+        return self._extract_sharded(pdf_path, shards, on_page, options)
+
+    def _plan_shards(self, pdf_path: str, options: dict) -> list:
+        """문서를 워커 수만큼 연속된 페이지 구간으로 분할 (분할하지 않으면 빈 목록)"""
+        if not self.cpu_mode or self.num_workers <= 1 or options.get("pages"):
+            return []
+
+        from ocr_service import get_pdf_page_count
+        try:
+            page_count = get_pdf_page_count(pdf_path)
+        except Exception as e:
+            print(f"⚠️ 페이지 수 조회 실패, 분할 없이 처리: {e}")
+            return []
+
+        completed = options.get("completed_pages") or {}
+        remaining = [p for p in range(1, page_count + 1) if p not in completed]
+        if len(remaining) < max(2, OCR_SHARD_MIN_PAGES):
+            return []
+
+        # 남은 페이지를 워커 수만큼 고르게 나눔 (렌더링 효율을 위해 구간은 연속된 페이지로 구성)
+        num_shards = min(self.num_workers, len(remaining))
+        size, extra = divmod(len(remaining), num_shards)
+        shards, start = [], 0
+        for index in range(num_shards):
+            end = start + size + (1 if index < extra else 0)
+            shards.append(remaining[start:end])
+            start = end
+        return shards
+
+    def _extract_sharded(self, pdf_path: str, shards: list, on_page, options: dict) -> tuple:
+        """페이지 구간별로 워커에 제출하고 결과를 페이지 순서대로 합침"""
+        from ocr_service import build_full_text
+
+        completed = options.get("completed_pages") or {}
+        total = len(completed) + sum(len(shard) for shard in shards)
+        print(f"🧩 CPU 분할 처리: {sum(len(shard) for shard in shards)}페이지 → 워커 {len(shards)}개")
+        with self._lock:
+            self._stats["sharded_documents"] += 1
+
+        progress_lock = threading.Lock()
+        shard_done = [0] * len(shards)
+
+        def _shard_callback(index):
+            if on_page is None:
+                return None
+
+            def callback(entry, done, shard_total):
+                # 구간별 완료 수를 문서 전체 기준으로 환산
+                # 구간마다 결과 수집 스레드가 따로 있으므로 on_page(체크포인트 저장 등)는 한 번에 하나씩만 호출
+                with progress_lock:
+                    shard_done[index] = done
+                    on_page(entry, len(completed) + sum(shard_done), total)
+            return callback
+
+        futures = []
+        for index, shard in enumerate(shards):
+            shard_options = dict(options, pages=shard, completed_pages=None)
+            futures.append(self.submit(pdf_path, on_page=_shard_callback(index), **shard_options))
+
+        pages = dict(completed)
+        for future in futures:
+            full_text, page_data = future.result()
+            if not page_data and full_text == "OCR not available":
+                return full_text, []
+            for entry in page_data:
+                pages[entry["page"]] = entry
+
+        page_data = [pages[page_num] for page_num in sorted(pages)]
+        return build_full_text(page_data), page_data
+
+    def extract_batch(self, pdf_paths: list, on_page=None, **options) -> list:
+        """여러 PDF에서 텍스트 추출 (페이지 배치 처리, 완료까지 대기)
+
+        Returns:
+            list[tuple[str, list[dict]]]: 입력 순서대로 (전체 텍스트, 페이지별 데이터)
+        """
+        return self.submit_batch(pdf_paths, on_page=on_page, **options).result()
+
+    def status(self) -> dict:
+        """워커 풀 상태 (warm 여부, 작업 수, 유휴 시간, 단계별 소요 시간)"""
+        from ocr_service import OCR_PREFETCH_PAGES
+        from rasterizers import OCR_RASTERIZER
+
+        with self._lock:
+            now = time.time()
+            completed = self._stats["tasks_completed"]
+            stage_times = self._stats["stage_times"]
+            ocr_pages = stage_times.get("pages", 0)
+            return {
+                "running": self._executor is not None,
+                "device": self.device,
+                "num_workers": self.num_workers,
+                "cpu_threads": self.cpu_threads,
+                "warm_workers": len([w for w in self._warm_workers.values() if w.get("loaded")]),
+                "workers": list(self._warm_workers.values()),
+                "inflight": self._inflight,
+                "idle_timeout": self.idle_timeout,
+                "idle_seconds": round(now - self._last_used, 1) if self._last_used else None,
+                "uptime_seconds": round(now - self._started_at, 1) if self._executor is not None else 0,
+                "pool_starts": self._stats["pool_starts"],
+                "idle_unloads": self._stats["idle_unloads"],
+                "tasks_completed": completed,
+                "tasks_failed": self._stats["tasks_failed"],
+                "avg_task_time": round(self._stats["total_task_time"] / completed, 3) if completed else None,
+                "sharded_documents": self._stats["sharded_documents"],
+                "broken_pools": self._stats["broken_pools"],
+                # 누적 단계별 시간 - wait 비중이 크면 렌더링이, 작으면 추론이 병목
+                "stage_seconds": {
+                    stage: round(stage_times.get(stage, 0.0), 2) for stage in ("render", "preprocess", "predict", "wait")
+                },
+                "ocr_pages": ocr_pages,
+                "embedded_image_pages": stage_times.get("embedded", 0),
+                "avg_predict_ms_per_page": round(stage_times["predict"] / ocr_pages * 1000, 1)
+                if ocr_pages else None,
+                # 전처리로 절감한 양 (추론하지 않은 빈 페이지 수, 축소/빈 페이지로 줄어든 픽셀 수)
+                "blank_pages_skipped": stage_times.get("blank", 0),
+                "pixels_saved": stage_times.get("pixels_saved", 0),
+                "page_cache": _page_cache_summary(stage_times),
+                "prefetch_pages": OCR_PREFETCH_PAGES,
+                "rasterizer": OCR_RASTERIZER,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """워커 풀 종료"""
+        with self._lock:
+            executor = self._executor
+            manager = self._manager
+            self._executor = None
+            self._manager = None
+            self._warm_workers = {}
+        if executor is not None:
+            print(f"🧹 OCR 워커 풀 종료")
+            executor.shutdown(wait=wait)
+        if manager is not None:
+            manager.shutdown()
+
+
+def _page_cache_summary(stage_times: dict) -> dict:
+    """워커들의 페이지 캐시 적중 수를 합산한 적중률"""
+    hits = stage_times.get("page_cache_hits", 0)
+    misses = stage_times.get("page_cache_misses", 0)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        # 같은 배치 안의 중복 페이지 (캐시가 아니라 배치 추론 결과를 나눠 씀)
+        "batch_duplicates": stage_times.get("page_duplicates", 0),
+    }
+
+
+class _UnwrapFuture:
+    """워커 결과 (pid, result, stage_times) 에서 result만 꺼내 주는 Future 래퍼"""
+
+    def __init__(self, inner, drain_thread=None, resubmit=None):
+        self._inner = inner
+        self._drain_thread = drain_thread
+        # 워커 비정상 종료 시 같은 작업을 새 풀에 다시 제출하는 함수 (None이면 재시도하지 않음)
+        self._resubmit = resubmit
+
+    def result(self, timeout=None):
+        try:
+            result = self._inner.result(timeout)[1]
+        except BrokenProcessPool as e:
+            if self._resubmit is None:
+                raise RuntimeError("OCR 워커 프로세스가 비정상 종료되었습니다 "
+                                   "(메모리 부족 또는 모델 로드 실패) - 잠시 후 다시 시도하세요") from e
+            print(f"🔁 OCR 워커 비정상 종료 - 새 워커 풀에서 재시도")
+            return self._resubmit().result(timeout)
+        # 마지막 페이지 콜백까지 처리된 뒤에 결과 반환
+        if self._drain_thread is not None:
+            self._drain_thread.join()
+        return result
+
+    def done(self):
+        return self._inner.done()
+
+    def exception(self, timeout=None):
+        return self._inner.exception(timeout)
+
+    def add_done_callback(self, fn):
+        self._inner.add_done_callback(lambda _: fn(self))
+
+
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+
+
+def get_ocr_pool() -> OCRWorkerPool:
+    """프로세스 전역 OCR 워커 풀 반환"""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = OCRWorkerPool()
+        return _ocr_pool
+
+
+def shutdown_ocr_pool():
+    """서버 종료 시 워커 풀 정리"""
+    with _ocr_pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown()
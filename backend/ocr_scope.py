@@ -0,0 +1,115 @@
+"""
+분류용 부분 OCR
+분류 모델은 문서 앞부분만 보므로 (BERT 512토큰, Gemma 800자) 앞쪽 N페이지 또는 충분한 글자 수가 모일 때까지만
+OCR 하고 바로 분류를 진행 - 나머지 페이지는 백그라운드 작업이나 요청 시 이어서 처리
+
+pdf_documents.ocr_state 로 부분(PARTIAL) / 전체(FULL) OCR 상태를 관리
+"""
+import os
+import threading
+
+from ocr_service import build_full_text, get_pdf_page_count
+from ocr_text import PARTIAL_CONFIG_SUFFIX
+
+
+# OCR 범위
+#   "full":      전체 페이지 (기존 방식)
+#   "classify":  분류에 필요한 앞쪽 페이지만 처리하고 나머지는 나중에 처리
+#   "remainder": 부분 OCR 문서의 나머지 페이지 처리 (완료된 페이지는 체크포인트에서 재사용, 분류 상태 유지)
+OCR_SCOPE_FULL = "full"
+OCR_SCOPE_CLASSIFY = "classify"
+OCR_SCOPE_REMAINDER = "remainder"
+OCR_SCOPES = (OCR_SCOPE_FULL, OCR_SCOPE_CLASSIFY, OCR_SCOPE_REMAINDER)
+
+# 요청에서 범위를 지정하지 않았을 때의 기본값
+OCR_SCOPE = os.environ.get("OCR_SCOPE", OCR_SCOPE_FULL)
+
+# 분류용 OCR: 한 번에 처리할 앞쪽 페이지 수 / 목표 글자 수 / 최대 페이지 수
+OCR_CLASSIFY_PAGES = int(os.environ.get("OCR_CLASSIFY_PAGES", "3"))
+OCR_CLASSIFY_MIN_CHARS = int(os.environ.get("OCR_CLASSIFY_MIN_CHARS", "1500"))
+OCR_CLASSIFY_MAX_PAGES = int(os.environ.get("OCR_CLASSIFY_MAX_PAGES", "10"))
+
+# 분류용 OCR 후 나머지 페이지를 백그라운드 작업으로 바로 이어서 처리할지 여부 (False면 요청 시에만 처리)
+OCR_LAZY_REMAINDER = os.environ.get("OCR_LAZY_REMAINDER", "1") == "1"
+
+# pdf_documents.ocr_state 값
+OCR_STATE_PARTIAL = "PARTIAL"
+OCR_STATE_FULL = "FULL"
+
+_columns_ready = False
+_columns_lock = threading.Lock()
+
+
+def resolve_scope(scope: str = None) -> str:
+    """요청 범위 확인 (없으면 서버 기본값, 알 수 없는 값이면 ValueError)"""
+    scope = scope or OCR_SCOPE
+    if scope not in OCR_SCOPES:
+        raise ValueError(f"알 수 없는 OCR 범위: {scope} (지원: {', '.join(OCR_SCOPES)})")
+    return scope
+
+
+def partial_config_key(config_key: str) -> str:
+    """부분 결과의 ocr_results.ocr_config - 전체 결과 캐시 조회에 걸리지 않도록 구분"""
+    return config_key + PARTIAL_CONFIG_SUFFIX
+
+
+def ensure_ocr_state_columns(cur):
+    """pdf_documents 에 OCR 범위 상태 컬럼 추가 (프로세스당 한 번만 실행)"""
+    global _columns_ready
+    with _columns_lock:
+        if _columns_ready:
+            return
+
+        cur.execute("""
+            ALTER TABLE pdf_documents
+            ADD COLUMN IF NOT EXISTS ocr_state VARCHAR(20),
+            ADD COLUMN IF NOT EXISTS ocr_pages_done INTEGER
+        """)
+        _columns_ready = True
+
+
+def extract_classification_pages(pool, pdf_path: str, on_page=None, completed_pages: dict = None,
+                                 **options) -> tuple:
+    """분류에 필요한 앞쪽 페이지만 OCR
+
+    OCR_CLASSIFY_PAGES 페이지씩 앞에서부터 처리하다가 글자 수가 OCR_CLASSIFY_MIN_CHARS 이상이 되거나
+    OCR_CLASSIFY_MAX_PAGES 에 도달하면 중단
+
+    Args:
+        pool: OCR 워커 풀 (extract_text_from_pdf 제공)
+        completed_pages: 이미 처리된 페이지 {페이지 번호: 페이지 데이터} - 결과에 포함되고 다시 처리하지 않음
+
+    Returns:
+        tuple[str, list[dict], int]: (전체 텍스트, 페이지별 데이터, 문서 전체 페이지 수)
+    """
+    page_count = get_pdf_page_count(pdf_path)
+    last_page = min(page_count, max(1, OCR_CLASSIFY_MAX_PAGES))
+    pages = dict(completed_pages or {})
+
+    def _collected_chars() -> int:
+        return sum(len(pages[p].get("text", "")) for p in pages if p <= last_page)
+
+    next_page = 1
+    while next_page <= last_page and _collected_chars() < OCR_CLASSIFY_MIN_CHARS:
+        chunk = [p for p in range(next_page, min(next_page + max(1, OCR_CLASSIFY_PAGES), last_page + 1))
+                 if p not in pages]
+        next_page += max(1, OCR_CLASSIFY_PAGES)
+        if not chunk:
+            continue
+
+        chunk_callback = None
+        if on_page is not None:
+            collected = len(pages)
+
+            def chunk_callback(entry, done, total, collected=collected):
+                # 구간별 진행률을 분류용 OCR 범위(최대 last_page 페이지) 기준으로 환산
+                on_page(entry, min(collected + done, last_page), last_page)
+
+        _, page_data = pool.extract_text_from_pdf(pdf_path, on_page=chunk_callback, completed_pages=pages,
+                                                  pages=chunk, **options)
+        for entry in page_data:
+            pages[entry["page"]] = entry
+
+    page_data = [pages[p] for p in sorted(pages)]
+    print(f"🎯 분류용 OCR: {len(page_data)}/{page_count}페이지, {_collected_chars()}자")
+    return build_full_text(page_data), page_data, page_count
@@ -1,46 +1,473 @@
 """
 PDF OCR 처리 서비스
-PaddleOCRVL을 사용하여 PDF에서 텍스트 추출
+PDF 텍스트 레이어와 OCR 엔진(기본 PaddleOCRVL, ocr_engines 참고)을 사용하여 PDF에서 텍스트 추출
 """
 import os
 import gc
-from pathlib import Path
-import json
+import time
+import queue
+import threading
+from io import BytesIO
+from PyPDF2 import PdfReader
+from PyPDF2.generic import ArrayObject, ContentStream
 
 try:
-    from paddleocr import PaddleOCRVL
-    import paddle
-    from pdf2image import convert_from_path
-    PADDLEOCR_AVAILABLE = True
+    from PIL import Image, ImageStat
 except ImportError:
-    PADDLEOCR_AVAILABLE = False
-    print("⚠️ PaddleOCR not available. OCR features will be disabled.")
+    Image = ImageStat = None
 
-# Export alias for compatibility with test_services.py
-OCR_AVAILABLE = PADDLEOCR_AVAILABLE
+from rasterizers import get_rasterizer
+from ocr_page_cache import OCR_PAGE_CACHE_ENABLED, get_page_cache, page_image_hash
+# OCR_DEVICE 는 ocr_pool 에서 ocr_service 를 통해 가져다 씀
+from ocr_engines import (
+    OCR_DEVICE, OCR_ENGINE, ENGINE_PADDLEOCR_VL, available_engines, resolve_engine, create_engine,
+)
 
-from tempfile import NamedTemporaryFile
+# 사용할 수 있는 OCR 엔진이 하나라도 있는지 (test_services.py, routes.py 호환용)
+OCR_AVAILABLE = bool(available_engines())
 
 
-# PaddleOCRVL 설정
-PADDLEOCR_CONFIG = {
-    "use_doc_orientation_classify": False,
-    "use_doc_unwarping": False,
-    "use_layout_detection": False,
-    "use_chart_recognition": False,
-    "device": "gpu:0" if PADDLEOCR_AVAILABLE else "cpu",
+PDF_DPI = 100
+
+# 한 번에 렌더링할 페이지 수 - 페이지 수와 무관하게 메모리 사용량을 일정하게 유지
+PDF_RENDER_WINDOW = 1
+
+# 페이지 전체가 이미지 한 장인 스캔 페이지는 렌더링하지 않고 PDF에 내장된 이미지를 그대로 사용
+OCR_EMBEDDED_IMAGES = True
+
+# 내장 이미지가 페이지 면적의 이 비율 이상을 덮어야 페이지 전체 이미지로 판단
+EMBEDDED_IMAGE_MIN_COVERAGE = 0.9
+
+# OCR 전 페이지 전처리 (빈 페이지 건너뛰기, 그레이스케일 변환, 해상도 상한)
+OCR_PREPROCESS = True
+OCR_GRAYSCALE = True
+
+# 긴 변이 이 픽셀 수를 넘는 페이지는 축소 (200 DPI A4 의 긴 변은 약 2340px)
+OCR_MAX_PAGE_SIDE = int(os.environ.get("OCR_MAX_PAGE_SIDE", "2400"))
+
+# 빈 페이지 판단 기준 (BLANK_PAGE_THUMBNAIL px 썸네일의 밝기 표준편차 / 배경보다 어두운 픽셀 비율)
+BLANK_PAGE_THUMBNAIL = 512
+BLANK_PAGE_MAX_STDDEV = 3.0
+BLANK_PAGE_MAX_INK_RATIO = 0.0003
+
+# 추론 중에 백그라운드 스레드가 미리 렌더링해 둘 최대 페이지 수 (0이면 렌더링과 추론을 순차 실행)
+OCR_PREFETCH_PAGES = int(os.environ.get("OCR_PREFETCH_PAGES", "4"))
+
+# 한 번의 추론에 넣을 페이지 수 (단일 문서 / 여러 문서 배치 처리)
+OCR_PAGE_BATCH_SIZE = 1
+OCR_BATCH_SIZE = int(os.environ.get("OCR_BATCH_SIZE", "4"))
+
+# DPI 처리 방식
+#   "fixed":    모든 페이지를 PDF_DPI 로 렌더링
+#   "adaptive": OCR_ADAPTIVE_LOW_DPI 로 먼저 OCR 하고, 결과가 부실한 페이지만 OCR_ADAPTIVE_HIGH_DPI 로 다시 처리
+OCR_DPI_MODE = os.environ.get("OCR_DPI_MODE", "fixed")
+OCR_ADAPTIVE_LOW_DPI = 72
+OCR_ADAPTIVE_HIGH_DPI = 200
+
+# 부실한 OCR 결과 판단 기준 (글자 수 / 품질 점수 / 인식 신뢰도)
+OCR_ADAPTIVE_MIN_CHARS = 30
+OCR_ADAPTIVE_MIN_QUALITY = 0.7
+OCR_ADAPTIVE_MIN_CONFIDENCE = 0.8
+
+# 텍스트 레이어 처리 방식
+#   "hybrid": 페이지별로 PDF 텍스트 레이어를 먼저 확인하고, 없거나 깨진 페이지만 OCR
+#   "ocr":    모든 페이지를 렌더링 후 OCR
+OCR_TEXT_LAYER_MODE = "hybrid"
+
+# 텍스트 레이어를 그대로 쓰기 위한 최소 글자 수 / 최소 품질 점수 (0~1)
+TEXT_LAYER_MIN_CHARS = 20
+TEXT_LAYER_MIN_QUALITY = 0.8
+
+# 텍스트 레이어를 그대로 쓴 페이지의 엔진 이름 (page_data 의 "engine", ocr_results.ocr_engine)
+ENGINE_TEXT_LAYER = "PyPDF2"
+
+
+def text_quality(text: str) -> float:
+    """추출된 텍스트의 품질 점수 (0~1)
+
+    한글 음절, 영문/숫자, 일반 문장부호의 비율로 계산하고
+    깨진 문자(U+FFFD, 사설 영역, 제어 문자, 낱자모, "(cid:n)" 토큰)는 감점
+    """
+    if not text:
+        return 0.0
+
+    chars = [ch for ch in text if not ch.isspace()]
+    if not chars:
+        return 0.0
+
+    good = 0
+    for ch in chars:
+        code = ord(ch)
+        if (0xAC00 <= code <= 0xD7A3          # 한글 음절
+                or ch.isascii() and ch.isprintable()
+                or 0x4E00 <= code <= 0x9FFF   # 한자
+                or ch in "·ㆍ「」『』【】〈〉《》○●□■△▲※∼～–—‘’“”…"):
+            good += 1
+
+    # "(cid:123)" 은 글꼴 매핑 실패로 ASCII 로 보이지만 실제로는 깨진 글자
+    broken = text.count("(cid:") * 6
+    return max(0.0, (good - broken) / len(chars))
+
+
+def is_text_layer_usable(text: str) -> bool:
+    """텍스트 레이어를 OCR 대신 사용할 수 있는지 판단"""
+    stripped = (text or "").strip()
+    if len(stripped) < TEXT_LAYER_MIN_CHARS:
+        return False
+    return text_quality(stripped) >= TEXT_LAYER_MIN_QUALITY
+
+
+def extract_text_layer(pdf_path: str, pages: set = None):
+    """PyPDF2로 페이지별 텍스트 레이어 추출
+
+    Args:
+        pdf_path: PDF 파일 경로
+        pages: 추출할 페이지 번호 집합 (None이면 전체, 나머지 페이지는 빈 문자열)
+
+    Returns:
+        list[str] | None: 페이지별 텍스트 (PDF를 읽을 수 없으면 None)
+    """
+    try:
+        reader = PdfReader(pdf_path)
+    except Exception as e:
+        print(f"⚠️ 텍스트 레이어 읽기 실패: {e}")
+        return None
+
+    texts = []
+    for page_num, page in enumerate(reader.pages, 1):
+        if pages is not None and page_num not in pages:
+            texts.append("")
+            continue
+        try:
+            texts.append(page.extract_text() or "")
+        except Exception:
+            texts.append("")
+    return texts
+
+
+def is_ocr_output_poor(text: str, confidence: float = None) -> bool:
+    """OCR 결과가 높은 DPI로 다시 처리할 만큼 부실한지 판단
+
+    글자 수가 적거나, 깨진 문자가 많거나, 엔진이 보고한 인식 신뢰도가 낮으면 부실한 것으로 봄
+    """
+    stripped = (text or "").strip()
+    if len(stripped) < OCR_ADAPTIVE_MIN_CHARS:
+        return True
+    if text_quality(stripped) < OCR_ADAPTIVE_MIN_QUALITY:
+        return True
+    if confidence is not None and confidence < OCR_ADAPTIVE_MIN_CONFIDENCE:
+        return True
+    return False
+
+
+def build_full_text(page_data: list) -> str:
+    """페이지별 데이터를 "[Page n]" 구분자가 붙은 전체 텍스트로 합침"""
+    return "".join(f"[Page {page['page']}]\n{page['text']}\n\n" for page in page_data)
+
+
+def summarize_engines(page_data: list) -> str:
+    """페이지별 엔진을 ocr_results.ocr_engine 에 저장할 문자열로 요약 (예: "PyPDF2+PaddleOCRVL")"""
+    engines = []
+    for page in page_data:
+        engine = page.get("engine", ENGINE_PADDLEOCR_VL)
+        if engine not in engines:
+            engines.append(engine)
+    return "+".join(engines) if engines else ENGINE_PADDLEOCR_VL
+
+
+def get_pdf_page_count(pdf_path: str) -> int:
+    """PDF 페이지 수 조회 (렌더링 없이 설정된 렌더링 백엔드 사용)"""
+    return get_rasterizer().page_count(pdf_path)
+
+
+def iter_pdf_pages(pdf_path: str, dpi: int = PDF_DPI, window: int = PDF_RENDER_WINDOW, pages: list = None):
+    """PDF 페이지를 window 단위로 렌더링하며 하나씩 반환하는 제너레이터
+
+    Args:
+        pdf_path: PDF 파일 경로
+        dpi: 렌더링 해상도
+        window: 한 번에 렌더링할 최대 페이지 수
+        pages: 렌더링할 페이지 번호 목록 (None이면 전체 페이지)
+
+    Yields:
+        tuple[int, PIL.Image.Image]: (1부터 시작하는 페이지 번호, 페이지 이미지)
+    """
+    window = max(1, window)
+    if pages is None:
+        pages = range(1, get_pdf_page_count(pdf_path) + 1)
+    pages = sorted(pages)
+
+    start = 0
+    while start < len(pages):
+        # 연속된 페이지끼리 window 단위로 묶어 한 번에 렌더링
+        end = start
+        while end + 1 < len(pages) and pages[end + 1] == pages[end] + 1 and end + 1 - start < window:
+            end += 1
+
+        first_page, last_page = pages[start], pages[end]
+        images = get_rasterizer().render(pdf_path, first_page, last_page, dpi)
+
+        page_num = first_page
+        while images:
+            # 리스트에서 꺼내 넘겨야 소비 측에서 처리 후 바로 해제됨
+            yield page_num, images.pop(0)
+            page_num += 1
+
+        start = end + 1
+
+
+# 내장 이미지 페이지에서 허용하는 콘텐츠 스트림 연산자
+# (그래픽 상태, 클리핑, 글자를 그리지 않는 텍스트 상태 연산만 허용 - 그 외의 그리기가 있으면 렌더링)
+_IMAGE_PAGE_OPERATORS = {
+    b"q", b"Q", b"cm", b"Do", b"gs", b"re", b"W", b"W*", b"n", b"w", b"J", b"j", b"M", b"d", b"ri", b"i",
+    b"BT", b"ET", b"Tf", b"TL", b"Tc", b"Tw", b"Tz", b"Td", b"TD", b"Tm", b"T*", b"Tr", b"Ts",
 }
 
-PDF_DPI = 100
+
+def _multiply_matrix(m1: list, m2: list) -> list:
+    """PDF 변환 행렬 곱 (m1 × m2)"""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return [
+        a1 * a2 + b1 * c2, a1 * b2 + b1 * d2,
+        c1 * a2 + d1 * c2, c1 * b2 + d1 * d2,
+        e1 * a2 + f1 * c2 + e2, e1 * b2 + f1 * d2 + f2,
+    ]
+
+
+def _full_page_image_xobject(reader, page):
+    """페이지에 그려지는 것이 페이지 전체를 덮는 이미지 XObject 하나뿐이면 그 객체 반환"""
+    resources = page.get("/Resources")
+    xobjects = resources.get("/XObject") if resources else None
+    if not xobjects or len(xobjects) != 1:
+        return None
+    name, xobject = next(iter(xobjects.items()))
+    xobject = xobject.get_object()
+    if xobject.get("/Subtype") != "/Image":
+        return None
+
+    contents = page.get_contents()
+    if contents is None:
+        return None
+
+    # 이미지가 그려질 때의 변환 행렬(CTM) 계산
+    ctm, stack, image_ctm = [1, 0, 0, 1, 0, 0], [], None
+    for operands, operator in ContentStream(contents, reader).operations:
+        if operator not in _IMAGE_PAGE_OPERATORS:
+            return None
+        if operator == b"q":
+            stack.append(ctm)
+        elif operator == b"Q":
+            ctm = stack.pop() if stack else ctm
+        elif operator == b"cm":
+            ctm = _multiply_matrix([float(x) for x in operands], ctm)
+        elif operator == b"Do":
+            if image_ctm is not None or operands[0] != name:
+                return None
+            image_ctm = ctm
+    if image_ctm is None:
+        return None
+
+    # 회전/반전 없이 페이지 대부분을 덮는 경우만 사용
+    a, b, c, d, _, _ = image_ctm
+    if abs(b) > 1e-3 or abs(c) > 1e-3 or a <= 0 or d <= 0:
+        return None
+    box = page.cropbox
+    page_area = float(box.width) * float(box.height)
+    if page_area <= 0 or a * d / page_area < EMBEDDED_IMAGE_MIN_COVERAGE:
+        return None
+    return xobject
+
+
+def _decode_image_xobject(xobject, target_size: tuple):
+    """이미지 XObject 디코딩 - JPEG은 디코딩 단계에서 target_size 근처까지 축소"""
+    if xobject.get("/ImageMask") or "/SMask" in xobject or "/Mask" in xobject or "/Decode" in xobject:
+        return None
+
+    filters = xobject.get("/Filter")
+    if filters is None:
+        filters = []
+    elif not isinstance(filters, ArrayObject):
+        filters = [filters]
+    last_filter = filters[-1] if filters else None
+
+    # ASCII85 등 앞단 필터는 풀리고 DCT/JPX 데이터는 압축된 원본 그대로 반환됨
+    data = xobject.get_data()
+
+    if last_filter in ("/DCTDecode", "/JPXDecode"):
+        image = Image.open(BytesIO(data))
+        if last_filter == "/DCTDecode":
+            image.draft(None, target_size)
+        image.load()
+        return image
+
+    if last_filter not in (None, "/FlateDecode", "/LZWDecode"):
+        return None
+
+    color_space = xobject.get("/ColorSpace")
+    if isinstance(color_space, ArrayObject) and color_space[0] == "/ICCBased":
+        components = color_space[1].get_object().get("/N")
+        color_space = {1: "/DeviceGray", 3: "/DeviceRGB"}.get(components)
+    mode = {"/DeviceGray": "L", "/DeviceRGB": "RGB"}.get(color_space)
+    bits = xobject.get("/BitsPerComponent", 8)
+    if mode is None or bits not in (1, 8) or bits == 1 and mode != "L":
+        return None
+
+    size = (int(xobject["/Width"]), int(xobject["/Height"]))
+    if bits == 1:
+        return Image.frombytes("1", size, data).convert("L")
+    return Image.frombytes(mode, size, data)
+
+
+def extract_page_image(reader, page_num: int, dpi: int = PDF_DPI):
+    """페이지 전체를 덮는 내장 이미지 한 장을 렌더링 없이 꺼냄
+
+    렌더링한 결과보다 해상도가 높으면 dpi 에 맞춰 축소하고, 낮으면 원본 해상도 그대로 사용
+
+    Args:
+        reader: PdfReader
+        page_num: 1부터 시작하는 페이지 번호
+        dpi: 목표 해상도
+
+    Returns:
+        PIL.Image.Image | None: 단일 이미지 페이지가 아니거나 디코딩할 수 없으면 None (렌더링으로 처리)
+    """
+    try:
+        page = reader.pages[page_num - 1]
+        xobject = _full_page_image_xobject(reader, page)
+        if xobject is None:
+            return None
+
+        rotate = int(page.get("/Rotate", 0) or 0) % 360
+        box = page.cropbox
+        width, height = float(box.width) / 72 * dpi, float(box.height) / 72 * dpi
+        if rotate in (90, 270):
+            width, height = height, width
+        target_size = (max(1, round(width)), max(1, round(height)))
+
+        image = _decode_image_xobject(xobject, target_size)
+        if image is None:
+            return None
+
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        if image.width > target_size[0] or image.height > target_size[1]:
+            image.thumbnail(target_size, Image.LANCZOS, reducing_gap=2.0)
+        if rotate:
+            # /Rotate 는 시계 방향, PIL rotate 는 반시계 방향
+            image = image.rotate(-rotate, expand=True)
+        return image
+    except Exception as e:
+        print(f"⚠️ 내장 이미지 추출 실패 (페이지 {page_num}), 렌더링으로 처리: {e}")
+        return None
+
+
+def iter_ocr_page_images(pdf_path: str, dpi: int = PDF_DPI, pages: list = None):
+    """OCR 입력용 페이지 이미지 - 단일 이미지 스캔 페이지는 내장 이미지를 꺼내고 나머지는 렌더링
+
+    Yields:
+        tuple[int, PIL.Image.Image, bool]: (페이지 번호, 페이지 이미지, 내장 이미지 사용 여부)
+    """
+    if pages is None:
+        pages = range(1, get_pdf_page_count(pdf_path) + 1)
+
+    reader = None
+    if OCR_EMBEDDED_IMAGES:
+        try:
+            reader = PdfReader(pdf_path)
+        except Exception:
+            reader = None
+
+    # 페이지를 하나씩 확인하며 바로 내보냄 - 렌더링 대상은 렌더링 window 만큼만 모았다가 렌더링
+    # (전체 페이지를 먼저 확인하면 첫 페이지가 나오기까지 기다려야 함)
+    window = max(1, PDF_RENDER_WINDOW)
+    pending = []
+    for page_num in sorted(pages):
+        image = extract_page_image(reader, page_num, dpi) if reader is not None else None
+        if image is None:
+            pending.append(page_num)
+            if len(pending) >= window:
+                for rendered_num, rendered in iter_pdf_pages(pdf_path, dpi=dpi, pages=pending):
+                    yield rendered_num, rendered, False
+                pending = []
+            continue
+
+        # 앞서 모아 둔 렌더링 대상 페이지를 먼저 내보내 페이지 순서 유지
+        for rendered_num, rendered in iter_pdf_pages(pdf_path, dpi=dpi, pages=pending):
+            yield rendered_num, rendered, False
+        pending = []
+        yield page_num, image, True
+
+    for rendered_num, rendered in iter_pdf_pages(pdf_path, dpi=dpi, pages=pending):
+        yield rendered_num, rendered, False
+
+
+def is_blank_page(image) -> bool:
+    """썸네일의 밝기 분포로 빈 페이지(또는 스캐너 잡티 정도만 있는 페이지) 판단"""
+    thumb = image.copy()
+    thumb.thumbnail((BLANK_PAGE_THUMBNAIL, BLANK_PAGE_THUMBNAIL), Image.BILINEAR, reducing_gap=2.0)
+    thumb = thumb.convert("L")
+
+    stat = ImageStat.Stat(thumb)
+    if stat.stddev[0] >= BLANK_PAGE_MAX_STDDEV:
+        return False
+
+    # 배경(중앙값)보다 확연히 어두운 픽셀을 글자/그림으로 간주
+    histogram = thumb.histogram()
+    threshold = max(0, int(stat.median[0]) - 32)
+    ink = sum(histogram[:threshold])
+    return ink / (thumb.width * thumb.height) < BLANK_PAGE_MAX_INK_RATIO
+
+
+def preprocess_page(image, check_blank: bool = True) -> tuple:
+    """OCR 전 페이지 전처리 - 빈 페이지 판별, 그레이스케일 변환, 해상도 상한 적용
+
+    Args:
+        image: 페이지 이미지 (빈 페이지이거나 변환되면 닫힘)
+        check_blank: 빈 페이지 판별 여부
+
+    Returns:
+        tuple[PIL.Image.Image | None, int]: (전처리된 이미지 - 빈 페이지면 None, 줄어든 픽셀 수)
+    """
+    original_pixels = image.width * image.height
+    if check_blank and is_blank_page(image):
+        image.close()
+        return None, original_pixels
+
+    if OCR_GRAYSCALE and image.mode != "L":
+        gray = image.convert("L")
+        image.close()
+        image = gray
+
+    if max(image.size) > OCR_MAX_PAGE_SIDE:
+        image.thumbnail((OCR_MAX_PAGE_SIDE, OCR_MAX_PAGE_SIDE), Image.LANCZOS, reducing_gap=2.0)
+
+    return image, original_pixels - image.width * image.height
+
+
+def _new_stage_times() -> dict:
+    return {"render": 0.0, "predict": 0.0, "wait": 0.0, "preprocess": 0.0, "pages": 0, "embedded": 0,
+            "blank": 0, "pixels_saved": 0, "page_cache_hits": 0, "page_cache_misses": 0, "page_duplicates": 0}
 
 
 class OCRService:
     """PDF OCR 처리를 담당하는 서비스 클래스 - Lazy loading으로 VRAM 효율적 사용"""
 
-    def __init__(self):
-        """초기화 - 모델은 실제 사용 시 로드"""
-        self.pipeline = None
-        self._is_loaded = False
+    def __init__(self, cpu_threads: int = None, engine: str = None):
+        """초기화 - 모델은 실제 사용 시 로드
+
+        Args:
+            cpu_threads: CPU 추론 시 엔진이 사용할 연산 스레드 수 (None이면 엔진 기본값)
+            engine: 기본 OCR 엔진 이름 (None이면 OCR_ENGINE, 사용할 수 없으면 설치된 다른 엔진)
+        """
+        self.cpu_threads = cpu_threads
+        self.engine_name = engine
+        self._engines = {}
+        # 마지막 추출 호출의 단계별 소요 시간(초)
+        #   render: 페이지 렌더링, predict: 추론, wait: 추론 루프가 렌더링을 기다린 시간
+        self.stage_times = _new_stage_times()
+        # 렌더링 스레드(prefetch)와 추론 루프가 함께 누적하므로 갱신은 _add_stage_times 로만
+        self._stage_lock = threading.Lock()
 
     def __enter__(self):
         """Context manager 진입"""
@@ -52,94 +479,381 @@ class OCRService:
         self.cleanup()
         return False
 
-    def _ensure_loaded(self):
-        """모델이 로드되지 않았으면 로드"""
-        if not self._is_loaded and PADDLEOCR_AVAILABLE:
-            print(f"Loading PaddleOCR-VL model...")
-            self.pipeline = PaddleOCRVL(**PADDLEOCR_CONFIG)
-            self._is_loaded = True
-            print(f"✓ PaddleOCR-VL loaded successfully")
+    @property
+    def _is_loaded(self) -> bool:
+        return any(ocr_engine.is_loaded for ocr_engine in self._engines.values())
 
-    def cleanup(self):
-        """모델 언로드 및 메모리 해제"""
-        if self._is_loaded:
-            print(f"🧹 Cleaning up PaddleOCR-VL model...")
+    def _ensure_loaded(self, engine: str = None):
+        """엔진이 로드되지 않았으면 로드
 
-            if self.pipeline is not None:
-                del self.pipeline
-                self.pipeline = None
-
-            # GPU 메모리 해제
-            if PADDLEOCR_AVAILABLE:
-                import paddle
-                paddle.device.cuda.empty_cache()
-
-            # Python 가비지 컬렉션
-            gc.collect()
+        Args:
+            engine: 엔진 이름 (None이면 이 서비스의 기본 엔진)
 
-            self._is_loaded = False
-            print(f"✓ PaddleOCR-VL cleaned up")
+        Returns:
+            OCREngine | None: 로드된 엔진 (사용 가능한 엔진이 없으면 None)
+        """
+        name = resolve_engine(engine or self.engine_name)
+        if name is None:
+            return None
+        if name not in self._engines:
+            self._engines[name] = create_engine(name, cpu_threads=self.cpu_threads)
+        ocr_engine = self._engines[name]
+        ocr_engine.load()
+        return ocr_engine
 
-    def extract_text_from_pdf(self, pdf_path: str) -> tuple:
+    def cleanup(self):
+        """모델 언로드 및 메모리 해제"""
+        for name, ocr_engine in list(self._engines.items()):
+            if not ocr_engine.is_loaded:
+                continue
+            print(f"🧹 Cleaning up {name} model...")
+            ocr_engine.unload()
+            print(f"✓ {name} cleaned up")
+        self._engines = {}
+
+        # Python 가비지 컬렉션
+        gc.collect()
+
+    def extract_text_from_pdf(self, pdf_path: str, mode: str = None, on_page=None,
+                              batch_size: int = OCR_PAGE_BATCH_SIZE, completed_pages: dict = None,
+                              dpi_mode: str = None, pages: list = None, engine: str = None) -> tuple:
         """PDF에서 텍스트만 추출합니다.
 
         Args:
             pdf_path: PDF 파일 경로
+            mode: 텍스트 레이어 처리 방식 ("hybrid" 또는 "ocr", 기본값 OCR_TEXT_LAYER_MODE)
+            on_page: 페이지 하나가 끝날 때마다 호출되는 콜백 (페이지 데이터, 완료 페이지 수, 전체 페이지 수)
+            batch_size: 한 번의 추론에 넣을 페이지 수
+            completed_pages: 이미 처리된 페이지 {페이지 번호: 페이지 데이터} - 다시 처리하지 않음
+            dpi_mode: DPI 처리 방식 ("fixed" 또는 "adaptive", 기본값 OCR_DPI_MODE)
+            pages: 처리할 페이지 번호 목록 (None이면 전체 페이지, 여러 워커로 나눠 처리할 때 사용)
+            engine: OCR 엔진 이름 (None이면 서비스 기본 엔진)
 
         Returns:
             tuple[str, list[dict]]: (전체 텍스트, 페이지별 데이터)
+                페이지별 데이터: {"page": 번호, "text": 텍스트, "engine": 추출 엔진, "dpi": 렌더링 DPI}
         """
-        # 모델이 로드되지 않았으면 로드
-        self._ensure_loaded()
-
-        if not PADDLEOCR_AVAILABLE or self.pipeline is None:
-            return "OCR not available", []
+        callback = None
+        if on_page is not None:
+            def callback(doc_index, entry, done, total):
+                on_page(entry, done, total)
 
-        # PDF를 이미지로 변환
-        images = convert_from_path(pdf_path, dpi=PDF_DPI)
+        return self.extract_batch([pdf_path], mode=mode, on_page=callback, batch_size=batch_size,
+                                  completed_pages=[completed_pages] if completed_pages else None,
+                                  dpi_mode=dpi_mode, pages=[pages] if pages else None, engine=engine)[0]
 
-        full_text = ""
-        page_data = []
+    def extract_batch(self, pdf_paths: list, mode: str = None, on_page=None,
+                      batch_size: int = OCR_BATCH_SIZE, completed_pages: list = None,
+                      dpi_mode: str = None, pages: list = None, engine: str = None) -> list:
+        """여러 PDF에서 텍스트 추출 - 문서 경계와 관계없이 batch_size 페이지씩 묶어 추론
 
-        # 이미지를 한 장씩 처리 (메모리 제어)
-        for page_num, image in enumerate(images, 1):
-            # 임시 이미지 파일로 저장
-            with NamedTemporaryFile(delete=False, suffix=".png") as tmp_img:
-                image.save(tmp_img.name)
-                temp_img_path = tmp_img.name
+        Args:
+            pdf_paths: PDF 파일 경로 목록
+            mode: 텍스트 레이어 처리 방식 ("hybrid" 또는 "ocr")
+            on_page: 페이지 완료 콜백 (문서 인덱스, 페이지 데이터, 완료 페이지 수, 전체 페이지 수)
+            batch_size: 한 번의 추론에 넣을 페이지 수
+            completed_pages: 문서별로 이미 처리된 페이지 {페이지 번호: 페이지 데이터} 목록
+            dpi_mode: DPI 처리 방식 ("fixed" 또는 "adaptive")
+            pages: 문서별 처리할 페이지 번호 목록 (None 항목은 전체 페이지)
+            engine: OCR 엔진 이름 (None이면 서비스 기본 엔진)
 
+        Returns:
+            list[tuple[str, list[dict]]]: 입력 순서대로 (전체 텍스트, 페이지별 데이터)
+        """
+        mode = mode or OCR_TEXT_LAYER_MODE
+        self.stage_times = _new_stage_times()
+        adaptive = (dpi_mode or OCR_DPI_MODE) == "adaptive"
+        render_dpi = OCR_ADAPTIVE_LOW_DPI if adaptive else PDF_DPI
+        completed_pages = completed_pages or [None] * len(pdf_paths)
+        pages = pages or [None] * len(pdf_paths)
+        docs = [
+            {"path": pdf_path, "pages": dict(done or {}), "total": 0, "ocr_pages": [],
+             "subset": set(subset) if subset else None}
+            for pdf_path, done, subset in zip(pdf_paths, completed_pages, pages)
+        ]
+        for doc in docs:
+            # 진행률은 처리 대상(subset) 기준 - 대상 밖의 완료 페이지는 결과에만 포함
+            doc["done"] = len([p for p in doc["pages"] if doc["subset"] is None or p in doc["subset"]])
+            if doc["pages"]:
+                print(f"⏩ 이전에 완료된 {len(doc['pages'])}페이지는 건너뜀: {doc['path']}")
+
+        def _page_done(doc_index, entry):
+            doc = docs[doc_index]
+            page_num = entry["page"]
+            if page_num not in doc["pages"] and (doc["subset"] is None or page_num in doc["subset"]):
+                doc["done"] += 1
+            doc["pages"][page_num] = entry
+            if on_page is not None:
+                on_page(doc_index, entry, doc["done"], doc["total"])
+
+        # 1. 텍스트 레이어로 처리 가능한 페이지 선별
+        for doc_index, doc in enumerate(docs):
+            subset = doc["subset"]
+            text_layer = extract_text_layer(doc["path"], subset) if mode == "hybrid" else None
+
+            if text_layer is not None:
+                doc["total"] = len(subset) if subset else len(text_layer)
+                text_layer_pages = 0
+                for page_num, text in enumerate(text_layer, 1):
+                    if page_num in doc["pages"] or subset and page_num not in subset:
+                        continue
+                    if is_text_layer_usable(text):
+                        _page_done(doc_index, {"page": page_num, "text": text.strip(), "engine": ENGINE_TEXT_LAYER})
+                        text_layer_pages += 1
+                    else:
+                        doc["ocr_pages"].append(page_num)
+
+                print(f"📑 텍스트 레이어 사용: {text_layer_pages}페이지, OCR 필요: {len(doc['ocr_pages'])}페이지")
+            else:
+                page_nums = sorted(subset) if subset else range(1, get_pdf_page_count(doc["path"]) + 1)
+                doc["total"] = len(page_nums)
+                doc["ocr_pages"] = [p for p in page_nums if p not in doc["pages"]]
+
+        # 2. 나머지 페이지 OCR
+        if any(doc["ocr_pages"] for doc in docs):
+            # OCR이 필요한 페이지가 있을 때만 모델 로드
+            ocr_engine = self._ensure_loaded(engine)
+            if ocr_engine is None:
+                return [("OCR not available", []) for _ in docs]
+
+            if OCR_PREFETCH_PAGES > 0:
+                images = self._prefetch_images(docs, render_dpi, OCR_PREFETCH_PAGES)
+            else:
+                images = self._timed_images(docs, render_dpi)
+
+            batch = []
+            # 같은 배치 안에 이미 있는 이미지와 동일한 페이지 - 배치 추론 결과를 그대로 사용
+            # (캐시는 LRU 라 배치가 끝난 뒤 이미 밀려났을 수 있으므로 다시 조회하지 않음)
+            duplicates = []
+            cache_key = self._page_cache_key(ocr_engine, adaptive)
+
+            def _reuse(doc_index, page_num, text, page_dpi):
+                _page_done(doc_index, {"page": page_num, "text": text, "engine": ocr_engine.name,
+                                       "dpi": page_dpi or render_dpi, "page_cache": True})
+
+            def _flush():
+                batch_results = self._ocr_batch(ocr_engine, docs, batch, render_dpi, adaptive, _page_done)
+                for doc_index, page_num, image_hash in duplicates:
+                    self._add_stage_times(page_duplicates=1)
+                    _reuse(doc_index, page_num, *batch_results[image_hash])
+                batch.clear()
+                duplicates.clear()
+
+            for doc_index, page_num, image in images:
+                if image is None:
+                    # 빈 페이지는 추론하지 않음
+                    _page_done(doc_index, {"page": page_num, "text": "", "engine": ocr_engine.name,
+                                           "dpi": render_dpi, "blank": True})
+                    continue
+
+                # 다른 문서에서 이미 OCR 한 것과 같은 페이지 이미지면 결과 재사용
+                image_hash = None
+                if OCR_PAGE_CACHE_ENABLED:
+                    image_hash = page_image_hash(image)
+                    if any(item[3] == image_hash for item in batch):
+                        image.close()
+                        duplicates.append((doc_index, page_num, image_hash))
+                        continue
+                    cached = get_page_cache().get(image_hash, cache_key)
+                    if cached is not None:
+                        image.close()
+                        self._add_stage_times(page_cache_hits=1)
+                        _reuse(doc_index, page_num, *cached)
+                        continue
+                    self._add_stage_times(page_cache_misses=1)
+
+                batch.append((doc_index, page_num, image, image_hash))
+                if len(batch) >= max(1, batch_size):
+                    _flush()
+            if batch:
+                _flush()
+
+            with self._stage_lock:
+                times = dict(self.stage_times)
+            print(f"⏱️ 단계별 시간 ({times['pages']}페이지, 내장 이미지 {times['embedded']}페이지) - "
+                  f"렌더링: {times['render']:.2f}초, 전처리: {times['preprocess']:.2f}초, "
+                  f"추론: {times['predict']:.2f}초, 렌더링 대기: {times['wait']:.2f}초")
+            if times["blank"] or times["pixels_saved"]:
+                print(f"✂️ 전처리 절감: 빈 페이지 {times['blank']}장 건너뜀, 픽셀 {times['pixels_saved']:,}개 감소")
+            if times["page_cache_hits"]:
+                print(f"♻️ 페이지 캐시 재사용: {times['page_cache_hits']}페이지")
+            if times["page_duplicates"]:
+                print(f"♻️ 같은 배치의 중복 페이지 재사용: {times['page_duplicates']}페이지")
+
+        results = []
+        for doc in docs:
+            page_data = [doc["pages"][page_num] for page_num in sorted(doc["pages"])]
+            results.append((build_full_text(page_data), page_data))
+        return results
+
+    def _add_stage_times(self, **amounts):
+        """stage_times 누적 (렌더링 스레드와 추론 루프가 동시에 호출해도 값이 유실되지 않도록 잠금)"""
+        with self._stage_lock:
+            for stage, amount in amounts.items():
+                self.stage_times[stage] += amount
+
+    def _iter_ocr_images(self, docs: list, dpi: int):
+        """OCR 대상 페이지를 문서 순서대로 한 장씩 준비 (문서 인덱스, 페이지 번호, 이미지)"""
+        for doc_index, doc in enumerate(docs):
+            if not doc["ocr_pages"]:
+                continue
+            for page_num, image, embedded in iter_ocr_page_images(doc["path"], dpi=dpi, pages=doc["ocr_pages"]):
+                if embedded:
+                    self._add_stage_times(embedded=1)
+                yield doc_index, page_num, image
+
+    def _timed_images(self, docs: list, dpi: int):
+        """_iter_ocr_images 에 전처리를 적용하고 렌더링/전처리 시간을 stage_times 에 누적
+
+        빈 페이지는 이미지 대신 None 을 반환
+        """
+        images = self._iter_ocr_images(docs, dpi)
+        while True:
+            start_time = time.perf_counter()
+            item = next(images, None)
+            self._add_stage_times(render=time.perf_counter() - start_time)
+            if item is None:
+                return
+            if OCR_PREPROCESS:
+                doc_index, page_num, image = item
+                item = doc_index, page_num, self._preprocess(image)
+            yield item
+
+    def _preprocess(self, image, check_blank: bool = True):
+        """preprocess_page 실행 후 절감량을 stage_times 에 누적"""
+        start_time = time.perf_counter()
+        image, pixels_saved = preprocess_page(image, check_blank=check_blank)
+        self._add_stage_times(preprocess=time.perf_counter() - start_time, pixels_saved=pixels_saved,
+                              blank=int(image is None))
+        return image
+
+    def _prefetch_images(self, docs: list, dpi: int, depth: int):
+        """백그라운드 스레드에서 렌더링한 페이지를 최대 depth 장의 큐를 통해 받아오는 제너레이터
+
+        추론하는 동안 다음 페이지를 미리 렌더링해 두어 추론 장치가 렌더링을 기다리지 않게 함
+        """
+        pages = queue.Queue(maxsize=max(1, depth))
+        stop = threading.Event()
+        finished = object()
+
+        def _put(item) -> bool:
+            # 소비 측이 중단되면 (예외 등) 큐가 비워지지 않으므로 주기적으로 중단 여부 확인
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _produce():
             try:
-                # 이미지 한 장만 처리
-                output = self.pipeline.predict(
-                    input=temp_img_path,
-                    use_queues=False
-                )
-
-                # 결과 추출
-                for res in output:
-                    md_info = res.markdown
-                    page_text = md_info.get('markdown_texts', '')
-
-                    # 전체 텍스트에 추가
-                    full_text += f"[Page {page_num}]\n{page_text}\n\n"
-
-                    # 페이지 데이터 저장
-                    page_data.append({
-                        "page": page_num,
-                        "text": page_text
-                    })
-
-                # GPU 메모리 즉시 정리
-                if PADDLEOCR_AVAILABLE:
-                    paddle.device.cuda.empty_cache()
-                gc.collect()
-
-            finally:
-                # 임시 이미지 파일 삭제
-                if os.path.exists(temp_img_path):
-                    os.remove(temp_img_path)
-
-        return full_text, page_data
+                for item in self._timed_images(docs, dpi):
+                    if not _put(item):
+                        if item[2] is not None:
+                            item[2].close()
+                        return
+                _put(finished)
+            except Exception as e:
+                _put(e)
+
+        producer = threading.Thread(target=_produce, name="ocr-render", daemon=True)
+        producer.start()
+        try:
+            while True:
+                start_time = time.perf_counter()
+                item = pages.get()
+                self._add_stage_times(wait=time.perf_counter() - start_time)
+                if item is finished:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+            # 미처 처리하지 못한 이미지 해제
+            while not pages.empty():
+                item = pages.get_nowait()
+                if isinstance(item, tuple) and item[2] is not None:
+                    item[2].close()
+
+    def _recognize(self, ocr_engine, images: list) -> list:
+        """이미지 묶음 추론 - 이미지별 (텍스트, 신뢰도)"""
+        start_time = time.perf_counter()
+        outputs = ocr_engine.recognize(images)
+        self._add_stage_times(predict=time.perf_counter() - start_time, pages=len(images))
+        if len(outputs) != len(images):
+            raise RuntimeError(f"OCR 결과 수 불일치: 입력 {len(images)}장, 결과 {len(outputs)}개")
+        return outputs
+
+    @staticmethod
+    def _page_cache_key(ocr_engine, adaptive: bool) -> str:
+        """페이지 캐시 키 - 같은 이미지라도 엔진/DPI 처리 방식이 다르면 결과를 공유하지 않음"""
+        key = f"{ocr_engine.name}:{'adaptive' if adaptive else 'fixed'}"
+        # 내장 이미지 사용 여부에 따라 같은 페이지의 OCR 입력이 달라지므로 설정별로 구분
+        return key + ":embedded" if OCR_EMBEDDED_IMAGES else key
+
+    def _ocr_batch(self, ocr_engine, docs: list, batch: list, dpi: int, adaptive: bool, page_done):
+        """렌더링된 페이지 묶음 하나를 추론하고 페이지별 결과 기록
+
+        batch 항목은 (문서 인덱스, 페이지 번호, 이미지, 페이지 캐시용 이미지 해시)
+        adaptive 이면 결과가 부실한 페이지만 높은 DPI로 다시 렌더링해 재처리
+
+        Returns:
+            dict: {이미지 해시: (텍스트, DPI)} - 같은 배치의 중복 페이지에 결과를 나눠주는 용도
+        """
+        cache_key = self._page_cache_key(ocr_engine, adaptive)
+        results = {}
+
+        def _done(doc_index, image_hash, entry):
+            page_done(doc_index, entry)
+            if image_hash is not None:
+                results[image_hash] = (entry["text"], entry["dpi"])
+                get_page_cache().put(image_hash, cache_key, entry["text"], entry["dpi"])
+
+        try:
+            recognized = self._recognize(ocr_engine, [image for _, _, image, _ in batch])
+        finally:
+            for _, _, image, _ in batch:
+                image.close()
+
+        retry = []
+        for (doc_index, page_num, _, image_hash), (page_text, confidence) in zip(batch, recognized):
+            if adaptive and is_ocr_output_poor(page_text, confidence):
+                retry.append((doc_index, page_num, image_hash, page_text))
+                continue
+            _done(doc_index, image_hash, {"page": page_num, "text": page_text, "engine": ocr_engine.name, "dpi": dpi})
+
+        # 부실한 페이지는 높은 DPI로 한 장씩 다시 처리
+        for doc_index, page_num, image_hash, low_text in retry:
+            print(f"🔍 페이지 {page_num} 결과 부실 - {OCR_ADAPTIVE_HIGH_DPI} DPI로 재처리")
+            start_time = time.perf_counter()
+            rendered = list(iter_ocr_page_images(docs[doc_index]["path"], dpi=OCR_ADAPTIVE_HIGH_DPI, pages=[page_num]))
+            self._add_stage_times(render=time.perf_counter() - start_time)
+            # 이 페이지의 고해상도 결과 (렌더링 결과가 없으면 None - 다른 페이지 결과를 쓰지 않도록 매번 초기화)
+            high_text = None
+            for _, image, _ in rendered:
+                if OCR_PREPROCESS:
+                    image = self._preprocess(image, check_blank=False)
+                try:
+                    high_text, _ = self._recognize(ocr_engine, [image])[0]
+                finally:
+                    image.close()
+
+            # 고해상도 결과가 더 나쁘면 (예: 실제로 빈 페이지) 저해상도 결과 유지
+            if high_text is not None and (len(high_text.strip()) >= len(low_text.strip())
+                                          or text_quality(high_text) > text_quality(low_text)):
+                _done(doc_index, image_hash, {"page": page_num, "text": high_text, "engine": ocr_engine.name,
+                                              "dpi": OCR_ADAPTIVE_HIGH_DPI})
+            else:
+                _done(doc_index, image_hash, {"page": page_num, "text": low_text, "engine": ocr_engine.name,
+                                              "dpi": dpi})
+
+        # GPU 메모리 즉시 정리
+        ocr_engine.release_memory()
+        gc.collect()
+        return results
 
 
 # 헬퍼 함수 - 간편한 사용을 위한 래퍼
@@ -0,0 +1,171 @@
+"""
+OCR 텍스트 조회
+ocr_pages 를 문서 텍스트의 원본으로 사용하고, 필요한 페이지 구간이나 앞부분만 DB에서 가져옴
+
+ocr_results 행은 (doc_id, content_hash, ocr_config) 로 자기 페이지를 찾음
+이전 방식으로 저장된 결과(full_text / page_data 에 전체 텍스트가 있는 행)는 그 컬럼에서 읽음
+"""
+import os
+import json
+
+from ocr_service import build_full_text
+
+
+# ocr_results 에 전체 텍스트(full_text)를 함께 저장할지 여부 - 기본은 ocr_pages 에만 저장
+OCR_STORE_FULL_TEXT = os.environ.get("OCR_STORE_FULL_TEXT", "0") == "1"
+
+# 분류 모델 입력으로 읽을 최대 글자 수 (BERT 는 512토큰에서 잘리므로 그 이상은 읽지 않음)
+CLASSIFY_TEXT_CHARS = int(os.environ.get("CLASSIFY_TEXT_CHARS", "4000"))
+
+# 분류용 부분 OCR 결과의 ocr_config 접미사 (페이지는 접미사 없는 설정 키로 저장됨)
+PARTIAL_CONFIG_SUFFIX = ":partial"
+
+_LAST_PAGE = 2 ** 31 - 1
+
+# ocr_results 행과 그 결과의 페이지 연결 조건
+_PAGES_JOIN = """
+    JOIN ocr_pages p
+      ON p.doc_id = r.doc_id
+     AND p.content_hash = r.content_hash
+     AND p.ocr_config = REPLACE(r.ocr_config, %s, '')
+"""
+
+
+def latest_ocr_id(cur, doc_id: int, ocr_id: int = None):
+    """문서의 가장 최근 OCR 결과 ID (없으면 None)
+
+    ocr_id 를 지정하면 그 결과가 이 문서의 것일 때만 그대로 반환 (다른 문서의 결과면 None)
+    """
+    if ocr_id is not None:
+        cur.execute("SELECT ocr_id FROM ocr_results WHERE ocr_id = %s AND doc_id = %s", (ocr_id, doc_id))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+    cur.execute("""
+        SELECT ocr_id
+        FROM ocr_results
+        WHERE doc_id = %s
+        ORDER BY created_at DESC
+        LIMIT 1
+    """, (doc_id,))
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def _legacy_pages(cur, ocr_id: int):
+    """이전 방식으로 저장된 결과의 page_data (없으면 None)"""
+    cur.execute("SELECT page_data FROM ocr_results WHERE ocr_id = %s", (ocr_id,))
+    row = cur.fetchone()
+    if not row or not row[0]:
+        return None
+    return json.loads(row[0]) if isinstance(row[0], str) else row[0]
+
+
+def fetch_ocr_pages(cur, ocr_id: int, first_page: int = None, last_page: int = None) -> list:
+    """OCR 결과의 페이지 구간 조회
+
+    Returns:
+        list[dict]: 페이지별 데이터 {"page", "text", "engine", ...} (페이지 번호 순)
+    """
+    first_page, last_page = first_page or 1, last_page or _LAST_PAGE
+    cur.execute(f"""
+        SELECT p.page_num, p.text, p.engine, p.meta
+        FROM ocr_results r
+        {_PAGES_JOIN}
+        WHERE r.ocr_id = %s AND p.page_num BETWEEN %s AND %s
+        ORDER BY p.page_num
+    """, (PARTIAL_CONFIG_SUFFIX, ocr_id, first_page, last_page))
+    rows = cur.fetchall()
+
+    if rows:
+        pages = []
+        for page_num, text, engine, meta in rows:
+            entry = {"page": page_num, "text": text or "", "engine": engine}
+            if meta:
+                entry.update(json.loads(meta))
+            pages.append(entry)
+        return pages
+
+    return [page for page in _legacy_pages(cur, ocr_id) or [] if first_page <= page["page"] <= last_page]
+
+
+def fetch_ocr_texts(cur, ocr_ids: list, max_chars: int = None, first_page: int = None,
+                    last_page: int = None) -> dict:
+    """여러 OCR 결과의 텍스트를 한 번에 조회 ("[Page n]" 구분자 포함, full_text 와 같은 형식)
+
+    max_chars 를 지정하면 앞에서부터 그 글자 수를 채우는 데 필요한 페이지만 DB에서 가져옴
+
+    Returns:
+        dict[int, str]: {ocr_id: 텍스트} (결과가 없는 ID는 제외)
+    """
+    ocr_ids = list(dict.fromkeys(ocr_ids))
+    if not ocr_ids:
+        return {}
+    first_page, last_page = first_page or 1, last_page or _LAST_PAGE
+    limit = max_chars if max_chars else _LAST_PAGE
+
+    # 앞 페이지들의 누적 글자 수가 limit 미만인 페이지만 (각 페이지도 limit 글자까지만) 전송
+    cur.execute(f"""
+        SELECT ocr_id, page_num, text
+        FROM (
+            SELECT r.ocr_id, p.page_num, LEFT(p.text, %s) AS text,
+                   COALESCE(SUM(LENGTH(p.text)) OVER (
+                       PARTITION BY r.ocr_id ORDER BY p.page_num
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING
+                   ), 0) AS preceding_chars
+            FROM ocr_results r
+            {_PAGES_JOIN}
+            WHERE r.ocr_id = ANY(%s) AND p.page_num BETWEEN %s AND %s
+        ) pages
+        WHERE preceding_chars < %s
+        ORDER BY ocr_id, page_num
+    """, (limit, PARTIAL_CONFIG_SUFFIX, ocr_ids, first_page, last_page, limit))
+
+    pages = {}
+    for ocr_id, page_num, text in cur.fetchall():
+        pages.setdefault(ocr_id, []).append({"page": page_num, "text": text or ""})
+    texts = {ocr_id: build_full_text(page_data) for ocr_id, page_data in pages.items()}
+
+    # 페이지가 없는 결과는 이전 방식의 컬럼에서 읽음
+    legacy_ids = [ocr_id for ocr_id in ocr_ids if ocr_id not in texts]
+    if legacy_ids:
+        if first_page == 1 and last_page == _LAST_PAGE:
+            cur.execute("""
+                SELECT ocr_id, SUBSTRING(full_text FROM 1 FOR %s)
+                FROM ocr_results
+                WHERE ocr_id = ANY(%s) AND full_text IS NOT NULL
+            """, (limit, legacy_ids))
+            texts.update({ocr_id: text for ocr_id, text in cur.fetchall()})
+        else:
+            for ocr_id in legacy_ids:
+                page_data = [page for page in _legacy_pages(cur, ocr_id) or []
+                             if first_page <= page["page"] <= last_page]
+                if page_data:
+                    texts[ocr_id] = build_full_text(page_data)
+
+    if max_chars:
+        texts = {ocr_id: text[:max_chars] for ocr_id, text in texts.items()}
+    return texts
+
+
+def fetch_ocr_text(cur, ocr_id: int, max_chars: int = None, first_page: int = None, last_page: int = None):
+    """OCR 결과 하나의 텍스트 (앞 max_chars 글자 / 페이지 구간)
+
+    Returns:
+        str | None: 결과가 없으면 None
+    """
+    return fetch_ocr_texts(cur, [ocr_id], max_chars, first_page, last_page).get(ocr_id)
+
+
+def ocr_page_count(cur, ocr_id: int) -> int:
+    """OCR 결과의 페이지 수"""
+    cur.execute(f"""
+        SELECT COUNT(*)
+        FROM ocr_results r
+        {_PAGES_JOIN}
+        WHERE r.ocr_id = %s
+    """, (PARTIAL_CONFIG_SUFFIX, ocr_id))
+    count = cur.fetchone()[0]
+    if count:
+        return count
+    return len(_legacy_pages(cur, ocr_id) or [])
@@ -0,0 +1,116 @@
+"""
+PDF 페이지 래스터라이저
+OCR 입력용 페이지 렌더링 백엔드 (poppler / pdfium) - OCR_RASTERIZER 로 선택
+"""
+import os
+import threading
+
+try:
+    from pdf2image import convert_from_path, pdfinfo_from_path
+    POPPLER_AVAILABLE = True
+except ImportError:
+    POPPLER_AVAILABLE = False
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+
+# 사용할 렌더링 백엔드
+#   "poppler": pdf2image 로 pdftoppm 프로세스를 실행해 렌더링 (기존 방식)
+#   "pdfium":  pypdfium2 로 프로세스 안에서 바로 렌더링 (외부 프로세스/임시 파일 없음)
+OCR_RASTERIZER = os.environ.get("OCR_RASTERIZER", "poppler")
+
+
+class PopplerRasterizer:
+    """pdf2image(poppler) 렌더링 - 호출마다 pdftoppm 프로세스 실행"""
+
+    name = "poppler"
+
+    @staticmethod
+    def is_available() -> bool:
+        return POPPLER_AVAILABLE
+
+    def page_count(self, pdf_path: str) -> int:
+        """PDF 페이지 수 (렌더링 없이 pdfinfo 사용)"""
+        return int(pdfinfo_from_path(pdf_path)["Pages"])
+
+    def render(self, pdf_path: str, first_page: int, last_page: int, dpi: int) -> list:
+        """first_page ~ last_page 를 렌더링한 PIL 이미지 목록"""
+        return convert_from_path(pdf_path, dpi=dpi, first_page=first_page, last_page=last_page)
+
+
+class PdfiumRasterizer:
+    """pypdfium2(PDFium) 렌더링 - 프로세스 안에서 실행"""
+
+    name = "pdfium"
+
+    # PDFium 은 스레드 안전하지 않으므로 프로세스 안의 모든 호출을 직렬화
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_available() -> bool:
+        return PDFIUM_AVAILABLE
+
+    def page_count(self, pdf_path: str) -> int:
+        with self._lock:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+
+    def render(self, pdf_path: str, first_page: int, last_page: int, dpi: int) -> list:
+        images = []
+        with self._lock:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                for page_index in range(first_page - 1, last_page):
+                    page = pdf[page_index]
+                    try:
+                        bitmap = page.render(scale=dpi / 72)
+                        # 비트맵 버퍼를 참조하지 않도록 복사본 생성
+                        images.append(bitmap.to_pil().copy())
+                        bitmap.close()
+                    finally:
+                        page.close()
+            finally:
+                pdf.close()
+        return images
+
+
+RASTERIZERS = {
+    PopplerRasterizer.name: PopplerRasterizer,
+    PdfiumRasterizer.name: PdfiumRasterizer,
+}
+
+_instances = {}
+
+
+def available_rasterizers() -> list:
+    """현재 환경에서 사용할 수 있는 백엔드 이름 목록"""
+    return [name for name, cls in RASTERIZERS.items() if cls.is_available()]
+
+
+def get_rasterizer(name: str = None):
+    """이름으로 렌더링 백엔드 반환 (None이면 OCR_RASTERIZER)
+
+    설정한 백엔드를 사용할 수 없으면 사용 가능한 다른 백엔드로 대체
+    """
+    name = name or OCR_RASTERIZER
+    if name in _instances:
+        return _instances[name]
+    if name not in RASTERIZERS:
+        raise ValueError(f"알 수 없는 렌더링 백엔드: {name} (사용 가능: {', '.join(RASTERIZERS)})")
+
+    backend = name
+    if not RASTERIZERS[backend].is_available():
+        backend = next(iter(available_rasterizers()), None)
+        if backend is None:
+            raise RuntimeError("사용 가능한 PDF 렌더링 백엔드가 없습니다 (pdf2image 또는 pypdfium2 필요)")
+        print(f"⚠️ 렌더링 백엔드 '{name}' 사용 불가 - '{backend}' 사용")
+
+    _instances[name] = RASTERIZERS[backend]()
+    return _instances[name]
@@ -3,6 +3,7 @@ import shutil, os, json, time
 from typing import Optional
 from fastapi import APIRouter, UploadFile, File, Query,Form,HTTPException, Request, Response
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from zip_utiles import extract_zip
 from pydantic import BaseModel
 from datetime import datetime
@@ -12,16 +13,31 @@ from db_conn import db_pool
 from uploads import upload_files
 from tempfile import NamedTemporaryFile
 from PyPDF2 import PdfReader
+from ocr_text import (
+    CLASSIFY_TEXT_CHARS, OCR_STORE_FULL_TEXT, latest_ocr_id, fetch_ocr_pages, fetch_ocr_text, fetch_ocr_texts,
+    ocr_page_count
+)
 
 # OCR 및 분류 서비스
 try:
-    from ocr_service import get_ocr_service, OCR_AVAILABLE
+    from ocr_service import get_ocr_service, summarize_engines, OCR_AVAILABLE
+    from ocr_engines import resolve_engine, available_engines, OCR_ENGINE
+    from ocr_pool import get_ocr_pool
+    from ocr_jobs import get_ocr_job_manager
+    import ocr_cache
+    import ocr_checkpoint
+    import ocr_page_cache
+    import ocr_incremental
+    import ocr_scope
 except Exception as e:
     OCR_AVAILABLE = False
     print(f"⚠️ OCR service not available: {e}")
 
 try:
-    from classification_service import get_classification_service
+    from classification_service import get_classification_service, get_resident_classifier
+    from classification_batcher import get_classification_batcher
+    import embedding_store
+    import numpy as np
     CLASSIFICATION_AVAILABLE = True
 except Exception as e:
     CLASSIFICATION_AVAILABLE = False
@@ -706,13 +722,86 @@ async def get_files(request: Request):
             cur.close()
         db_pool.release_conn(conn)
 
-@router.post("/ocr/process")
-async def process_ocr(filepath: str = Form(...)):
+def normalize_pdf_path(filepath: str) -> str:
+    """DB에 저장된 PDF 경로를 현재 작업 디렉토리 기준 절대 경로로 변환"""
+    # 파일 경로 정규화
+    normalized_path = filepath.replace('\\', '/')
+
+    # ./ 로 시작하는 상대 경로를 절대 경로로 변환
+    if normalized_path.startswith('./'):
+        normalized_path = normalized_path[2:]  # ./ 제거
+
+    # 상대 경로를 절대 경로로 변환
+    if not os.path.isabs(normalized_path):
+        normalized_path = os.path.join(os.getcwd(), normalized_path)
+
+    # 경로 정규화 (중복 슬래시 제거 등)
+    return os.path.normpath(normalized_path)
+
+
+def mark_ocr_completed(cur, filepath: str, ocr_state: str, pages_done: int, keep_classified: bool = False):
+    """문서 OCR 상태 갱신 (keep_classified=True 이면 이미 분류된 문서의 CLASSIFIED 상태 유지)"""
+    ocr_scope.ensure_ocr_state_columns(cur)
+    cur.execute("""
+        UPDATE pdf_documents
+        SET ocr = TRUE,
+            status = CASE WHEN %s AND status = 'CLASSIFIED' THEN status ELSE 'OCR_COMPLETED' END,
+            ocr_state = %s, ocr_pages_done = %s, updated_at = NOW()
+        WHERE filename = %s
+    """, (keep_classified, ocr_state, pages_done, filepath))
+
+
+def save_ocr_result(cur, doc_id: int, filepath: str, full_text: str, page_data: list,
+                    processing_time: float, content_hash: str, config_key: str,
+                    partial: bool = False, keep_classified: bool = False, page_hashes: list = None) -> int:
+    """OCR 결과 저장 및 문서 상태 갱신 (commit 은 호출 측에서)
+
+    페이지 텍스트는 ocr_pages 에만 저장 (OCR_STORE_FULL_TEXT 이면 full_text / page_data 에도 저장)
+
+    Args:
+        partial: 분류용 부분 OCR 결과 여부 (전체 결과 캐시와 구분되는 설정 키로 저장)
+        keep_classified: 이미 분류된 문서의 상태를 유지할지 여부 (나머지 페이지 처리)
+        page_hashes: 페이지별 내용 해시 (체크포인트에 없던 페이지를 저장할 때 사용)
+
+    Returns:
+        int: 새 ocr_id
+    """
+    cur.execute("""
+        INSERT INTO ocr_results
+            (doc_id, full_text, page_data, ocr_engine, processing_time, content_hash, ocr_config, page_count)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING ocr_id
+    """, (doc_id, full_text if OCR_STORE_FULL_TEXT else None,
+          json.dumps(page_data, ensure_ascii=False) if OCR_STORE_FULL_TEXT else None, summarize_engines(page_data),
+          processing_time, content_hash, ocr_scope.partial_config_key(config_key) if partial else config_key,
+          len(page_data)))
+
+    ocr_id = cur.fetchone()[0]
+    ocr_checkpoint.store_pages(cur, doc_id, content_hash, config_key, ocr_id, page_data, page_hashes)
+
+    # PDF 문서 상태 업데이트
+    mark_ocr_completed(cur, filepath, ocr_scope.OCR_STATE_PARTIAL if partial else ocr_scope.OCR_STATE_FULL,
+                       len(page_data), keep_classified)
+
+    return ocr_id
+
+
+def run_ocr_for_file(filepath: str, on_page=None, resume: bool = True, dpi_mode: str = None, engine: str = None,
+                     scope: str = None):
     """
-    OCR 처리: PDF 파일에서 텍스트 추출
+    PDF 한 건 OCR 처리 후 결과 저장 (동기 함수 - 스레드에서 실행)
+
+    페이지가 끝날 때마다 ocr_pages 에 체크포인트를 남기고,
+    resume=True 이면 이전 실행에서 완료된 페이지는 다시 처리하지 않음
 
     Args:
-        filepath: 처리할 PDF 파일 경로
+        filepath: 처리할 PDF 파일 경로 (DB 저장 경로)
+        on_page: 페이지 완료 콜백 (페이지 데이터, 완료 페이지 수, 전체 페이지 수)
+        resume: 이전 체크포인트부터 이어서 처리할지 여부
+        dpi_mode: DPI 처리 방식 ("fixed" 또는 "adaptive", 기본값은 서버 설정)
+        engine: OCR 엔진 이름 (기본값은 서버 설정 OCR_ENGINE)
+        scope: OCR 범위 ("full", "classify" - 분류용 앞쪽 페이지만, "remainder" - 부분 OCR 문서의 나머지,
+               기본값은 서버 설정 OCR_SCOPE)
 
     Returns:
         OCR 결과 (텍스트, 페이지 정보)
@@ -727,19 +816,13 @@ async def process_ocr(filepath: str = Form(...)):
         print(f"❌ OCR 서비스를 사용할 수 없습니다")
         return {"success": False, "error": "OCR service not available"}
 
-    # 파일 경로 정규화
-    normalized_path = filepath.replace('\\', '/')
-
-    # ./ 로 시작하는 상대 경로를 절대 경로로 변환
-    if normalized_path.startswith('./'):
-        normalized_path = normalized_path[2:]  # ./ 제거
-
-    # 상대 경로를 절대 경로로 변환
-    if not os.path.isabs(normalized_path):
-        normalized_path = os.path.join(os.getcwd(), normalized_path)
+    try:
+        engine = resolve_engine(engine)
+        scope = ocr_scope.resolve_scope(scope)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
 
-    # 경로 정규화 (중복 슬래시 제거 등)
-    normalized_path = os.path.normpath(normalized_path)
+    normalized_path = normalize_pdf_path(filepath)
 
     print(f"🔍 정규화된 경로: {normalized_path}")
     print(f"📂 파일 존재 여부: {os.path.exists(normalized_path)}")
@@ -775,35 +858,124 @@ async def process_ocr(filepath: str = Form(...)):
         print(f"✅ DB에서 파일 발견 - doc_id: {doc_id}, 페이지 수: {page_count}")
 
         # OCR 처리 시작
-        print(f"🚀 OCR 엔진 시작...")
         start_time = time.time()
 
         try:
-            # Context manager로 OCR 서비스 사용 - 자동으로 메모리 해제
-            with get_ocr_service() as ocr:
-                full_text, page_data = ocr.extract_text_from_pdf(normalized_path)
+            # 같은 내용의 PDF가 같은 설정으로 이미 처리되었으면 결과 재사용
+            content_hash = ocr_cache.compute_content_hash(normalized_path)
+            config_key = ocr_cache.ocr_config_key(dpi_mode=dpi_mode, engine=engine)
+            ocr_cache.ensure_cache_columns(cur)
+
+            cached = None
+            if ocr_cache.OCR_CACHE_ENABLED:
+                cached = ocr_cache.find_cached_result(cur, content_hash, config_key)
+
+            if cached:
+                source_ocr_id, cached_page_count, saved_time = cached
+                processing_time = time.time() - start_time
+                ocr_checkpoint.ensure_pages_table(cur)
+                ocr_id = ocr_cache.copy_cached_result(cur, source_ocr_id, doc_id, processing_time)
+                ocr_checkpoint.copy_pages(cur, source_ocr_id, doc_id, ocr_id)
+                text_preview = fetch_ocr_text(cur, ocr_id, max_chars=200)
+                ocr_cache.cache_stats.record_hit(saved_time)
+                print(f"♻️ OCR 캐시 적중 - 원본 ocr_id: {source_ocr_id}, 절약 시간: {saved_time or 0:.2f}초")
+
+                mark_ocr_completed(cur, filepath, ocr_scope.OCR_STATE_FULL, cached_page_count,
+                                   keep_classified=scope == ocr_scope.OCR_SCOPE_REMAINDER)
+
+                conn.commit()
 
-            processing_time = time.time() - start_time
-            print(f"✅ OCR 완료 - 처리 시간: {processing_time:.2f}초, 추출된 페이지: {len(page_data)}개")
+                log_processing(
+                    conn=conn,
+                    doc_id=doc_id,
+                    filename=filepath,
+                    process_type='OCR',
+                    status='SUCCESS',
+                    message=f"OCR 캐시 재사용: {filepath.split('/')[-1]} ({cached_page_count}페이지)"
+                )
 
-            # OCR 결과 DB 저장
-            cur.execute("""
-                INSERT INTO ocr_results (doc_id, full_text, page_data, ocr_engine, processing_time)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING ocr_id
-            """, (doc_id, full_text, json.dumps(page_data, ensure_ascii=False), "PaddleOCRVL", processing_time))
+                return {
+                    "success": True,
+                    "message": f"OCR 완료 (캐시): {filepath}",
+                    "ocr_id": ocr_id,
+                    "doc_id": doc_id,
+                    "processing_time": processing_time,
+                    "page_count": cached_page_count,
+                    "ocr_state": ocr_scope.OCR_STATE_FULL,
+                    "cached": True,
+                    "text_preview": text_preview or ""
+                }
 
-            ocr_id = cur.fetchone()[0]
+            ocr_cache.cache_stats.record_miss()
+
+            # 이전 실행에서 완료된 페이지 (같은 내용/설정일 때만)
+            ocr_checkpoint.ensure_pages_table(cur)
+            completed_pages = {}
+            if resume and ocr_checkpoint.OCR_RESUME_ENABLED:
+                completed_pages = ocr_checkpoint.load_completed_pages(cur, doc_id, content_hash, config_key)
+                if completed_pages:
+                    print(f"⏩ 체크포인트에서 재개 - 완료된 페이지: {len(completed_pages)}개")
+
+            # 같은 경로의 이전 버전(수정본 재업로드)에서 내용이 바뀌지 않은 페이지는 텍스트 재사용
+            page_hashes = ocr_incremental.page_content_hashes(normalized_path)
+            reused_pages = {}
+            if ocr_incremental.OCR_INCREMENTAL_ENABLED and page_hashes:
+                reused_pages = ocr_incremental.load_unchanged_pages(
+                    cur, filepath, content_hash, config_key, page_hashes, skip_pages=completed_pages
+                )
+            conn.commit()
 
-            # PDF 문서 상태 업데이트
-            cur.execute("""
-                UPDATE pdf_documents
-                SET ocr = TRUE, status = 'OCR_COMPLETED', updated_at = NOW()
-                WHERE filename = %s
-            """, (filepath,))
+            # 체크포인트는 이 작업의 커넥션으로 저장 (OCR 동안 커밋된 상태로 쉬고 있음 - 작업당 커넥션 하나)
+            checkpoint = ocr_checkpoint.PageCheckpointWriter(doc_id, content_hash, config_key, page_hashes,
+                                                             conn=conn)
+            resumed_pages = len(completed_pages)
+            if reused_pages:
+                print(f"🧩 이전 버전에서 바뀌지 않은 페이지 재사용: {len(reused_pages)}개 "
+                      f"(OCR 대상: {len(page_hashes) - resumed_pages - len(reused_pages)}페이지)")
+                checkpoint.write_many(reused_pages.values())
+                completed_pages.update(reused_pages)
+
+            def _on_page(entry, done, total):
+                checkpoint.write(entry)
+                if on_page is not None:
+                    on_page(entry, done, total)
+
+            print(f"🚀 OCR 엔진 시작... ({engine}, 범위: {scope})")
+
+            # 모델이 로드된 상태로 대기 중인 워커 풀에서 처리
+            total_pages = None
+            try:
+                if scope == ocr_scope.OCR_SCOPE_CLASSIFY:
+                    full_text, page_data, total_pages = ocr_scope.extract_classification_pages(
+                        get_ocr_pool(), normalized_path, on_page=_on_page, completed_pages=completed_pages,
+                        dpi_mode=dpi_mode, engine=engine
+                    )
+                else:
+                    full_text, page_data = get_ocr_pool().extract_text_from_pdf(
+                        normalized_path, on_page=_on_page, completed_pages=completed_pages, dpi_mode=dpi_mode,
+                        engine=engine
+                    )
+            finally:
+                checkpoint.close()
+
+            partial = total_pages is not None and len(page_data) < total_pages
+            processing_time = time.time() - start_time
+            print(f"✅ OCR 완료 - 처리 시간: {processing_time:.2f}초, 추출된 페이지: {len(page_data)}개"
+                  + (f" (부분 OCR, 전체 {total_pages}페이지)" if partial else ""))
+
+            # OCR 결과 DB 저장
+            ocr_id = save_ocr_result(cur, doc_id, filepath, full_text, page_data,
+                                     processing_time, content_hash, config_key, partial=partial,
+                                     keep_classified=scope == ocr_scope.OCR_SCOPE_REMAINDER,
+                                     page_hashes=page_hashes)
 
             conn.commit()
 
+            # 나머지 페이지는 백그라운드에서 이어서 처리 (완료된 페이지는 체크포인트에서 재사용)
+            remainder_job = None
+            if partial and ocr_scope.OCR_LAZY_REMAINDER:
+                remainder_job = submit_remainder_job(filepath, dpi_mode=dpi_mode, engine=engine)
+
             # 작업 로그 기록
             log_processing(
                 conn=conn,
@@ -812,6 +984,7 @@ async def process_ocr(filepath: str = Form(...)):
                 process_type='OCR',
                 status='SUCCESS',
                 message=f"OCR 처리 완료: {filepath.split('/')[-1]} ({len(page_data)}페이지)"
+                        + (f" - 부분 OCR (전체 {total_pages}페이지)" if partial else "")
             )
 
             print(f"💾 DB 저장 완료 - ocr_id: {ocr_id}")
@@ -824,21 +997,533 @@ async def process_ocr(filepath: str = Form(...)):
                 "doc_id": doc_id,
                 "processing_time": processing_time,
                 "page_count": len(page_data),
+                "resumed_pages": resumed_pages,
+                "reused_pages": len(reused_pages),
+                "ocr_state": ocr_scope.OCR_STATE_PARTIAL if partial else ocr_scope.OCR_STATE_FULL,
+                "total_pages": total_pages or len(page_data),
+                "remainder_job_id": remainder_job.job_id if remainder_job else None,
+                "cached": False,
                 "text_preview": full_text[:200] if full_text else ""
             }
 
-        except Exception as ocr_error:
-            conn.rollback()
-            print(f"❌ OCR 엔진 오류: {str(ocr_error)}")
-            import traceback
-            traceback.print_exc()
-            return {"success": False, "error": f"OCR 처리 실패: {str(ocr_error)}"}
+        except Exception as ocr_error:
+            conn.rollback()
+            print(f"❌ OCR 엔진 오류: {str(ocr_error)}")
+            import traceback
+            traceback.print_exc()
+            return {"success": False, "error": f"OCR 처리 실패: {str(ocr_error)}"}
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ OCR 처리 중 예외 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+    finally:
+        cur.close()
+        db_pool.release_conn(conn)
+
+
+def submit_remainder_job(filepath: str, dpi_mode: str = None, engine: str = None):
+    """부분 OCR 문서의 나머지 페이지 처리 작업 접수 (같은 문서의 작업이 대기/실행 중이면 그 작업 반환)"""
+    manager = get_ocr_job_manager()
+    for job in manager.list():
+        if (job.filepath == filepath and job.state in ("queued", "running")
+                and job.options.get("scope") == ocr_scope.OCR_SCOPE_REMAINDER):
+            return job
+
+    job = manager.submit(run_ocr_for_file, filepath, resume=True, dpi_mode=dpi_mode, engine=engine,
+                         scope=ocr_scope.OCR_SCOPE_REMAINDER)
+    print(f"📥 나머지 페이지 OCR 작업 접수: {job.job_id} ({filepath})")
+    return job
+
+
+@router.post("/ocr/process")
+async def process_ocr(filepath: str = Form(...), resume: bool = Form(True), dpi_mode: Optional[str] = Form(None),
+                      engine: Optional[str] = Form(None), scope: Optional[str] = Form(None)):
+    """
+    OCR 처리: PDF 파일에서 텍스트 추출 (완료까지 대기)
+
+    처리는 스레드에서 실행되므로 OCR 중에도 다른 요청은 막히지 않음
+
+    Args:
+        filepath: 처리할 PDF 파일 경로
+        resume: 이전에 중단된 OCR의 완료된 페이지부터 이어서 처리 (기본값 True)
+        dpi_mode: "fixed" 또는 "adaptive" (낮은 DPI로 먼저 처리하고 부실한 페이지만 높은 DPI로 재처리)
+        engine: OCR 엔진 ("PaddleOCRVL", "Tesseract" - 기본값은 서버 설정)
+        scope: "full" 또는 "classify" (분류에 필요한 앞쪽 페이지만 처리하고 나머지는 백그라운드에서 처리)
+
+    Returns:
+        OCR 결과 (텍스트, 페이지 정보)
+    """
+    return await run_in_threadpool(run_ocr_for_file, filepath, None, resume, dpi_mode, engine, scope)
+
+
+@router.post("/ocr/jobs")
+async def submit_ocr_job(filepath: str = Form(...), resume: bool = Form(True), dpi_mode: Optional[str] = Form(None),
+                         engine: Optional[str] = Form(None), scope: Optional[str] = Form(None)):
+    """
+    OCR 작업 접수: 작업 ID를 즉시 반환하고 백그라운드에서 처리
+
+    Args:
+        filepath: 처리할 PDF 파일 경로
+        resume: 이전에 중단된 OCR의 완료된 페이지부터 이어서 처리 (기본값 True)
+        dpi_mode: "fixed" 또는 "adaptive"
+        engine: OCR 엔진 ("PaddleOCRVL", "Tesseract" - 기본값은 서버 설정)
+        scope: "full" 또는 "classify" (분류에 필요한 앞쪽 페이지만 처리하고 나머지는 백그라운드에서 처리)
+
+    Returns:
+        작업 ID와 초기 상태
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    try:
+        resolve_engine(engine)
+        ocr_scope.resolve_scope(scope)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+
+    job = get_ocr_job_manager().submit(run_ocr_for_file, filepath, resume=resume, dpi_mode=dpi_mode, engine=engine,
+                                       scope=scope)
+    print(f"📥 OCR 작업 접수: {job.job_id} ({filepath})")
+
+    return {"success": True, "job_id": job.job_id, "job": job.to_dict()}
+
+
+@router.post("/ocr/remainder")
+async def complete_partial_ocr(filepath: str = Form(...), dpi_mode: Optional[str] = Form(None),
+                               engine: Optional[str] = Form(None)):
+    """
+    부분 OCR 문서의 나머지 페이지 처리 요청 (백그라운드 작업)
+
+    분류용 OCR 로 앞쪽 페이지만 처리된 문서를 전체 OCR 로 완성 - 이미 처리된 페이지는 다시 처리하지 않음
+
+    Args:
+        filepath: PDF 파일 경로
+        dpi_mode: "fixed" 또는 "adaptive" (부분 OCR 때와 같아야 완료된 페이지를 재사용)
+        engine: OCR 엔진 (부분 OCR 때와 같아야 완료된 페이지를 재사용)
+
+    Returns:
+        작업 ID (이미 전체 OCR 된 문서면 job 없이 상태만 반환)
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    try:
+        resolve_engine(engine)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+    try:
+        ocr_scope.ensure_ocr_state_columns(cur)
+        conn.commit()
+        cur.execute("SELECT ocr_state, ocr_pages_done, page_count FROM pdf_documents WHERE filename = %s",
+                    (filepath,))
+        row = cur.fetchone()
+    finally:
+        cur.close()
+        db_pool.release_conn(conn)
+
+    if not row:
+        return {"success": False, "error": f"파일 {filepath} 이(가) DB에 없습니다."}
+
+    ocr_state, pages_done, page_count = row
+    if ocr_state != ocr_scope.OCR_STATE_PARTIAL:
+        return {"success": True, "ocr_state": ocr_state, "pages_done": pages_done, "job_id": None}
+
+    job = submit_remainder_job(filepath, dpi_mode=dpi_mode, engine=engine)
+    return {"success": True, "ocr_state": ocr_state, "pages_done": pages_done, "page_count": page_count,
+            "job_id": job.job_id, "job": job.to_dict(include_result=False)}
+
+
+@router.get("/ocr/jobs")
+async def list_ocr_jobs():
+    """
+    OCR 작업 목록 조회 (결과 본문 제외)
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    return {
+        "success": True,
+        "jobs": [job.to_dict(include_result=False) for job in get_ocr_job_manager().list()]
+    }
+
+
+@router.get("/ocr/jobs/{job_id}")
+async def get_ocr_job(job_id: str):
+    """
+    OCR 작업 상태 조회: 페이지 단위 진행률, 남은 예상 시간, 완료 시 결과
+
+    Args:
+        job_id: 작업 ID
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    job = get_ocr_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+
+    return {"success": True, "job": job.to_dict()}
+
+
+def run_ocr_batch(doc_ids: list, paths: list, batch_size: int = None, dpi_mode: str = None, engine: str = None):
+    """
+    여러 PDF를 한 번에 OCR 처리 후 문서별로 결과 저장 (동기 함수 - 스레드에서 실행)
+
+    캐시에 있는 문서는 결과를 재사용하고, 나머지는 워커 하나에서 문서 경계를 넘어
+    batch_size 페이지씩 묶어 추론
+
+    Args:
+        doc_ids: 처리할 문서 ID 목록
+        paths: 처리할 PDF 경로 목록 (DB 저장 경로)
+        batch_size: 한 번의 추론에 넣을 페이지 수
+        dpi_mode: DPI 처리 방식 ("fixed" 또는 "adaptive")
+        engine: OCR 엔진 이름 (기본값은 서버 설정)
+
+    Returns:
+        문서별 결과와 전체 처리량 (pages/sec)
+    """
+    try:
+        engine = resolve_engine(engine)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+
+    try:
+        # 1. 처리할 문서 조회 (doc_id / 경로 모두 허용, 중복 제거)
+        documents = {}
+        for doc_id in doc_ids:
+            cur.execute("SELECT doc_id, filename FROM pdf_documents WHERE doc_id = %s", (doc_id,))
+            row = cur.fetchone()
+            if row:
+                documents[row[0]] = row[1]
+        for path in paths:
+            cur.execute("SELECT doc_id, filename FROM pdf_documents WHERE filename = %s", (path,))
+            row = cur.fetchone()
+            if row:
+                documents[row[0]] = row[1]
+
+        results = []
+        found = set(documents.values())
+        for path in paths:
+            if path not in found:
+                results.append({"file_path": path, "success": False, "error": "DB에 없는 파일입니다"})
+        found_ids = set(documents.keys())
+        for doc_id in doc_ids:
+            if doc_id not in found_ids:
+                results.append({"doc_id": doc_id, "success": False, "error": "DB에 없는 문서입니다"})
+
+        start_time = time.time()
+        config_key = ocr_cache.ocr_config_key(dpi_mode=dpi_mode, engine=engine)
+        ocr_cache.ensure_cache_columns(cur)
+
+        # 2. 캐시 재사용 / OCR 대상 분리
+        pending = []
+        for doc_id, filepath in documents.items():
+            normalized_path = normalize_pdf_path(filepath)
+            if not os.path.exists(normalized_path):
+                results.append({"doc_id": doc_id, "file_path": filepath, "success": False,
+                                "error": f"파일을 찾을 수 없습니다: {filepath}"})
+                continue
+
+            content_hash = ocr_cache.compute_content_hash(normalized_path)
+            cached = ocr_cache.find_cached_result(cur, content_hash, config_key) if ocr_cache.OCR_CACHE_ENABLED else None
+            if cached:
+                source_ocr_id, cached_page_count, saved_time = cached
+                ocr_checkpoint.ensure_pages_table(cur)
+                ocr_id = ocr_cache.copy_cached_result(cur, source_ocr_id, doc_id, 0.0)
+                ocr_checkpoint.copy_pages(cur, source_ocr_id, doc_id, ocr_id)
+                mark_ocr_completed(cur, filepath, ocr_scope.OCR_STATE_FULL, cached_page_count)
+                conn.commit()
+                ocr_cache.cache_stats.record_hit(saved_time)
+                results.append({"doc_id": doc_id, "file_path": filepath, "success": True, "ocr_id": ocr_id,
+                                "page_count": cached_page_count, "cached": True})
+                continue
+
+            ocr_cache.cache_stats.record_miss()
+            pending.append((doc_id, filepath, normalized_path, content_hash))
+
+        # 이전 실행에서 완료된 페이지는 건너뛰고, 새로 끝나는 페이지는 문서별로 체크포인트 저장
+        ocr_checkpoint.ensure_pages_table(cur)
+        completed_pages = [
+            ocr_checkpoint.load_completed_pages(cur, doc_id, content_hash, config_key)
+            if ocr_checkpoint.OCR_RESUME_ENABLED else {}
+            for doc_id, _, _, content_hash in pending
+        ]
+        # 수정본 재업로드: 이전 버전에서 내용이 바뀌지 않은 페이지는 텍스트 재사용
+        page_hashes = [ocr_incremental.page_content_hashes(item[2]) for item in pending]
+        reused_pages = [
+            ocr_incremental.load_unchanged_pages(cur, filepath, content_hash, config_key, hashes, skip_pages=done)
+            if ocr_incremental.OCR_INCREMENTAL_ENABLED and hashes else {}
+            for (_, filepath, _, content_hash), hashes, done in zip(pending, page_hashes, completed_pages)
+        ]
+        conn.commit()
+        # 모든 문서의 체크포인트가 이 요청의 커넥션 하나를 같이 씀 (문서마다 풀 커넥션을 잡으면 풀이 고갈됨)
+        checkpoints = [
+            ocr_checkpoint.PageCheckpointWriter(doc_id, content_hash, config_key, hashes, conn=conn)
+            for (doc_id, _, _, content_hash), hashes in zip(pending, page_hashes)
+        ]
+        for checkpoint, done, reused in zip(checkpoints, completed_pages, reused_pages):
+            if reused:
+                checkpoint.write_many(reused.values())
+                done.update(reused)
+        if any(reused_pages):
+            print(f"🧩 이전 버전에서 바뀌지 않은 페이지 재사용: {sum(map(len, reused_pages))}개")
+
+        def _on_page(doc_index, entry, done, total):
+            checkpoints[doc_index].write(entry)
+
+        # 3. 페이지 배치 OCR
+        total_pages = sum(r.get("page_count", 0) for r in results if r.get("success"))
+        ocr_pages = 0
+        if pending:
+            print(f"🚀 배치 OCR 시작: {len(pending)}개 문서 (batch_size={batch_size or 'default'})")
+            options = {"dpi_mode": dpi_mode, "engine": engine}
+            if batch_size:
+                options["batch_size"] = batch_size
+            try:
+                outputs = get_ocr_pool().extract_batch(
+                    [item[2] for item in pending], on_page=_on_page, completed_pages=completed_pages, **options
+                )
+            finally:
+                for checkpoint in checkpoints:
+                    checkpoint.close()
+            ocr_time = time.time() - start_time
+            output_pages = max(1, sum(len(page_data) for _, page_data in outputs))
+
+            for (doc_id, filepath, _, content_hash), (full_text, page_data), reused, hashes in zip(
+                    pending, outputs, reused_pages, page_hashes):
+                if not page_data:
+                    results.append({"doc_id": doc_id, "file_path": filepath, "success": False,
+                                    "error": full_text or "추출된 페이지가 없습니다"})
+                    continue
+
+                # 문서별 처리 시간은 배치 전체 시간을 페이지 수로 나눈 값으로 기록
+                ocr_id = save_ocr_result(cur, doc_id, filepath, full_text, page_data,
+                                         ocr_time * len(page_data) / output_pages, content_hash, config_key,
+                                         page_hashes=hashes)
+                conn.commit()
+
+                log_processing(
+                    conn=conn,
+                    doc_id=doc_id,
+                    filename=filepath,
+                    process_type='OCR',
+                    status='SUCCESS',
+                    message=f"배치 OCR 처리 완료: {filepath.split('/')[-1]} ({len(page_data)}페이지)"
+                )
+
+                ocr_pages += len(page_data)
+                results.append({"doc_id": doc_id, "file_path": filepath, "success": True, "ocr_id": ocr_id,
+                                "page_count": len(page_data), "reused_pages": len(reused), "cached": False})
+
+        total_pages += ocr_pages
+        processing_time = time.time() - start_time
+        pages_per_sec = total_pages / processing_time if processing_time > 0 else 0.0
+        print(f"✅ 배치 OCR 완료 - {total_pages}페이지, {processing_time:.2f}초 ({pages_per_sec:.2f} pages/sec)")
+
+        return {
+            "success": True,
+            "results": results,
+            "total_documents": len(results),
+            "succeeded": len([r for r in results if r.get("success")]),
+            "total_pages": total_pages,
+            "ocr_pages": ocr_pages,
+            "processing_time": processing_time,
+            "pages_per_sec": round(pages_per_sec, 3)
+        }
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ 배치 OCR 처리 중 예외 발생: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return {"success": False, "error": str(e)}
+    finally:
+        cur.close()
+        db_pool.release_conn(conn)
+
+
+@router.post("/ocr/batch")
+async def process_ocr_batch(request: Request):
+    """
+    여러 PDF 배치 OCR: 문서 경계를 넘어 페이지를 묶어 추론하고 문서별로 결과 저장
+
+    Request Body:
+        {
+            "doc_ids": [1, 2, ...],       # 선택
+            "paths": ["path1", ...],      # 선택
+            "batch_size": 4,              # 선택 - 한 번의 추론에 넣을 페이지 수
+            "dpi_mode": "adaptive",       # 선택 - "fixed" 또는 "adaptive"
+            "engine": "Tesseract"         # 선택 - OCR 엔진 (기본값은 서버 설정)
+        }
+
+    Returns:
+        문서별 결과, 전체 페이지 수, pages/sec
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    data = await request.json()
+    doc_ids = data.get('doc_ids', []) or []
+    paths = data.get('paths', []) or []
+    batch_size = data.get('batch_size')
+    dpi_mode = data.get('dpi_mode')
+    engine = data.get('engine')
+
+    if not doc_ids and not paths:
+        return {"success": False, "error": "doc_ids 또는 paths가 필요합니다"}
+
+    return await run_in_threadpool(run_ocr_batch, doc_ids, paths, batch_size, dpi_mode, engine)
+
+
+@router.get("/ocr/pool/status")
+async def get_ocr_pool_status():
+    """
+    OCR 워커 풀 상태 조회 (warm 워커 수, 처리 중인 작업, 유휴 시간)
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    return {"success": True, "pool": get_ocr_pool().status()}
+
+
+@router.get("/ocr/engines")
+async def get_ocr_engines():
+    """
+    사용 가능한 OCR 엔진 목록과 서버 기본 엔진 (요청의 engine 값으로 선택)
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    return {"success": True, "default": resolve_engine(), "configured": OCR_ENGINE, "available": available_engines()}
+
+
+@router.get("/ocr/cache/stats")
+async def get_ocr_cache_stats():
+    """
+    OCR 결과 캐시 통계 조회 (적중/미적중, 절약 시간, 재사용된 결과 수, 페이지 단위 캐시 적중률)
+    """
+    if not OCR_AVAILABLE:
+        return {"success": False, "error": "OCR service not available"}
+
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+    try:
+        ocr_cache.ensure_cache_columns(cur)
+        cur.execute("""
+            SELECT
+                COUNT(*) FILTER (WHERE cached_from IS NOT NULL),
+                COUNT(DISTINCT content_hash) FILTER (WHERE cached_from IS NULL AND content_hash IS NOT NULL)
+            FROM ocr_results
+        """)
+        reused_results, cached_documents = cur.fetchone()
+
+        # 페이지 단위 캐시 - 적중 수는 워커 풀에서 합산
+        page_cache = dict(get_ocr_pool().status()["page_cache"], enabled=ocr_page_cache.OCR_PAGE_CACHE_ENABLED)
+        page_cache.update(ocr_page_cache.page_cache_table_stats(cur))
+        conn.commit()
+
+        return {
+            "success": True,
+            "cache": ocr_cache.cache_stats.snapshot(),
+            "reused_results": reused_results,
+            "cached_documents": cached_documents,
+            "page_cache": page_cache
+        }
+    except Exception as e:
+        conn.rollback()
+        return {"success": False, "error": str(e)}
+    finally:
+        cur.close()
+        db_pool.release_conn(conn)
+
+
+@router.get("/ocr/documents/{doc_id}/pages")
+async def get_ocr_pages(doc_id: int, first_page: int = 1, last_page: Optional[int] = None,
+                        ocr_id: Optional[int] = None):
+    """
+    OCR 결과의 페이지 구간 조회 (필요한 페이지만 DB에서 읽음)
+
+    Args:
+        doc_id: 문서 ID
+        first_page: 시작 페이지 (1부터)
+        last_page: 마지막 페이지 (없으면 끝까지)
+        ocr_id: 조회할 OCR 결과 (없으면 문서의 가장 최근 결과)
+
+    Returns:
+        페이지별 텍스트와 추출 정보
+    """
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+
+    try:
+        ocr_id = latest_ocr_id(cur, doc_id, ocr_id)
+        if ocr_id is None:
+            # 지정한 ocr_id 가 다른 문서의 결과인 경우도 포함
+            return JSONResponse(status_code=404, content={
+                "success": False, "error": f"OCR 결과를 찾을 수 없습니다: doc_id={doc_id}"
+            })
+
+        return {
+            "success": True,
+            "doc_id": doc_id,
+            "ocr_id": ocr_id,
+            "page_count": ocr_page_count(cur, ocr_id),
+            "pages": fetch_ocr_pages(cur, ocr_id, first_page, last_page)
+        }
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    finally:
+        cur.close()
+        db_pool.release_conn(conn)
+
+
+@router.get("/ocr/documents/{doc_id}/text")
+async def get_ocr_text(doc_id: int, max_chars: Optional[int] = None, first_page: int = 1,
+                       last_page: Optional[int] = None, ocr_id: Optional[int] = None):
+    """
+    OCR 텍스트 조회 - 앞부분(max_chars) 또는 페이지 구간만 ("[Page n]" 구분자 포함)
+
+    Args:
+        doc_id: 문서 ID
+        max_chars: 최대 글자 수 (없으면 전체)
+        first_page: 시작 페이지 (1부터)
+        last_page: 마지막 페이지 (없으면 끝까지)
+        ocr_id: 조회할 OCR 결과 (없으면 문서의 가장 최근 결과)
+
+    Returns:
+        텍스트
+    """
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+
+    try:
+        ocr_id = latest_ocr_id(cur, doc_id, ocr_id)
+        if ocr_id is None:
+            # 지정한 ocr_id 가 다른 문서의 결과인 경우도 포함
+            return JSONResponse(status_code=404, content={
+                "success": False, "error": f"OCR 결과를 찾을 수 없습니다: doc_id={doc_id}"
+            })
+
+        text = fetch_ocr_text(cur, ocr_id, max_chars, first_page, last_page) or ""
+        return {
+            "success": True,
+            "doc_id": doc_id,
+            "ocr_id": ocr_id,
+            "text": text,
+            "length": len(text)
+        }
 
     except Exception as e:
-        conn.rollback()
-        print(f"❌ OCR 처리 중 예외 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
         return {"success": False, "error": str(e)}
     finally:
         cur.close()
@@ -934,35 +1619,57 @@ async def classify_document(
             doc_id = row[0]
             print(f"✅ doc_id 발견: {doc_id}")
 
-        # OCR 결과 조회
+        # OCR 결과 조회 (모델 입력 길이를 넘는 뒷부분은 읽지 않음)
         print(f"🔍 OCR 결과 조회 중... doc_id={doc_id}")
-        cur.execute("""
-            SELECT ocr_id, full_text
-            FROM ocr_results
-            WHERE doc_id = %s
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (doc_id,))
-
-        row = cur.fetchone()
-        if not row:
+        ocr_id = latest_ocr_id(cur, doc_id)
+        if ocr_id is None:
             print(f"❌ OCR 결과를 찾을 수 없습니다: doc_id={doc_id}")
             return {"success": False, "error": f"OCR 결과를 찾을 수 없습니다: doc_id={doc_id}"}
 
-        ocr_id, full_text = row
-        print(f"✅ OCR 결과 발견 - ocr_id={ocr_id}, 텍스트 길이: {len(full_text)} 자")
+        # 같은 인코더로 이미 계산한 문서 임베딩이 있으면 텍스트/인코더 없이 분류 헤드만 적용
+        classifier = get_resident_classifier()
+        encoder_key = None
+        if embedding_store.EMBEDDING_STORE_ENABLED:
+            encoder_key = await run_in_threadpool(lambda: classifier.encoder_key)
+        stored_embedding = embedding_store.load_embeddings(cur, [ocr_id], encoder_key).get(ocr_id)
+
+        full_text = None
+        if stored_embedding is None:
+            full_text = fetch_ocr_text(cur, ocr_id, max_chars=CLASSIFY_TEXT_CHARS) or ""
+            print(f"✅ OCR 결과 발견 - ocr_id={ocr_id}, 텍스트 길이: {len(full_text)} 자")
 
-        if not full_text or full_text.strip() == "":
-            print(f"❌ OCR 텍스트가 비어있습니다")
-            return {"success": False, "error": "OCR 텍스트가 비어있습니다"}
+            if not full_text or full_text.strip() == "":
+                print(f"❌ OCR 텍스트가 비어있습니다")
+                return {"success": False, "error": "OCR 텍스트가 비어있습니다"}
 
         # 분류 실행
-        print(f"🚀 BERT 분류 모델 실행 중...")
         start_time = time.time()
 
-        # Context manager로 BERT 분류 서비스 사용 - 자동으로 메모리 해제
-        with get_classification_service() as classifier:
-            classification_result = classifier.predict(full_text, return_probs=True)
+        # 추론을 기다리는 동안에는 DB 커넥션을 풀에 반환 (동시 요청이 배치로 묶여 대기해도 풀이 고갈되지 않도록)
+        conn.commit()
+        cur.close()
+        db_pool.release_conn(conn)
+        conn = cur = None
+
+        if stored_embedding is not None:
+            print(f"⚡ 저장된 문서 임베딩 사용 - ocr_id={ocr_id}, encoder={encoder_key}")
+            classification_result = (await run_in_threadpool(
+                classifier.classify_embeddings, stored_embedding[None, :], True
+            ))[0]
+        else:
+            # 상주 모델 앞의 마이크로 배처 사용 - 짧은 시간 안에 들어온 요청을 패딩된 배치 한 번으로 추론
+            print(f"🚀 BERT 분류 모델 실행 중...")
+            classification_result = await get_classification_batcher().submit(
+                full_text, return_probs=True, return_embeddings=encoder_key is not None
+            )
+
+        conn = db_pool.get_conn()
+        cur = conn.cursor()
+
+        # 새로 계산한 임베딩 저장 (다음 분류 / 재채점은 인코더 없이 처리)
+        embedding = classification_result.pop("embedding", None)
+        if embedding is not None:
+            embedding_store.save_embeddings(cur, encoder_key, {ocr_id: embedding})
 
         processing_time = time.time() - start_time
         print(f"✅ 분류 완료 - 처리 시간: {processing_time:.2f}초")
@@ -1052,11 +1759,158 @@ async def classify_document(
         }
 
     except Exception as e:
-        conn.rollback()
+        if conn is not None:
+            conn.rollback()
         print(f"❌ 문서 분류 중 예외 발생: {str(e)}")
         import traceback
         traceback.print_exc()
         return {"success": False, "error": str(e)}
+    finally:
+        if cur is not None:
+            cur.close()
+        if conn is not None:
+            db_pool.release_conn(conn)
+
+
+@router.get("/classify/status")
+async def get_classifier_status():
+    """
+    상주 분류 모델 상태 조회 (로드 여부, 로드 횟수/시간, 유휴 시간, 처리량, 마이크로 배치 크기 통계)
+    """
+    if not CLASSIFICATION_AVAILABLE:
+        return {"success": False, "error": "Classification service not available"}
+
+    return {
+        "success": True,
+        "classifier": get_resident_classifier().status(),
+        "batcher": get_classification_batcher().status()
+    }
+
+
+@router.post("/classify/rescore")
+async def rescore_documents(request: Request):
+    """
+    저장된 문서 임베딩으로 재분류 (인코더 실행 없이 분류 헤드만 적용)
+
+    Request Body:
+        {
+            "doc_ids": [1, 2, ...],  # 생략하면 현재 인코더로 임베딩이 저장된 모든 문서
+            "save": false            # true 면 pdf_documents 의 분류 결과를 갱신
+        }
+
+    Note:
+        각 문서의 최신 OCR 결과 기준이며, 임베딩이 없는 문서는 missing_doc_ids 로 반환
+        (/classify/document 로 한 번 분류하면 임베딩이 저장됨)
+    """
+    if not CLASSIFICATION_AVAILABLE:
+        return {"success": False, "error": "Classification service not available"}
+
+    data = await request.json()
+    doc_ids = data.get("doc_ids") or []
+    save = bool(data.get("save", False))
+
+    classifier = get_resident_classifier()
+    encoder_key = await run_in_threadpool(lambda: classifier.encoder_key)
+    if not encoder_key:
+        return {"success": False, "error": "현재 분류 백엔드는 문서 임베딩을 지원하지 않습니다"}
+
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+
+    try:
+        start_time = time.time()
+
+        # 문서별 최신 OCR 결과
+        cur.execute("""
+            SELECT DISTINCT ON (r.doc_id) r.doc_id, r.ocr_id
+            FROM ocr_results r
+            WHERE %s OR r.doc_id = ANY(%s)
+            ORDER BY r.doc_id, r.created_at DESC
+        """, (not doc_ids, [int(doc_id) for doc_id in doc_ids]))
+        latest = cur.fetchall()
+
+        embeddings = embedding_store.load_embeddings(cur, [ocr_id for _, ocr_id in latest], encoder_key)
+        targets = [(doc_id, ocr_id) for doc_id, ocr_id in latest if ocr_id in embeddings]
+        if doc_ids:
+            found = {doc_id for doc_id, _ in targets}
+            missing_doc_ids = [doc_id for doc_id in doc_ids if int(doc_id) not in found]
+        else:
+            missing_doc_ids = []
+
+        results = []
+        if targets:
+            matrix = np.stack([embeddings[ocr_id] for _, ocr_id in targets])
+            predictions = await run_in_threadpool(classifier.classify_embeddings, matrix, False)
+            results = [
+                {"doc_id": doc_id, "ocr_id": ocr_id, "기관": prediction.get("기관"),
+                 "문서유형": prediction.get("문서유형"), "confidence": prediction.get("confidence", {})}
+                for (doc_id, ocr_id), prediction in zip(targets, predictions)
+            ]
+
+        if save and results:
+            cur.executemany("""
+                UPDATE pdf_documents
+                SET agency = %s,
+                    document_type = %s,
+                    confidence_agency = %s,
+                    confidence_document_type = %s,
+                    is_classified = TRUE,
+                    classified_date = NOW(),
+                    updated_at = NOW()
+                WHERE doc_id = %s
+            """, [
+                (result["기관"], result["문서유형"], result["confidence"].get("기관", 0.0),
+                 result["confidence"].get("문서유형", 0.0), result["doc_id"])
+                for result in results
+            ])
+        conn.commit()
+
+        processing_time = time.time() - start_time
+        print(f"⚡ 임베딩 재분류: {len(results)}건, {processing_time:.2f}초 (encoder={encoder_key}, 저장={save})")
+
+        return {
+            "success": True,
+            "encoder_key": encoder_key,
+            "rescored": len(results),
+            "saved": save,
+            "missing_doc_ids": missing_doc_ids,
+            "results": results,
+            "processing_time": processing_time
+        }
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ 임베딩 재분류 중 오류 발생: {str(e)}")
+        return {"success": False, "error": str(e)}
+    finally:
+        cur.close()
+        db_pool.release_conn(conn)
+
+
+@router.get("/classify/embeddings")
+async def get_embedding_store_status():
+    """
+    문서 임베딩 저장 현황 (인코더 키별 문서 수, 현재 분류 모델의 인코더 키)
+    """
+    if not CLASSIFICATION_AVAILABLE:
+        return {"success": False, "error": "Classification service not available"}
+
+    encoder_key = await run_in_threadpool(lambda: get_resident_classifier().encoder_key)
+
+    conn = db_pool.get_conn()
+    cur = conn.cursor()
+    try:
+        stats = embedding_store.embedding_stats(cur)
+        conn.commit()
+        return {
+            "success": True,
+            "enabled": embedding_store.EMBEDDING_STORE_ENABLED,
+            "current_encoder_key": encoder_key,
+            "encoders": stats
+        }
+    except Exception as e:
+        conn.rollback()
+        return {"success": False, "error": str(e)}
     finally:
         cur.close()
         db_pool.release_conn(conn)
@@ -1147,10 +2001,17 @@ async def get_all_classification_results(limit: int = 100, offset: int = 0):
                 k.main_topic,
                 k.raw_response,
                 k.created_at as classified_at,
-                o.full_text
+                o.ocr_id
             FROM pdf_documents p
             INNER JOIN document_keywords k ON p.doc_id = k.doc_id
-            LEFT JOIN ocr_results o ON p.doc_id = o.doc_id
+            -- 문서당 가장 최근 OCR 결과 하나만 (분류용 부분 OCR 후 나머지 OCR 결과가 추가되면 행이 두 개)
+            LEFT JOIN LATERAL (
+                SELECT r.ocr_id
+                FROM ocr_results r
+                WHERE r.doc_id = p.doc_id
+                ORDER BY r.created_at DESC, r.ocr_id DESC
+                LIMIT 1
+            ) o ON TRUE
             ORDER BY k.created_at DESC
             LIMIT %s OFFSET %s
         """, (limit, offset))
@@ -1158,8 +2019,11 @@ async def get_all_classification_results(limit: int = 100, offset: int = 0):
         rows = cur.fetchall()
         results = []
 
+        # 미리보기 텍스트는 문서마다 앞 200자만 조회
+        previews = fetch_ocr_texts(cur, [row[-1] for row in rows if row[-1] is not None], max_chars=200)
+
         for row in rows:
-            doc_id, filename, file_size, page_count, upload_date, keyword_id, keywords, main_topic, raw_response, classified_at, full_text = row
+            doc_id, filename, file_size, page_count, upload_date, keyword_id, keywords, main_topic, raw_response, classified_at, ocr_id = row
 
             # JSON 파싱
             try:
@@ -1192,7 +2056,7 @@ async def get_all_classification_results(limit: int = 100, offset: int = 0):
                 "probabilities": probabilities,
                 "main_topic": main_topic,
                 "classified_at": classified_at.isoformat() if classified_at else None,
-                "text_preview": full_text[:200] if full_text else ""
+                "text_preview": previews.get(ocr_id, "")
             })
 
         # 전체 개수 조회
@@ -1659,21 +2523,14 @@ async def auto_generate_categories(request: Request):
 
             doc_id = row[0]
 
-            # OCR 텍스트 조회
-            cur.execute("""
-                SELECT full_text
-                FROM ocr_results
-                WHERE doc_id = %s
-                ORDER BY created_at DESC
-                LIMIT 1
-            """, (doc_id,))
-
-            ocr_row = cur.fetchone()
-            if ocr_row and ocr_row[0]:
+            # OCR 텍스트 조회 - 처음 1000자만 사용 (속도 향상)
+            ocr_id = latest_ocr_id(cur, doc_id)
+            text = fetch_ocr_text(cur, ocr_id, max_chars=1000) if ocr_id else None
+            if text:
                 documents.append({
                     "doc_id": doc_id,
                     "file_path": file_path,
-                    "text": ocr_row[0][:1000]  # 처음 1000자만 사용 (속도 향상)
+                    "text": text
                 })
                 print(f"✅ OCR 텍스트 수집 완료 (doc_id={doc_id})")
 
@@ -2081,19 +2938,12 @@ async def train_bert_model(request: Request):
             print(f"📂 카테고리 '{category}': {len(doc_ids)}개 샘플")
 
             for doc_id in doc_ids:
-                # OCR 텍스트 조회
-                cur.execute("""
-                    SELECT full_text
-                    FROM ocr_results
-                    WHERE doc_id = %s
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """, (doc_id,))
-
-                row = cur.fetchone()
-                if row and row[0]:
+                # OCR 텍스트 조회 (토크나이저가 512토큰에서 자르므로 앞부분만)
+                ocr_id = latest_ocr_id(cur, doc_id)
+                text = fetch_ocr_text(cur, ocr_id, max_chars=CLASSIFY_TEXT_CHARS) if ocr_id else None
+                if text:
                     training_data.append({
-                        "text": row[0],
+                        "text": text,
                         "label": category
                     })
 
@@ -2268,6 +3118,148 @@ async def train_bert_model(request: Request):
 # 커스텀 모델로 문서 분류 API
 # ============================================================================
 
+def classify_files_with_custom_model(cur, loaded, model_path: str, files: list, encoder_key: str = None) -> list:
+    """
+    로드된 커스텀 모델로 파일들을 분류하고 결과를 DB에 기록 (토크나이저/추론/DB 작업 - 스레드에서 실행)
+
+    Args:
+        cur: DB 커서
+        loaded: 레지스트리에서 받은 LoadedCustomModel
+        model_path: 모델 경로 (model_name 기록용)
+        files: 분류할 파일 경로 목록
+        encoder_key: 문서 임베딩 저장/재사용 키 (None이면 사용하지 않음)
+
+    Returns:
+        파일별 분류 결과 목록
+    """
+    import torch
+
+    tokenizer, model, device, id_to_label = loaded.tokenizer, loaded.model, loaded.device, loaded.id_to_label
+    split_heads = hasattr(model, "bert") and hasattr(model, "classifier")
+
+    results = []
+
+    # 각 파일 분류
+    for file_path in files:
+        print(f"📄 분류 중: {file_path}")
+
+        # 경로 정규화
+        normalized_path = file_path.replace('\\', '/')
+        if normalized_path.startswith('./'):
+            normalized_path = normalized_path[2:]
+
+        # doc_id 조회
+        cur.execute("""
+            SELECT doc_id
+            FROM pdf_documents
+            WHERE filename = %s OR filename LIKE %s
+            ORDER BY created_at DESC
+            LIMIT 1
+        """, (normalized_path, f"%{normalized_path}"))
+
+        row = cur.fetchone()
+        if not row:
+            print(f"⚠️  파일을 찾을 수 없습니다: {file_path}")
+            results.append({
+                "file_path": file_path,
+                "success": False,
+                "error": "파일을 찾을 수 없습니다"
+            })
+            continue
+
+        doc_id = row[0]
+
+        # 같은 모델로 저장된 문서 임베딩이 있으면 분류 헤드만 적용
+        ocr_id = latest_ocr_id(cur, doc_id)
+        stored_embedding = embedding_store.load_embeddings(cur, [ocr_id], encoder_key).get(ocr_id) \
+            if ocr_id else None
+
+        # OCR 텍스트 조회 (토크나이저가 512토큰에서 자르므로 앞부분만)
+        full_text = None
+        if ocr_id and stored_embedding is None:
+            full_text = fetch_ocr_text(cur, ocr_id, max_chars=CLASSIFY_TEXT_CHARS)
+        if stored_embedding is None and not full_text:
+            print(f"⚠️  OCR 텍스트를 찾을 수 없습니다: {file_path}")
+            results.append({
+                "doc_id": doc_id,
+                "file_path": file_path,
+                "success": False,
+                "error": "OCR 텍스트를 찾을 수 없습니다"
+            })
+            continue
+
+        # 같은 모델을 쓰는 다른 요청과 토크나이저/모델을 공유하므로 추론은 모델별로 직렬화
+        new_embedding = None
+        with loaded.predict_lock, torch.no_grad():
+            if stored_embedding is not None:
+                pooled_output = torch.from_numpy(stored_embedding[None, :]).to(device)
+                logits = model.classifier(pooled_output)
+            else:
+                # 분류 수행
+                inputs = tokenizer(
+                    full_text,
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=512
+                )
+                inputs = {k: v.to(device) for k, v in inputs.items()}
+
+                if split_heads:
+                    pooled_output = model.bert(**inputs).pooler_output
+                    logits = model.classifier(pooled_output)
+                    if encoder_key:
+                        new_embedding = pooled_output[0].float().cpu().numpy()
+                else:
+                    logits = model(**inputs).logits
+
+            probs = torch.softmax(logits, dim=-1)
+            predicted_class = torch.argmax(probs, dim=-1).item()
+            confidence = probs[0][predicted_class].item()
+            all_probs = probs[0].cpu().tolist()
+
+        if new_embedding is not None:
+            embedding_store.save_embeddings(cur, encoder_key, {ocr_id: new_embedding})
+
+        predicted_category = id_to_label[predicted_class]
+
+        print(f"✅ 분류 완료: {predicted_category} (신뢰도: {confidence:.2%})")
+
+        # DB에 분류 결과 저장
+        cur.execute("""
+            INSERT INTO document_keywords (doc_id, keywords, main_topic, keyword_count, raw_response, model_name)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            RETURNING keyword_id
+        """, (
+            doc_id,
+            json.dumps({"category": predicted_category, "confidence": confidence}, ensure_ascii=False),
+            predicted_category,
+            1,
+            json.dumps({"all_probs": all_probs}, ensure_ascii=False),
+            f"custom-bert-{os.path.basename(model_path)}"
+        ))
+
+        keyword_id = cur.fetchone()[0]
+
+        # 문서 상태 업데이트
+        cur.execute("""
+            UPDATE pdf_documents
+            SET status = 'CLASSIFIED', updated_at = NOW()
+            WHERE doc_id = %s
+        """, (doc_id,))
+
+        results.append({
+            "doc_id": doc_id,
+            "file_path": file_path,
+            "category": predicted_category,
+            "confidence": confidence,
+            "keyword_id": keyword_id,
+            "success": True
+        })
+
+    return results
+
+
 @router.post("/category/classify-with-custom-model")
 async def classify_with_custom_model(request: Request):
     """
@@ -2288,6 +3280,7 @@ async def classify_with_custom_model(request: Request):
             ]
         }
     """
+    conn = cur = None
     try:
         data = await request.json()
         model_path = data.get('model_path')
@@ -2305,136 +3298,26 @@ async def classify_with_custom_model(request: Request):
         if not os.path.exists(model_path):
             return {"success": False, "error": f"모델을 찾을 수 없습니다: {model_path}"}
 
-        from transformers import AutoTokenizer, AutoModelForSequenceClassification
-        import torch
-
-        # 모델 및 토크나이저 로드
-        print(f"📦 모델 로딩 중: {model_path}")
-        tokenizer = AutoTokenizer.from_pretrained(model_path)
-        model = AutoModelForSequenceClassification.from_pretrained(model_path)
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        model.to(device)
-        model.eval()
+        from custom_model_registry import get_custom_model_registry
 
-        # 레이블 매핑 로드
-        label_mapping_path = os.path.join(model_path, "label_mappings.json")
-        with open(label_mapping_path, 'r', encoding='utf-8') as f:
-            label_mappings = json.load(f)
+        # 모델 및 토크나이저 (레지스트리에 없거나 모델 파일이 바뀌었을 때만 디스크에서 로드)
+        loaded = await run_in_threadpool(get_custom_model_registry().get, model_path)
+        print(f"✅ 모델 준비 완료 ({len(loaded.id_to_label)}개 카테고리, 사용 {loaded.uses}회)")
 
-        id_to_label = {int(k): v for k, v in label_mappings['id2label'].items()}
-        print(f"✅ 모델 로드 완료 ({len(id_to_label)}개 카테고리)")
+        # BERT 분류 모델은 인코더(pooler 출력)와 분류 헤드로 나눠 실행하고 인코더 출력을 문서 임베딩으로 저장
+        split_heads = hasattr(loaded.model, "bert") and hasattr(loaded.model, "classifier")
+        encoder_key = None
+        if split_heads and embedding_store.EMBEDDING_STORE_ENABLED:
+            encoder_key = await run_in_threadpool(embedding_store.model_dir_fingerprint, model_path)
 
         conn = db_pool.get_conn()
         cur = conn.cursor()
 
-        results = []
-
-        # 각 파일 분류
-        for file_path in files:
-            print(f"📄 분류 중: {file_path}")
-
-            # 경로 정규화
-            normalized_path = file_path.replace('\\', '/')
-            if normalized_path.startswith('./'):
-                normalized_path = normalized_path[2:]
-
-            # doc_id 조회
-            cur.execute("""
-                SELECT doc_id
-                FROM pdf_documents
-                WHERE filename = %s OR filename LIKE %s
-                ORDER BY created_at DESC
-                LIMIT 1
-            """, (normalized_path, f"%{normalized_path}"))
-
-            row = cur.fetchone()
-            if not row:
-                print(f"⚠️  파일을 찾을 수 없습니다: {file_path}")
-                results.append({
-                    "file_path": file_path,
-                    "success": False,
-                    "error": "파일을 찾을 수 없습니다"
-                })
-                continue
-
-            doc_id = row[0]
-
-            # OCR 텍스트 조회
-            cur.execute("""
-                SELECT full_text
-                FROM ocr_results
-                WHERE doc_id = %s
-                ORDER BY created_at DESC
-                LIMIT 1
-            """, (doc_id,))
-
-            ocr_row = cur.fetchone()
-            if not ocr_row or not ocr_row[0]:
-                print(f"⚠️  OCR 텍스트를 찾을 수 없습니다: {file_path}")
-                results.append({
-                    "doc_id": doc_id,
-                    "file_path": file_path,
-                    "success": False,
-                    "error": "OCR 텍스트를 찾을 수 없습니다"
-                })
-                continue
-
-            full_text = ocr_row[0]
-
-            # 분류 수행
-            inputs = tokenizer(
-                full_text,
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=512
-            )
-            inputs = {k: v.to(device) for k, v in inputs.items()}
-
-            with torch.no_grad():
-                outputs = model(**inputs)
-                logits = outputs.logits
-                probs = torch.softmax(logits, dim=-1)
-                predicted_class = torch.argmax(probs, dim=-1).item()
-                confidence = probs[0][predicted_class].item()
-
-            predicted_category = id_to_label[predicted_class]
-
-            print(f"✅ 분류 완료: {predicted_category} (신뢰도: {confidence:.2%})")
-
-            # DB에 분류 결과 저장
-            cur.execute("""
-                INSERT INTO document_keywords (doc_id, keywords, main_topic, keyword_count, raw_response, model_name)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                RETURNING keyword_id
-            """, (
-                doc_id,
-                json.dumps({"category": predicted_category, "confidence": confidence}, ensure_ascii=False),
-                predicted_category,
-                1,
-                json.dumps({"all_probs": probs[0].cpu().tolist()}, ensure_ascii=False),
-                f"custom-bert-{os.path.basename(model_path)}"
-            ))
-
-            keyword_id = cur.fetchone()[0]
-
-            # 문서 상태 업데이트
-            cur.execute("""
-                UPDATE pdf_documents
-                SET status = 'CLASSIFIED', updated_at = NOW()
-                WHERE doc_id = %s
-            """, (doc_id,))
-
-            results.append({
-                "doc_id": doc_id,
-                "file_path": file_path,
-                "category": predicted_category,
-                "confidence": confidence,
-                "keyword_id": keyword_id,
-                "success": True
-            })
-
-        conn.commit()
+        # 파일별 토크나이저/추론/DB 작업은 이벤트 루프를 막지 않도록 스레드에서 실행
+        results = await run_in_threadpool(
+            classify_files_with_custom_model, cur, loaded, model_path, files, encoder_key
+        )
+        await run_in_threadpool(conn.commit)
 
         print(f"\n✅ 전체 분류 완료: {len(results)}개 문서")
         print(f"{'='*60}\n")
@@ -2452,8 +3335,20 @@ async def classify_with_custom_model(request: Request):
         traceback.print_exc()
         return {"success": False, "error": str(e)}
     finally:
-        cur.close()
-        db_pool.release_conn(conn)
+        if cur is not None:
+            cur.close()
+        if conn is not None:
+            db_pool.release_conn(conn)
+
+
+@router.get("/category/custom-models/status")
+async def get_custom_models_status():
+    """
+    커스텀 모델 레지스트리 상태 조회 (적중/미스, 메모리 사용량, 상주 모델 목록)
+    """
+    from custom_model_registry import get_custom_model_registry
+
+    return {"success": True, "registry": get_custom_model_registry().status()}
 
 
 # ============================================================
@@ -0,0 +1,8 @@
+"""
+backend 모듈 단위 테스트 공통 설정
+backend/ 를 import 경로에 추가 (python -m pytest tests 로 실행)
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
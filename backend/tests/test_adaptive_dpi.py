@@ -0,0 +1,29 @@
+"""적응형 DPI 재처리 판단 (is_ocr_output_poor)"""
+from ocr_service import (
+    is_ocr_output_poor, OCR_ADAPTIVE_MIN_CHARS, OCR_ADAPTIVE_MIN_CONFIDENCE
+)
+
+GOOD_TEXT = "국회 법제사법위원회의 체계자구검토보고서입니다. 선박직원법 일부개정법률안에 대한 내용입니다."
+
+
+def test_good_output_is_not_poor():
+    assert not is_ocr_output_poor(GOOD_TEXT)
+    assert not is_ocr_output_poor(GOOD_TEXT, confidence=0.99)
+
+
+def test_short_output_is_poor():
+    assert is_ocr_output_poor("")
+    assert is_ocr_output_poor(None)
+    assert is_ocr_output_poor("가" * (OCR_ADAPTIVE_MIN_CHARS - 1))
+    # 앞뒤 공백은 글자 수에 포함하지 않음
+    assert is_ocr_output_poor("  " + "가" * (OCR_ADAPTIVE_MIN_CHARS - 1) + "\n\n")
+    assert not is_ocr_output_poor("가" * OCR_ADAPTIVE_MIN_CHARS)
+
+
+def test_garbled_output_is_poor():
+    assert is_ocr_output_poor("�" * 40 + "보고서")
+
+
+def test_low_confidence_is_poor():
+    assert is_ocr_output_poor(GOOD_TEXT, confidence=OCR_ADAPTIVE_MIN_CONFIDENCE - 0.01)
+    assert not is_ocr_output_poor(GOOD_TEXT, confidence=OCR_ADAPTIVE_MIN_CONFIDENCE)
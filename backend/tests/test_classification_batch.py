@@ -0,0 +1,80 @@
+"""분류 배치 추론 - 로짓 → 결과 변환과 길이 정렬 후 입력 순서 복원 (ClassificationService)"""
+import pytest
+
+torch = pytest.importorskip("torch")
+
+import classification_service
+from classification_service import ClassificationService, TASKS, BACKEND_TORCH, CLASSIFY_TOP_K
+
+NUM_LABELS = 3
+LABEL_MAPPINGS = {task: {"id2label": {str(i): f"{task}-{i}" for i in range(NUM_LABELS)}} for task in TASKS}
+
+
+@pytest.fixture
+def service(tmp_path):
+    """모델 파일 없이 레이블 매핑만 설정한 분류 서비스"""
+    service = ClassificationService(str(tmp_path), backend=BACKEND_TORCH)
+    service.device = "cpu"
+    service.label_mappings = LABEL_MAPPINGS
+    return service
+
+
+def test_results_follow_logit_rows(service):
+    logits = {task: torch.tensor([[0.1, 0.2, 3.0], [2.0, 0.5, 0.1]]) for task in TASKS}
+    results = service._results_from_logits(logits, return_probs=False)
+
+    assert len(results) == 2
+    for task in TASKS:
+        assert results[0][task] == f"{task}-2"
+        assert results[1][task] == f"{task}-0"
+        expected = torch.softmax(logits[task], dim=-1)
+        assert results[0]["confidence"][task] == pytest.approx(expected[0, 2].item())
+        assert results[1]["confidence"][task] == pytest.approx(expected[1, 0].item())
+    assert "probabilities" not in results[0]
+
+
+def test_probabilities_are_top_k_in_descending_order(service):
+    logits = {task: torch.tensor([[1.0, 3.0, 2.0]]) for task in TASKS}
+    result = service._results_from_logits(logits, return_probs=True)[0]
+
+    for task in TASKS:
+        probs = result["probabilities"][task]
+        assert len(probs) == min(CLASSIFY_TOP_K, NUM_LABELS)
+        assert list(probs) == [f"{task}-1", f"{task}-2", f"{task}-0"]
+        assert list(probs.values()) == sorted(probs.values(), reverse=True)
+        assert sum(probs.values()) == pytest.approx(1.0)
+        assert probs[result[task]] == result["confidence"][task]
+
+
+def test_predict_batch_restores_input_order(service, monkeypatch):
+    """길이순으로 묶어 추론해도 결과는 입력 순서대로"""
+    monkeypatch.setattr(classification_service, "BERT_AVAILABLE", True)
+    monkeypatch.setattr(service, "_ensure_loaded", lambda: None)
+    service.model = object()
+    # 단어 수만큼의 토큰으로 토큰화
+    service.tokenizer = lambda texts, truncation, max_length: {
+        "input_ids": [[1] * len(text.split()) for text in texts]
+    }
+
+    batches = []
+
+    def _forward_batch(features, return_probs, return_embeddings=False):
+        lengths = [len(feature["input_ids"]) for feature in features]
+        batches.append(lengths)
+        return [{"length": length} for length in lengths]
+
+    monkeypatch.setattr(service, "_forward_batch", _forward_batch)
+
+    texts = ["a b c d e", "a", "a b c", "a b c d e f g", "a b"]
+    results = service.predict_batch(texts, batch_size=2)
+
+    assert [result["length"] for result in results] == [len(text.split()) for text in texts]
+    # 비슷한 길이끼리 batch_size 개씩 묶임
+    assert batches == [[1, 2], [3, 5], [7]]
+    assert service.last_batch_stats["batches"] == 3
+
+
+def test_predict_batch_without_model_returns_unavailable(service, monkeypatch):
+    monkeypatch.setattr(service, "_ensure_loaded", lambda: None)
+    results = service.predict_batch(["text", "more text"])
+    assert [result["기관"] for result in results] == ["Unknown", "Unknown"]
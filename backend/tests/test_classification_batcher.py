@@ -0,0 +1,124 @@
+"""분류 요청 마이크로 배치 (ClassificationBatcher)"""
+import asyncio
+import threading
+
+import pytest
+
+from classification_batcher import ClassificationBatcher
+
+
+class FakeClassifier:
+    """받은 배치를 기록하고 텍스트를 그대로 돌려주는 분류기"""
+
+    def __init__(self, error: Exception = None):
+        self.batches = []
+        self.error = error
+        self._lock = threading.Lock()
+
+    def predict_batch(self, texts, return_probs=False, batch_size=None, return_embeddings=False):
+        with self._lock:
+            self.batches.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        results = []
+        for text in texts:
+            result = {"text": text}
+            if return_probs:
+                result["probabilities"] = {"기관": {text: 1.0}}
+            if return_embeddings:
+                result["embedding"] = [0.0]
+            results.append(result)
+        return results
+
+
+def test_requests_within_window_share_one_batch():
+    classifier = FakeClassifier()
+    batcher = ClassificationBatcher(classifier, window_ms=200, max_batch=16)
+
+    async def main():
+        return await asyncio.gather(*(batcher.submit(f"doc{i}") for i in range(5)))
+
+    results = asyncio.run(main())
+    assert [result["text"] for result in results] == [f"doc{i}" for i in range(5)]
+    assert classifier.batches == [[f"doc{i}" for i in range(5)]]
+    assert batcher.status()["batch_size_histogram"] == {5: 1}
+
+
+def test_full_batch_is_flushed_without_waiting_for_window():
+    classifier = FakeClassifier()
+    # window 가 길어도 max_batch 가 차면 바로 추론
+    batcher = ClassificationBatcher(classifier, window_ms=10_000, max_batch=3)
+
+    async def main():
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(f"doc{i}") for i in range(6))), timeout=5
+        )
+
+    results = asyncio.run(main())
+    assert [result["text"] for result in results] == [f"doc{i}" for i in range(6)]
+    assert [len(batch) for batch in classifier.batches] == [3, 3]
+    assert batcher.status()["max_batch_size"] == 3
+
+
+def test_window_expiry_flushes_partial_batch():
+    classifier = FakeClassifier()
+    batcher = ClassificationBatcher(classifier, window_ms=20, max_batch=16)
+
+    async def main():
+        first = await batcher.submit("first")
+        # window 가 지난 뒤의 요청은 다음 배치
+        await asyncio.sleep(0.05)
+        second = await batcher.submit("second")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert (first["text"], second["text"]) == ("first", "second")
+    assert classifier.batches == [["first"], ["second"]]
+    status = batcher.status()
+    assert status["batches"] == 2 and status["requests"] == 2
+
+
+def test_unrequested_fields_are_removed():
+    classifier = FakeClassifier()
+    batcher = ClassificationBatcher(classifier, window_ms=200, max_batch=16)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.submit("plain"),
+            batcher.submit("with_probs", return_probs=True),
+            batcher.submit("with_embedding", return_embeddings=True),
+        )
+
+    plain, with_probs, with_embedding = asyncio.run(main())
+    assert len(classifier.batches) == 1
+    assert plain == {"text": "plain"}
+    assert set(with_probs) == {"text", "probabilities"}
+    assert set(with_embedding) == {"text", "embedding"}
+
+
+def test_batch_failure_is_raised_to_every_request():
+    classifier = FakeClassifier(error=RuntimeError("model failed"))
+    batcher = ClassificationBatcher(classifier, window_ms=200, max_batch=16)
+
+    async def main():
+        return await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert batcher.status()["failed_batches"] == 1
+
+
+def test_batcher_restarts_on_new_event_loop():
+    classifier = FakeClassifier()
+    batcher = ClassificationBatcher(classifier, window_ms=0, max_batch=4)
+
+    assert asyncio.run(batcher.submit("one"))["text"] == "one"
+    assert asyncio.run(batcher.submit("two"))["text"] == "two"
+    assert classifier.batches == [["one"], ["two"]]
+
+
+@pytest.mark.parametrize("window_ms, max_batch", [(-5, 0), (0, -1)])
+def test_settings_are_clamped(window_ms, max_batch):
+    batcher = ClassificationBatcher(FakeClassifier(), window_ms=window_ms, max_batch=max_batch)
+    assert batcher.window == 0.0
+    assert batcher.max_batch == 1
@@ -0,0 +1,172 @@
+"""커스텀 분류 모델 레지스트리 - LRU 언로드와 모델 파일 변경 감지 (CustomModelRegistry)"""
+import os
+import threading
+import time
+
+import pytest
+
+from custom_model_registry import CustomModelRegistry, LoadedCustomModel
+
+MB = 1024 * 1024
+
+
+class FakeTensor:
+    def __init__(self, size_bytes):
+        self.size_bytes = size_bytes
+
+    def numel(self):
+        return self.size_bytes
+
+    def element_size(self):
+        return 1
+
+
+class FakeModel:
+    def __init__(self, size_bytes):
+        self._parameters = [FakeTensor(size_bytes)]
+
+    def parameters(self):
+        return self._parameters
+
+    def buffers(self):
+        return []
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """디스크 대신 크기만 있는 모델을 로드하고 로드 경로를 기록"""
+    calls = []
+
+    def _load(path, mtime):
+        calls.append(path)
+        return LoadedCustomModel(path, mtime, tokenizer=None, model=FakeModel(40 * MB), device="cpu",
+                                 id_to_label={0: "a", 1: "b"})
+
+    monkeypatch.setattr(CustomModelRegistry, "_load", staticmethod(_load))
+    return calls
+
+
+@pytest.fixture
+def model_dirs(tmp_path):
+    dirs = []
+    for name in ("m1", "m2", "m3"):
+        path = tmp_path / name
+        path.mkdir()
+        (path / "label_mappings.json").write_text("{}")
+        dirs.append(os.path.realpath(path))
+    return dirs
+
+
+def _touch(path):
+    """모델 파일을 다시 저장한 것처럼 수정 시각을 앞당김"""
+    later = time.time() + 10
+    os.utime(os.path.join(path, "label_mappings.json"), (later, later))
+
+
+def test_same_model_is_loaded_once(loads, model_dirs):
+    registry = CustomModelRegistry(memory_budget_mb=1024)
+    first = registry.get(model_dirs[0])
+    second = registry.get(model_dirs[0])
+
+    assert first is second
+    assert loads == [model_dirs[0]]
+    status = registry.status()
+    assert (status["hits"], status["misses"], status["loads"]) == (1, 1, 1)
+    assert first.uses == 2
+
+
+def test_least_recently_used_model_is_evicted(loads, model_dirs):
+    # 40MB 모델 두 개까지만 상주
+    registry = CustomModelRegistry(memory_budget_mb=100)
+    m1, m2, m3 = model_dirs
+    registry.get(m1)
+    registry.get(m2)
+    registry.get(m1)  # m1 을 최근 사용으로
+    registry.get(m3)  # 예산 초과 → 가장 오래 쓰지 않은 m2 언로드
+
+    status = registry.status()
+    assert [entry["model_path"] for entry in status["resident"]] == [m3, m1]
+    assert status["evictions"] == 1
+    assert status["used_mb"] == 80
+
+    registry.get(m2)
+    assert loads == [m1, m2, m3, m2]
+
+
+def test_model_larger_than_budget_stays_loaded(loads, model_dirs):
+    registry = CustomModelRegistry(memory_budget_mb=10)
+    loaded = registry.get(model_dirs[0])
+    assert registry.status()["resident"][0]["model_path"] == loaded.model_path
+
+
+def test_unlimited_budget_never_evicts(loads, model_dirs):
+    registry = CustomModelRegistry(memory_budget_mb=0)
+    for path in model_dirs:
+        registry.get(path)
+    status = registry.status()
+    assert status["memory_budget_mb"] is None
+    assert len(status["resident"]) == 3 and status["evictions"] == 0
+
+
+def test_changed_model_files_are_reloaded(loads, model_dirs):
+    registry = CustomModelRegistry(memory_budget_mb=1024)
+    old = registry.get(model_dirs[0])
+    _touch(model_dirs[0])
+    new = registry.get(model_dirs[0])
+
+    assert new is not old
+    assert new.mtime > old.mtime
+    assert loads == [model_dirs[0], model_dirs[0]]
+    status = registry.status()
+    # 이전 버전은 바로 언로드
+    assert len(status["resident"]) == 1 and status["stale_evictions"] == 1
+
+
+def test_concurrent_requests_load_once(monkeypatch, model_dirs):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _slow_load(path, mtime):
+        calls.append(path)
+        started.set()
+        release.wait(5)
+        return LoadedCustomModel(path, mtime, None, FakeModel(MB), "cpu", {0: "a"})
+
+    monkeypatch.setattr(CustomModelRegistry, "_load", staticmethod(_slow_load))
+    registry = CustomModelRegistry(memory_budget_mb=1024)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get(model_dirs[0]))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+
+
+def test_load_failure_is_raised_and_counted(monkeypatch, model_dirs):
+    def _fail(path, mtime):
+        raise OSError("missing weights")
+
+    monkeypatch.setattr(CustomModelRegistry, "_load", staticmethod(_fail))
+    registry = CustomModelRegistry(memory_budget_mb=1024)
+    with pytest.raises(OSError):
+        registry.get(model_dirs[0])
+    status = registry.status()
+    assert status["load_failures"] == 1 and status["resident"] == []
+
+
+def test_load_locks_are_dropped_with_their_models(loads, model_dirs):
+    registry = CustomModelRegistry(memory_budget_mb=50)
+    m1, m2, _ = model_dirs
+    registry.get(m1)
+    registry.get(m2)  # m1 언로드
+    assert set(registry._load_locks) == {m2}
+
+    registry.clear()
+    assert registry._load_locks == {}
+    assert registry.status()["resident"] == []
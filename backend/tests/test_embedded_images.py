@@ -0,0 +1,71 @@
+"""내장 이미지 OCR 입력 - 페이지별 지연 확인과 캐시 키 (iter_ocr_page_images / ocr_config_key)"""
+import ocr_cache
+import ocr_service
+from ocr_service import iter_ocr_page_images
+
+
+def _fake_pdf(monkeypatch, embedded_pages, events):
+    """embedded_pages 는 내장 이미지로, 나머지는 렌더링으로 나오는 5페이지 문서"""
+    monkeypatch.setattr(ocr_service, "OCR_EMBEDDED_IMAGES", True)
+    monkeypatch.setattr(ocr_service, "PdfReader", lambda path: object())
+    monkeypatch.setattr(ocr_service, "get_pdf_page_count", lambda path: 5)
+
+    def _extract(reader, page_num, dpi):
+        events.append(("inspect", page_num))
+        return f"embedded-{page_num}" if page_num in embedded_pages else None
+
+    def _render(pdf_path, dpi=None, pages=None, window=None):
+        for page_num in pages:
+            events.append(("render", page_num))
+            yield page_num, f"rendered-{page_num}"
+
+    monkeypatch.setattr(ocr_service, "extract_page_image", _extract)
+    monkeypatch.setattr(ocr_service, "iter_pdf_pages", _render)
+
+
+def test_pages_are_inspected_lazily(monkeypatch):
+    events = []
+    _fake_pdf(monkeypatch, embedded_pages=set(), events=events)
+    monkeypatch.setattr(ocr_service, "PDF_RENDER_WINDOW", 1)
+
+    first = next(iter_ocr_page_images("doc.pdf", dpi=100))
+    assert first == (1, "rendered-1", False)
+    # 첫 페이지가 나올 때까지 다른 페이지는 확인하지 않음
+    assert events == [("inspect", 1), ("render", 1)]
+
+
+def test_page_order_is_kept_with_mixed_pages(monkeypatch):
+    events = []
+    _fake_pdf(monkeypatch, embedded_pages={2, 5}, events=events)
+    monkeypatch.setattr(ocr_service, "PDF_RENDER_WINDOW", 2)
+
+    pages = list(iter_ocr_page_images("doc.pdf", dpi=100))
+    assert pages == [
+        (1, "rendered-1", False),
+        (2, "embedded-2", True),
+        (3, "rendered-3", False),
+        (4, "rendered-4", False),
+        (5, "embedded-5", True),
+    ]
+    # 렌더링 대상은 window(2) 만큼만 모았다가 렌더링
+    assert events.index(("render", 4)) < events.index(("inspect", 5))
+
+
+def test_embedded_images_are_part_of_the_cache_key(monkeypatch):
+    monkeypatch.setattr(ocr_cache, "OCR_EMBEDDED_IMAGES", True)
+    with_embedded = ocr_cache.ocr_config_key(mode="ocr", dpi_mode="fixed")
+    monkeypatch.setattr(ocr_cache, "OCR_EMBEDDED_IMAGES", False)
+    without_embedded = ocr_cache.ocr_config_key(mode="ocr", dpi_mode="fixed")
+
+    assert with_embedded != without_embedded
+    assert with_embedded.endswith(":embedded")
+
+
+def test_preprocessing_is_part_of_the_cache_key(monkeypatch):
+    monkeypatch.setattr(ocr_cache, "OCR_PREPROCESS", True)
+    monkeypatch.setattr(ocr_cache, "OCR_MAX_PAGE_SIDE", 2400)
+    capped = ocr_cache.ocr_config_key(mode="ocr", dpi_mode="fixed")
+    monkeypatch.setattr(ocr_cache, "OCR_MAX_PAGE_SIDE", 1600)
+    assert ocr_cache.ocr_config_key(mode="ocr", dpi_mode="fixed") != capped
+    monkeypatch.setattr(ocr_cache, "OCR_PREPROCESS", False)
+    assert ":prep=" not in ocr_cache.ocr_config_key(mode="ocr", dpi_mode="fixed")
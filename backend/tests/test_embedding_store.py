@@ -0,0 +1,95 @@
+"""문서 임베딩 저장소 - 인코더 키와 임베딩 재사용 (embedding_store)"""
+import os
+
+import numpy as np
+import pytest
+
+import embedding_store
+from embedding_store import encoder_state_fingerprint, encoder_fingerprint, load_embeddings, save_embeddings
+
+
+class EmbeddingTable:
+    """document_embeddings 테이블 대신 쓰는 커서 - INSERT 한 행을 (ocr_id, 인코더 키) 로 조회"""
+
+    def __init__(self):
+        self.rows = {}
+        self._result = []
+
+    def execute(self, sql, params=None):
+        if sql.lstrip().startswith("INSERT"):
+            ocr_id, encoder_key, dim, data = params
+            self.rows[(ocr_id, encoder_key)] = (dim, data)
+            self._result = []
+        else:
+            encoder_key, ocr_ids = params
+            self._result = [(ocr_id, dim, data) for (ocr_id, key), (dim, data) in self.rows.items()
+                            if key == encoder_key and ocr_id in ocr_ids]
+
+    def fetchall(self):
+        return self._result
+
+
+def _state(encoder_seed=0, head_seed=0):
+    encoder = np.random.default_rng(encoder_seed)
+    head = np.random.default_rng(100 + head_seed)
+    return {
+        "bert.embeddings.word_embeddings.weight": encoder.standard_normal((8, 4), dtype=np.float32),
+        "bert.pooler.dense.weight": encoder.standard_normal((4, 4), dtype=np.float32),
+        "classifiers.기관.weight": head.standard_normal((3, 4), dtype=np.float32),
+        "classifier.bias": head.standard_normal(3, dtype=np.float32),
+    }
+
+
+@pytest.fixture
+def weights_file(tmp_path, monkeypatch):
+    """npz 로 저장한 가중치 파일 (torch 없이 _load_state_dict 를 대신함)"""
+    monkeypatch.setattr(embedding_store, "_table_ready", True)
+    monkeypatch.setattr(embedding_store, "_load_state_dict", lambda path, prefix: {
+        name: array for name, array in np.load(path).items() if name.startswith(prefix)
+    })
+    path = tmp_path / "model.pt"
+    version = [0]
+
+    def _write(state):
+        with open(path, "wb") as f:
+            np.savez(f, **state)
+        # 같은 크기로 다시 저장해도 캐시가 새 파일로 인식하도록 수정 시각 변경
+        version[0] += 1
+        os.utime(path, ns=(version[0] * 10 ** 9, version[0] * 10 ** 9))
+        return str(path)
+    return _write
+
+
+def test_head_is_not_part_of_the_key():
+    base = encoder_state_fingerprint(_state(), "torch")
+    assert base.startswith("torch:")
+    assert encoder_state_fingerprint(_state(head_seed=1), "torch") == base
+    assert encoder_state_fingerprint(_state(encoder_seed=1), "torch") != base
+    assert encoder_state_fingerprint(_state(), "int8") != base
+
+
+def test_state_without_encoder_has_no_key():
+    assert encoder_state_fingerprint({"classifier.weight": np.zeros(3)}, "custom") is None
+
+
+def test_missing_weights_file_has_no_key(tmp_path):
+    assert encoder_fingerprint(str(tmp_path / "missing.pt"), "torch") is None
+
+
+def test_retrained_head_reuses_stored_embeddings(weights_file):
+    table = EmbeddingTable()
+    vector = np.arange(4, dtype=np.float32)
+
+    key = encoder_fingerprint(weights_file(_state()), "torch")
+    save_embeddings(table, key, {7: vector})
+
+    # 헤드만 다시 학습해 저장한 모델 - 같은 인코더 키로 저장된 임베딩 사용
+    retrained_key = encoder_fingerprint(weights_file(_state(head_seed=5)), "torch")
+    assert retrained_key == key
+    stored = load_embeddings(table, [7], retrained_key)
+    np.testing.assert_array_equal(stored[7], vector)
+
+    # 인코더가 바뀌면 이전 임베딩은 쓰지 않음
+    new_encoder_key = encoder_fingerprint(weights_file(_state(encoder_seed=3)), "torch")
+    assert new_encoder_key != key
+    assert load_embeddings(table, [7], new_encoder_key) == {}
@@ -0,0 +1,99 @@
+"""CPU 워커 페이지 분할 (OCRWorkerPool._plan_shards / _extract_sharded)"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import ocr_pool
+import ocr_service
+from ocr_pool import OCRWorkerPool
+
+
+@pytest.fixture
+def page_count(monkeypatch):
+    """get_pdf_page_count 가 지정한 페이지 수를 반환하도록 설정"""
+    def _set(count):
+        monkeypatch.setattr(ocr_service, "get_pdf_page_count", lambda pdf_path: count)
+    return _set
+
+
+def test_shards_are_contiguous_and_balanced(page_count):
+    page_count(10)
+    shards = OCRWorkerPool(num_workers=3, device="cpu")._plan_shards("doc.pdf", {})
+    assert shards == [[1, 2, 3, 4], [5, 6, 7], [8, 9, 10]]
+
+
+def test_completed_pages_are_skipped(page_count):
+    page_count(8)
+    options = {"completed_pages": {1: {}, 2: {}, 5: {}}}
+    shards = OCRWorkerPool(num_workers=2, device="cpu")._plan_shards("doc.pdf", options)
+    assert shards == [[3, 4, 6], [7, 8]]
+    assert sorted(p for shard in shards for p in shard) == [3, 4, 6, 7, 8]
+
+
+def test_no_more_shards_than_remaining_pages(page_count, monkeypatch):
+    monkeypatch.setattr(ocr_pool, "OCR_SHARD_MIN_PAGES", 2)
+    page_count(3)
+    shards = OCRWorkerPool(num_workers=8, device="cpu")._plan_shards("doc.pdf", {})
+    assert shards == [[1], [2], [3]]
+
+
+def test_short_documents_are_not_split(page_count):
+    page_count(ocr_pool.OCR_SHARD_MIN_PAGES - 1)
+    assert OCRWorkerPool(num_workers=4, device="cpu")._plan_shards("doc.pdf", {}) == []
+
+
+def test_not_split_on_gpu_single_worker_or_page_subset(page_count):
+    page_count(20)
+    assert OCRWorkerPool(num_workers=4, device="gpu")._plan_shards("doc.pdf", {}) == []
+    assert OCRWorkerPool(num_workers=1, device="cpu")._plan_shards("doc.pdf", {}) == []
+    assert OCRWorkerPool(num_workers=4, device="cpu")._plan_shards("doc.pdf", {"pages": [1, 2]}) == []
+
+
+def test_page_count_failure_falls_back_to_single_task(monkeypatch):
+    def _fail(pdf_path):
+        raise OSError("broken pdf")
+    monkeypatch.setattr(ocr_service, "get_pdf_page_count", _fail)
+    assert OCRWorkerPool(num_workers=4, device="cpu")._plan_shards("doc.pdf", {}) == []
+
+
+def test_sharded_progress_callbacks_are_serialized(monkeypatch):
+    """구간별 결과 수집 스레드가 동시에 끝나도 on_page 는 한 번에 하나씩, 완료 수는 증가하는 순서로"""
+    pool = OCRWorkerPool(num_workers=3, device="cpu")
+    executor = ThreadPoolExecutor(max_workers=3)
+    barrier = threading.Barrier(3)
+
+    def _submit(pdf_path, on_page=None, pages=None, **options):
+        def _run():
+            barrier.wait()
+            page_data = []
+            for done, page in enumerate(pages, 1):
+                entry = {"page": page, "text": f"p{page}"}
+                page_data.append(entry)
+                on_page(entry, done, len(pages))
+            return "", page_data
+        return executor.submit(_run)
+
+    monkeypatch.setattr(pool, "submit", _submit)
+
+    active, overlaps, progress = [0], [], []
+    state_lock = threading.Lock()
+
+    def on_page(entry, done, total):
+        with state_lock:
+            active[0] += 1
+            if active[0] > 1:
+                overlaps.append(entry["page"])
+        time.sleep(0.002)
+        progress.append(done)
+        with state_lock:
+            active[0] -= 1
+
+    shards = [[1, 2, 3, 4], [5, 6, 7], [8, 9, 10]]
+    full_text, page_data = pool._extract_sharded("doc.pdf", shards, on_page, {})
+    executor.shutdown()
+
+    assert overlaps == []
+    assert progress == list(range(1, 11))
+    assert [entry["page"] for entry in page_data] == list(range(1, 11))
@@ -0,0 +1,104 @@
+"""OCR 텍스트 조회 - 페이지 구간/앞부분 조립과 이전 방식 결과 (ocr_text)"""
+import json
+
+from ocr_text import fetch_ocr_texts, fetch_ocr_text, fetch_ocr_pages, latest_ocr_id
+
+
+class FakeCursor:
+    """execute 마다 미리 지정한 결과 행을 순서대로 돌려주는 커서"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.queries = []
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        self.queries.append((sql, params))
+        self.rows = self.results.pop(0) if self.results else []
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+
+def test_pages_are_joined_with_page_markers():
+    cur = FakeCursor([(1, 1, "first"), (1, 2, "second"), (2, 3, "other")])
+    texts = fetch_ocr_texts(cur, [1, 2])
+    assert texts == {
+        1: "[Page 1]\nfirst\n\n[Page 2]\nsecond\n\n",
+        2: "[Page 3]\nother\n\n",
+    }
+    # 페이지가 있는 결과만 있으면 이전 방식 컬럼은 조회하지 않음
+    assert len(cur.queries) == 1
+
+
+def test_duplicate_ids_are_queried_once():
+    cur = FakeCursor([(5, 1, "text")])
+    fetch_ocr_texts(cur, [5, 5, 5])
+    assert cur.queries[0][1][2] == [5]
+
+
+def test_prefix_is_limited_in_sql_and_result():
+    cur = FakeCursor([(1, 1, "abcdefgh"), (1, 2, "ijkl")])
+    text = fetch_ocr_text(cur, 1, max_chars=12)
+    assert text == "[Page 1]\nabc"
+    _, params = cur.queries[0]
+    # 각 페이지 LEFT(text, limit) 와 누적 글자 수 조건에 같은 limit 사용
+    assert params[0] == 12 and params[-1] == 12
+
+
+def test_page_range_is_passed_to_query():
+    cur = FakeCursor([(1, 2, "two"), (1, 3, "three")])
+    assert fetch_ocr_text(cur, 1, first_page=2, last_page=3) == "[Page 2]\ntwo\n\n[Page 3]\nthree\n\n"
+    _, params = cur.queries[0]
+    assert params[3:5] == (2, 3)
+
+
+def test_missing_result_returns_none():
+    cur = FakeCursor([], [])
+    assert fetch_ocr_text(cur, 9) is None
+
+
+def test_legacy_full_text_prefix():
+    cur = FakeCursor([], [(3, "[Page 1]\nlegacy text\n\n")])
+    assert fetch_ocr_text(cur, 3, max_chars=15) == "[Page 1]\nlegacy"
+    legacy_sql, legacy_params = cur.queries[1]
+    assert "full_text" in legacy_sql
+    assert legacy_params == (15, [3])
+
+
+def test_legacy_page_range_uses_page_data():
+    page_data = [{"page": n, "text": f"p{n}"} for n in range(1, 5)]
+    cur = FakeCursor([], [(json.dumps(page_data),)])
+    assert fetch_ocr_text(cur, 4, first_page=2, last_page=3) == "[Page 2]\np2\n\n[Page 3]\np3\n\n"
+
+
+def test_fetch_pages_merges_meta():
+    cur = FakeCursor([(1, "one", "PyPDF2", None), (2, "two", "PaddleOCRVL", json.dumps({"dpi": 200}))])
+    assert fetch_ocr_pages(cur, 1) == [
+        {"page": 1, "text": "one", "engine": "PyPDF2"},
+        {"page": 2, "text": "two", "engine": "PaddleOCRVL", "dpi": 200},
+    ]
+
+
+def test_fetch_pages_legacy_range():
+    page_data = [{"page": n, "text": f"p{n}"} for n in range(1, 5)]
+    cur = FakeCursor([], [(page_data,)])
+    assert [page["page"] for page in fetch_ocr_pages(cur, 1, 3)] == [3, 4]
+
+
+def test_latest_ocr_id_checks_document_ownership():
+    cur = FakeCursor([(11,)])
+    assert latest_ocr_id(cur, doc_id=1, ocr_id=11) == 11
+    assert cur.queries[0][1] == (11, 1)
+
+    # 다른 문서의 결과
+    assert latest_ocr_id(FakeCursor([]), doc_id=2, ocr_id=11) is None
+
+
+def test_latest_ocr_id_without_ocr_id():
+    cur = FakeCursor([(42,)])
+    assert latest_ocr_id(cur, doc_id=1) == 42
+    assert "ORDER BY created_at DESC" in cur.queries[0][0]
@@ -0,0 +1,98 @@
+"""수정본 증분 OCR 용 페이지 내용 해시 (page_content_hashes)"""
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import DictionaryObject, NameObject
+
+from ocr_incremental import page_content_hashes, _inherited_resources
+
+
+def _make_pdf(path, texts, font="Helvetica"):
+    """페이지마다 텍스트 한 줄이 있는 최소 PDF - 글꼴/페이지 크기는 상위 /Pages 에서 상속"""
+    count = len(texts)
+    font_obj = 3 + 2 * count
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(count))
+    objs = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} /MediaBox [0 0 612 792] "
+        f"/Resources << /Font << /F1 {font_obj} 0 R >> >> >>".encode(),
+    ]
+    for i, text in enumerate(texts):
+        content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objs.append(f"<< /Type /Page /Parent 2 0 R /Contents {4 + 2 * i} 0 R >>".encode())
+        objs.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    objs.append(f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} >>".encode())
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    path.write_bytes(bytes(out))
+    return str(path)
+
+
+def test_identical_pages_hash_equal(tmp_path):
+    a = page_content_hashes(_make_pdf(tmp_path / "a.pdf", ["one", "two", "three"]))
+    b = page_content_hashes(_make_pdf(tmp_path / "b.pdf", ["one", "two", "three"]))
+    assert len(a) == 3
+    assert a == b
+    assert len(set(a)) == 3
+
+
+def test_only_edited_page_changes(tmp_path):
+    before = page_content_hashes(_make_pdf(tmp_path / "v1.pdf", ["one", "two", "three"]))
+    after = page_content_hashes(_make_pdf(tmp_path / "v2.pdf", ["one", "TWO", "three"]))
+    assert [x == y for x, y in zip(before, after)] == [True, False, True]
+
+
+def test_reordered_and_inserted_pages_still_match(tmp_path):
+    before = page_content_hashes(_make_pdf(tmp_path / "v1.pdf", ["one", "two", "three"]))
+    after = page_content_hashes(_make_pdf(tmp_path / "v2.pdf", ["three", "new", "one", "two"]))
+    assert set(before) <= set(after)
+    assert after.index(before[0]) == 2
+
+
+def test_rewritten_file_keeps_page_hashes(tmp_path):
+    """다시 저장해 객체 번호가 바뀌어도 같은 해시"""
+    source = _make_pdf(tmp_path / "a.pdf", ["one", "two"])
+    writer = PdfWriter()
+    for page in PdfReader(source).pages:
+        writer.add_page(page)
+    rewritten = tmp_path / "rewritten.pdf"
+    with open(rewritten, "wb") as f:
+        writer.write(f)
+    assert page_content_hashes(str(rewritten)) == page_content_hashes(source)
+
+
+def test_inherited_resources_change_the_hash(tmp_path):
+    """상위 /Pages 의 글꼴만 바뀐 수정본은 다른 해시"""
+    helvetica = page_content_hashes(_make_pdf(tmp_path / "a.pdf", ["same text"], font="Helvetica"))
+    courier = page_content_hashes(_make_pdf(tmp_path / "b.pdf", ["same text"], font="Courier"))
+    again = page_content_hashes(_make_pdf(tmp_path / "c.pdf", ["same text"], font="Helvetica"))
+    assert helvetica != courier
+    assert helvetica == again
+
+
+def test_inherited_resources_lookup():
+    resources = DictionaryObject({NameObject("/Font"): DictionaryObject()})
+    root = DictionaryObject({NameObject("/Resources"): resources})
+    middle = DictionaryObject({NameObject("/Parent"): root})
+    page = DictionaryObject({NameObject("/Parent"): middle})
+    assert _inherited_resources(page) is resources
+
+    # 페이지에 직접 있으면 상속 리소스를 따로 반영하지 않음
+    page[NameObject("/Resources")] = DictionaryObject()
+    assert _inherited_resources(page) is None
+
+    orphan = DictionaryObject({NameObject("/Parent"): DictionaryObject()})
+    assert _inherited_resources(orphan) is None
+
+
+def test_unreadable_pdf_returns_none(tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    assert page_content_hashes(str(broken)) is None
@@ -0,0 +1,68 @@
+"""OCR 전 페이지 전처리 (is_blank_page / preprocess_page)"""
+import pytest
+from PIL import Image, ImageDraw
+
+import ocr_service
+from ocr_service import is_blank_page, preprocess_page
+
+
+def _page(size=(850, 1100), mode="RGB", text=True, speckles=0):
+    """A4 비율의 흰 페이지 (text=True 면 글자처럼 어두운 줄을 그림)"""
+    image = Image.new(mode, size, "white")
+    draw = ImageDraw.Draw(image)
+    if text:
+        for y in range(100, 900, 40):
+            draw.rectangle((80, y, 700, y + 12), fill="black")
+    for i in range(speckles):
+        draw.point((10 + i * 7, 10), fill="black")
+    return image
+
+
+def test_blank_page_detection():
+    assert is_blank_page(_page(text=False))
+    # 스캐너 잡티 몇 개는 빈 페이지로 봄
+    assert is_blank_page(_page(text=False, speckles=3))
+    assert not is_blank_page(_page())
+
+
+def test_blank_page_detection_on_gray_background():
+    image = Image.new("L", (850, 1100), 200)
+    assert is_blank_page(image)
+    ImageDraw.Draw(image).rectangle((80, 100, 700, 400), fill=20)
+    assert not is_blank_page(image)
+
+
+def test_preprocess_skips_blank_page():
+    image = _page(text=False)
+    processed, saved = preprocess_page(image)
+    assert processed is None
+    assert saved == 850 * 1100
+
+
+def test_preprocess_blank_check_can_be_disabled():
+    processed, _ = preprocess_page(_page(text=False), check_blank=False)
+    assert processed is not None
+
+
+def test_preprocess_converts_to_grayscale(monkeypatch):
+    monkeypatch.setattr(ocr_service, "OCR_GRAYSCALE", True)
+    processed, saved = preprocess_page(_page())
+    assert processed.mode == "L"
+    assert processed.size == (850, 1100)
+    assert saved == 0
+
+
+def test_preprocess_keeps_color_when_grayscale_disabled(monkeypatch):
+    monkeypatch.setattr(ocr_service, "OCR_GRAYSCALE", False)
+    processed, _ = preprocess_page(_page())
+    assert processed.mode == "RGB"
+
+
+@pytest.mark.parametrize("size", [(1700, 2200), (2200, 1700)])
+def test_preprocess_caps_long_side(monkeypatch, size):
+    monkeypatch.setattr(ocr_service, "OCR_MAX_PAGE_SIDE", 1100)
+    processed, saved = preprocess_page(_page(size=size))
+    assert max(processed.size) == 1100
+    # 비율 유지
+    assert abs(processed.width / processed.height - size[0] / size[1]) < 0.01
+    assert saved == size[0] * size[1] - processed.width * processed.height
@@ -0,0 +1,60 @@
+"""단계별 시간 누적 - 렌더링 스레드(prefetch)와 추론 루프가 함께 갱신 (OCRService.stage_times)"""
+import sys
+import threading
+
+from PIL import Image
+
+import ocr_service
+from ocr_service import OCRService
+
+
+class _FakeEngine:
+    name = "fake"
+
+    def recognize(self, images):
+        return [("텍스트 " * 20, 0.99) for _ in images]
+
+    def release_memory(self):
+        pass
+
+
+def test_concurrent_updates_are_not_lost(monkeypatch):
+    interval = sys.getswitchinterval()
+    # 스레드 전환을 자주 일으켜 잠금 없는 += 였다면 갱신이 유실되도록
+    sys.setswitchinterval(1e-6)
+    service = OCRService()
+    try:
+        threads = [
+            threading.Thread(target=lambda: [service._add_stage_times(pages=1, render=1.0) for _ in range(2000)])
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert service.stage_times["pages"] == 16000
+    assert service.stage_times["render"] == 16000.0
+
+
+def test_prefetch_counts_every_page(monkeypatch):
+    monkeypatch.setattr(ocr_service, "OCR_PREFETCH_PAGES", 2)
+    monkeypatch.setattr(ocr_service, "OCR_PAGE_CACHE_ENABLED", False)
+    monkeypatch.setattr(ocr_service, "OCR_PREPROCESS", False)
+    monkeypatch.setattr(ocr_service, "get_pdf_page_count", lambda path: 6)
+
+    def _images(pdf_path, dpi=None, pages=None):
+        for page_num in pages:
+            yield page_num, Image.new("L", (8, 8), 255), page_num % 2 == 0
+
+    monkeypatch.setattr(ocr_service, "iter_ocr_page_images", _images)
+    service = OCRService()
+    monkeypatch.setattr(service, "_ensure_loaded", lambda engine=None: _FakeEngine())
+
+    results = service.extract_batch(["a.pdf", "b.pdf"], mode="ocr", batch_size=4)
+
+    assert [len(page_data) for _, page_data in results] == [6, 6]
+    assert service.stage_times["pages"] == 12
+    assert service.stage_times["embedded"] == 6
@@ -0,0 +1,36 @@
+"""텍스트 레이어 품질 판단 (text_quality / is_text_layer_usable)"""
+from ocr_service import text_quality, is_text_layer_usable, TEXT_LAYER_MIN_CHARS
+
+
+def test_text_quality_empty():
+    assert text_quality("") == 0.0
+    assert text_quality(None) == 0.0
+    assert text_quality("   \n\t ") == 0.0
+
+
+def test_text_quality_clean_korean_and_ascii():
+    assert text_quality("국회 법제사법위원회 체계자구검토보고서 (2024. 3.)") == 1.0
+    assert text_quality("Annual report 2024: revenue +12%") == 1.0
+
+
+def test_text_quality_penalizes_broken_characters():
+    clean = "선박직원법 일부개정법률안 검토보고"
+    broken = "�� 선박��"
+    assert text_quality(broken) < 0.5 < text_quality(clean)
+
+
+def test_text_quality_penalizes_cid_tokens():
+    # "(cid:n)" 은 ASCII 로 보이지만 깨진 글자
+    assert text_quality("(cid:12)(cid:34)(cid:56)") < 0.3
+
+
+def test_is_text_layer_usable_requires_minimum_length():
+    assert not is_text_layer_usable("짧은 글")
+    assert not is_text_layer_usable(" " * 50)
+    assert is_text_layer_usable("가" * TEXT_LAYER_MIN_CHARS)
+
+
+def test_is_text_layer_usable_rejects_broken_layer():
+    assert is_text_layer_usable("국회 법제사법위원회의 체계자구검토보고서입니다.")
+    assert not is_text_layer_usable("�" * 30 + "보고서")
+    assert not is_text_layer_usable("(cid:3)(cid:4)(cid:5)(cid:6)(cid:7)")
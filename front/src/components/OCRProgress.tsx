@@ -125,19 +125,6 @@ export function OCRProgress({
           return newProgress;
         });
 
-        // 진행률 시뮬레이션 (UI용)
-        const progressInterval = setInterval(() => {
-          setFilesProgress(prev => {
-            const newProgress = [...prev];
-            if (newProgress[fileIndex].progress < 90) {
-              newProgress[fileIndex].progress = Math.min(newProgress[fileIndex].progress + 10, 90);
-              const currentFilePages = newProgress[fileIndex].totalPages ?? 10;
-              newProgress[fileIndex].pagesProcessed = Math.floor((newProgress[fileIndex].progress / 100) * currentFilePages);
-            }
-            return newProgress;
-          });
-        }, 200);
-
         try {
           // OCR 처리 요청
           console.log(`\n${'='.repeat(60)}`);
@@ -149,22 +136,66 @@ export function OCRProgress({
           const formData = new FormData();
           formData.append("filepath", file.fpath);
 
-          const ocrResponse = await fetch("http://localhost:8000/api/ocr/process", {
+          // OCR 작업 접수 (작업 ID 즉시 반환)
+          const submitResponse = await fetch("http://localhost:8000/api/ocr/jobs", {
             method: "POST",
             body: formData,
           });
 
-          const ocrData = await ocrResponse.json();
+          const submitData = await submitResponse.json();
 
-          if (!ocrData.success) {
-            console.error("❌ OCR 실패:", ocrData.error || ocrData.message);
-            throw new Error(ocrData.error || ocrData.message || 'OCR 처리 실패');
+          if (!submitData.success) {
+            console.error("❌ OCR 작업 접수 실패:", submitData.error || submitData.message);
+            throw new Error(submitData.error || submitData.message || 'OCR 작업 접수 실패');
+          }
+
+          const jobId = submitData.job_id;
+          console.log(`📥 OCR 작업 접수: ${jobId}`);
+
+          // 작업 상태 폴링 (서버가 보고하는 실제 페이지 진행률 사용)
+          let ocrData: any = null;
+          while (ocrData === null) {
+            await new Promise(resolve => setTimeout(resolve, 1000));
+
+            const statusResponse = await fetch(`http://localhost:8000/api/ocr/jobs/${jobId}`);
+            const statusData = await statusResponse.json();
+
+            if (!statusData.success) {
+              throw new Error(statusData.error || statusData.detail || 'OCR 작업 상태 조회 실패');
+            }
+
+            const job = statusData.job;
+
+            setFilesProgress(prev => {
+              const newProgress = [...prev];
+              newProgress[fileIndex] = {
+                ...newProgress[fileIndex],
+                progress: job.progress,
+                pagesProcessed: job.pages_done,
+                totalPages: job.total_pages ?? newProgress[fileIndex].totalPages,
+              };
+              return newProgress;
+            });
+
+            // 남은 시간 = 현재 파일 ETA + 대기 중인 파일 추정치
+            if (job.eta_seconds !== null && job.eta_seconds !== undefined) {
+              const remainingFiles = initialProgress.length - fileIndex - 1;
+              setEstimatedEndTime(new Date(Date.now() + (job.eta_seconds + remainingFiles * 20) * 1000));
+            }
+
+            if (job.state === 'failed') {
+              console.error("❌ OCR 실패:", job.error);
+              throw new Error(job.error || 'OCR 처리 실패');
+            }
+
+            if (job.state === 'completed') {
+              ocrData = job.result;
+            }
           }
 
           console.log("✅ OCR 처리 완료:", ocrData);
 
           // 진행률 완료
-          clearInterval(progressInterval);
           setFilesProgress(prev => {
             const newProgress = [...prev];
             newProgress[fileIndex].progress = 100;
@@ -188,8 +219,6 @@ export function OCRProgress({
           console.error(`   에러: ${err}`);
           console.error(`${'='.repeat(60)}\n`);
 
-          clearInterval(progressInterval);
-
           // 오류 상태로 변경
           setFilesProgress(prev => {
             const newProgress = [...prev];